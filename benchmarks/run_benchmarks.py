@@ -0,0 +1,216 @@
+'''
+JsonMidiCreator - Json Midi Creator is intended to be used
+in conjugation with the Json Midi Player to Play composed Elements
+Original Copyright (c) 2024 Rui Seixas Monteiro. All right reserved.
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+Lesser General Public License for more details.
+https://github.com/ruiseixasm/JsonMidiCreator
+https://github.com/ruiseixasm/JsonMidiPlayer
+'''
+"""
+Benchmarks of the composition hot paths, runnable headless (no player and no display).
+
+Each workload is timed at growing sizes, keeping the best of the repeats, and the
+complexity exponent `k` of `time ~ size^k` is estimated with a log-log least squares fit.
+With `--memory` the memory footprint per element of the built clips is measured too.
+The results are printed as JSON, so they can be stored and compared over time.
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --quick --output results.json --max-exponent 1.5
+    python benchmarks/run_benchmarks.py get_playlist --memory
+
+With `--max-exponent` the exit code is 1 when any workload grows faster than allowed,
+which catches quadratic regressions in automated runs.
+"""
+import sys
+import os
+os.environ.setdefault("MPLBACKEND", "Agg")  # Headless, no display needed
+src_path = os.path.join(os.path.dirname(__file__), '..')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import argparse
+import gc
+import json
+import math
+import platform
+import shutil
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from jsonmidicreator import *
+
+
+def notes_clip(size: int) -> Clip:
+    notes: list[Note] = [Note(Position(Beats(beat))) for beat in range(size)]
+    clip: Clip = Clip()
+    clip += notes
+    return clip
+
+def line_text(size: int) -> str:
+    pitches: list[str] = ["C4", "E4", "G4", "B4", "D5", "F#4", "A4"]
+    return ", ".join(f"n:1/4:{pitches[index % len(pitches)]}" for index in range(size))
+
+def add_notes(size: int) -> None:
+    clip: Clip = Clip()
+    note: Note = Note()
+    for beat in range(size):
+        note << Position(Beats(beat))
+        clip += note
+
+def save_load(clip: Clip, filename: str) -> None:
+    folder: str = tempfile.mkdtemp()
+    try:
+        file_path: str = os.path.join(folder, filename)
+        clip >> Save(file_path)
+        Load(file_path)
+    finally:
+        shutil.rmtree(folder)
+
+def shuffle_iterations(size: int) -> Iterations:
+    return (Note() * 16 >> Stack()) >> I_ShuffleLocus()
+
+def run_iterations(iterations: Iterations, size: int) -> None:
+    for _ in range(size):
+        iterations.get_clip()
+
+
+# Each workload is (setup, run, sizes, quick sizes), where setup isn't timed
+WORKLOADS: dict[str, tuple[Callable[[int], Any], Callable[[Any, int], None], list[int], list[int]]] = {
+    "dsl_line":         (line_text,         lambda text, size: Clip(Line(text)),            [250, 500, 1000, 2000],     [100, 200, 400]),
+    "clip_iadd":        (lambda size: None, lambda _, size: add_notes(size),                [250, 500, 1000, 2000],     [100, 200, 400]),
+    "clip_repeat":      (lambda size: Note(), lambda note, size: note * size,               [125, 250, 500, 1000],      [50, 100, 200]),
+    "get_playlist":     (notes_clip,        lambda clip, size: clip.getPlaylist(),          [1000, 10000, 100000],      [250, 1000, 4000]),
+    "get_midilist":     (notes_clip,        lambda clip, size: clip.getMidilist(),          [1000, 10000, 100000],      [250, 1000, 4000]),
+    "save_load_json":   (notes_clip,        lambda clip, size: save_load(clip, "clip.json"),    [500, 2000, 8000],      [100, 400, 1600]),
+    "save_load_binary": (notes_clip,        lambda clip, size: save_load(clip, "clip.jmcb"),    [500, 2000, 8000],      [100, 400, 1600]),
+    "iterations":       (shuffle_iterations, run_iterations,                                [50, 100, 200, 400],        [20, 40, 80]),
+}
+
+
+# Each memory workload is (build, sizes, quick sizes), where build returns the elements holder being measured
+MEMORY_WORKLOADS: dict[str, tuple[Callable[[int], Any], list[int], list[int]]] = {
+    "notes_clip":       (notes_clip,                            [10000, 100000],    [1000, 10000]),
+    "repeated_note":    (lambda size: Note() / size,            [10000, 100000],    [1000, 10000]),
+    "dsl_line_clip":    (lambda size: Clip(Line(line_text(size))),  [10000, 100000],    [1000, 10000]),
+}
+
+
+def complexity_exponent(sizes: list[int], seconds: list[float]) -> float | None:
+    """Slope of the log-log least squares fit, 1.0 is linear and 2.0 is quadratic"""
+    points: list[tuple[float, float]] = [
+        (math.log(size), math.log(elapsed)) for size, elapsed in zip(sizes, seconds) if elapsed > 0
+    ]
+    if len(points) < 2:
+        return None
+    mean_x: float = sum(x for x, _ in points) / len(points)
+    mean_y: float = sum(y for _, y in points) / len(points)
+    variance: float = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+def run_workload(name: str, quick: bool, repeat: int, budget: float) -> dict:
+    setup, run, sizes, quick_sizes = WORKLOADS[name]
+    measured_sizes: list[int] = []
+    measured_seconds: list[float] = []
+    for size in (quick_sizes if quick else sizes):
+        best: float = math.inf
+        for _ in range(repeat):
+            state = setup(size)
+            start = time.perf_counter()
+            run(state, size)
+            best = min(best, time.perf_counter() - start)
+            if best > budget:   # No need for more repeats
+                break
+        measured_sizes.append(size)
+        measured_seconds.append(best)
+        print(f"{name:>18} {size:>8}: {best * 1000:10.2f} ms", file=sys.stderr)
+        if best > budget:   # Bigger sizes would take too long
+            break
+    exponent: float | None = complexity_exponent(measured_sizes, measured_seconds)
+    return {
+        "name": name,
+        "sizes": measured_sizes,
+        "seconds": measured_seconds,
+        "exponent": None if exponent is None else round(exponent, 3)
+    }
+
+def run_memory_workload(name: str, quick: bool) -> dict:
+    build, sizes, quick_sizes = MEMORY_WORKLOADS[name]
+    measured_sizes: list[int] = []
+    measured_bytes: list[float] = []
+    for size in (quick_sizes if quick else sizes):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            built = build(size)
+            gc.collect()
+            allocated_bytes, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del built
+        measured_sizes.append(size)
+        measured_bytes.append(round(allocated_bytes / size, 1))
+        print(f"{name:>18} {size:>8}: {allocated_bytes / size:10.1f} bytes per element", file=sys.stderr)
+    return {
+        "name": name,
+        "sizes": measured_sizes,
+        "bytes_per_element": measured_bytes
+    }
+
+def main(arguments: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="JsonMidiCreator hot paths benchmarks")
+    parser.add_argument("workloads", nargs="*", help=f"Workloads to run, all by default: {', '.join(WORKLOADS)}")
+    parser.add_argument("--quick", action="store_true", help="Uses smaller sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeats per size, the best one is kept")
+    parser.add_argument("--budget", type=float, default=10.0, help="Seconds per run above which bigger sizes are skipped")
+    parser.add_argument("--output", type=str, default=None, help="JSON file to save the results to")
+    parser.add_argument("--max-exponent", type=float, default=None, help="Fails if any complexity exponent is above it")
+    parser.add_argument("--memory", action="store_true", help=f"Also measures the memory per element of: {', '.join(MEMORY_WORKLOADS)}")
+    options = parser.parse_args(arguments)
+    for name in options.workloads:
+        if name not in WORKLOADS:
+            parser.error(f"unknown workload '{name}'")
+
+    results: dict = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "quick": options.quick,
+        "workloads": [
+            run_workload(name, options.quick, options.repeat, options.budget) for name in (options.workloads or WORKLOADS)
+        ]
+    }
+    if options.memory:
+        results["memory"] = [
+            run_memory_workload(name, options.quick) for name in MEMORY_WORKLOADS
+        ]
+    results_json: str = json.dumps(results, indent=4)
+    if options.output:
+        with open(options.output, "w") as output_file:
+            output_file.write(results_json)
+    print(results_json)
+
+    if options.max_exponent is not None:
+        exceeding: list[dict] = [
+            workload for workload in results["workloads"]
+            if workload["exponent"] is not None and workload["exponent"] > options.max_exponent
+        ]
+        for workload in exceeding:
+            print(f"Error: '{workload['name']}' complexity exponent {workload['exponent']} is above {options.max_exponent}", file=sys.stderr)
+        if exceeding:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,14 +13,18 @@ Lesser General Public License for more details.
 https://github.com/ruiseixasm/JsonMidiCreator
 https://github.com/ruiseixasm/JsonMidiPlayer
 '''
+from typing import Iterable, Iterator
+from fractions import Fraction
 import json
 import platform
 import os
-import ctypes
 import threading
 # import multiprocessing
 import math
 import time
+import struct
+import heapq
+import tempfile
 
 # Determine the directory of the current Python file
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -74,12 +78,16 @@ def loadLibrary():
             # Print the library path for debugging
             # print(f"Library FOUND in: {lib_path}")
             try:
+                import ctypes   # Only needed when playing
                 # Load the shared library
                 lib = ctypes.CDLL(lib_path)
                 # Define the argument and return types for the C function
                 lib.PlayList_ctypes.argtypes = [ctypes.c_char_p, ctypes.c_int]
                 lib.PlayList_ctypes.restype = ctypes.c_int
-                
+                if hasattr(lib, "PlayBinary_ctypes"):   # Optional binary playlist entry point
+                    lib.PlayBinary_ctypes.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
+                    lib.PlayBinary_ctypes.restype = ctypes.c_int
+
             except FileNotFoundError:
                 print(f"Could not find the library file: {lib_path}")
                 available_library = False
@@ -111,6 +119,7 @@ def loadTalkieLibrary():
     if available_talkie_library:
         if not talkie_lib:
             try:
+                import ctypes   # Only needed when playing
                 # Load the shared library
                 talkie_lib = ctypes.CDLL(talkie_lib_path)
                 # Define the argument and return types for the C function
@@ -142,14 +151,23 @@ def loadJsonMidiCreator(filename):
         print(f"Unable to Load the file: {filename}")
     return []
 
-def saveJsonMidiPlay(play_list: list[dict], filename):
-    json_file_dict = {
-            "filetype": "Json Midi Player",
-            "url": "https://github.com/ruiseixasm/JsonMidiPlayer",
-            "content": play_list
-        }
+def saveBinaryMidiCreator(binary: bytes, filename):
+    with open(filename, "wb") as outfile:
+        outfile.write(binary)
+
+def loadBinaryMidiCreator(filename) -> bytes:
+    try:
+        with open(filename, "rb") as infile:
+            return infile.read()
+    except Exception as e:
+        print(f"Unable to Load the file: {filename}")
+    return b""
+
+def saveJsonMidiPlay(play_list: Iterable[dict], filename):
     with open(filename, "w") as outfile:
-        json.dump(json_file_dict, outfile)
+        # Written one entry at a time, so, playlist streams are never materialized
+        for json_chunk in json_midi_play_chunks(play_list):
+            outfile.write(json_chunk)
         
 def loadJsonMidiPlay(filename):
     try:
@@ -181,20 +199,219 @@ def run_talkie_dll(json_str, delay_ms, verbose):
         except Exception as e:
             print(f"An error occurred when calling the function 'PlayList_ctypes': {e} for JsonTalkiePlayer")
 
-def jsonMidiPlay(play_list: list[dict], verbose: bool = False, talkie_delay_ms: int = 500):
+
+def periodic_times_ms(period_ms_numerator: int, period_ms_denominator: int, first_event: int, total_events: int,
+                      offset_ms_numerator: int = 0) -> Iterator[float]:
+    """
+    Yields the times in milliseconds of periodic events, `offset_ms + event * period_ms` for each event, \
+        with the exact period accumulated as an integer numerator, so, without any drift.
+    The integer true division is correctly rounded, so, each time is the same float of the `Fraction` math.
+    """
+    time_ms_numerator: int = offset_ms_numerator + period_ms_numerator * first_event
+    for _ in range(total_events):
+        yield round(time_ms_numerator / period_ms_denominator, 3)
+        time_ms_numerator += period_ms_numerator
+
+def periodic_event(period_ms: Fraction, first_event: int, total_events: int, midi_message: dict,
+                   offset_ms: Fraction = Fraction(0)) -> dict:
+    """
+    Returns the compact playlist entry of periodic events, like the clock pulses, to be expanded \
+        by `expand_periodic_events` right before being played or exported.
+    """
+    period_ms_denominator: int = math.lcm(period_ms.denominator, offset_ms.denominator)
+    return {
+        "periodic": {
+            "period_ms_numerator": period_ms.numerator * (period_ms_denominator // period_ms.denominator),
+            "period_ms_denominator": period_ms_denominator,
+            "offset_ms_numerator": offset_ms.numerator * (period_ms_denominator // offset_ms.denominator),
+            "first_event": first_event,
+            "total_events": total_events,
+            "midi_message": midi_message
+        }
+    }
+
+def expand_periodic_events(play_list: Iterable[dict]) -> Iterator[dict]:
+    """Yields the same playlist entries, but with each periodic entry lazily expanded into its events."""
+    for play_dict in play_list:
+        periodic: dict | None = play_dict.get("periodic")
+        if periodic is None:
+            yield play_dict
+            continue
+        for time_ms in periodic_times_ms(periodic["period_ms_numerator"], periodic["period_ms_denominator"],
+                                         periodic["first_event"], periodic["total_events"],
+                                         periodic.get("offset_ms_numerator", 0)):
+            yield {"time_ms": time_ms, "midi_message": dict(periodic["midi_message"])}
+
+def json_midi_play_chunks(play_list: Iterable[dict], as_list: bool = False) -> Iterator[str]:
+    """Yields the Json Midi Player file content in chunks, one per playlist entry."""
+    yield ('[' if as_list else '') + '{"filetype": "Json Midi Player", "url": "https://github.com/ruiseixasm/JsonMidiPlayer", "content": ['
+    separator: str = ""
+    for play_dict in expand_periodic_events(play_list):
+        yield separator + json.dumps(play_dict)
+        separator = ", "
+    yield ']}' + (']' if as_list else '')
+
+def merge_playlists(play_lists: Iterable[Iterable[dict]]) -> Iterator[dict]:
+    """
+    Merges time ordered playlists into a single time ordered playlist stream.
+
+    Each playlist is consumed lazily, so, only one pending entry per playlist is kept.
+    Same time entries keep the order of the given playlists, and a `devices` entry is
+    yielded whenever the devices of the next entry differ from the previous ones.
+    Other entries without `time_ms`, like the clock one, are yielded before any timed one.
+
+    Args:
+        play_lists (Iterable[Iterable[dict]]): Playlists already ordered by `time_ms`.
+
+    Returns:
+        Iterator[dict]: The merged playlist entries.
+    """
+    def timed_entries(play_list: Iterable[dict]) -> Iterator[tuple]:
+        devices: list[str] | None = None
+        for play_dict in expand_periodic_events(play_list):
+            if "time_ms" in play_dict:
+                yield play_dict["time_ms"], devices, play_dict
+            elif "devices" in play_dict:
+                devices = play_dict["devices"]
+            else:
+                yield -math.inf, None, play_dict
+
+    last_devices: list[str] | None = None
+    for _, devices, play_dict in heapq.merge(*map(timed_entries, play_lists), key=lambda entry: entry[0]):
+        if devices is not None and devices is not last_devices and devices != last_devices:
+            yield {"devices": devices}
+        last_devices = devices
+        yield play_dict
+
+
+# Binary playlist, a table with the header entries (devices, clock) followed by fixed width event records
+BINARY_PLAYLIST_MAGIC: bytes = b"JMPB"
+BINARY_PLAYLIST_VERSION: int = 1
+# time_ms, status byte, data byte 1, data byte 2, total data bytes, header entry index, padding
+BINARY_PLAYLIST_RECORD: struct.Struct = struct.Struct("<dBBBBHxx")
+BINARY_PLAYLIST_HEADER: int = 0     # Status byte of the records placing a header entry (not a MIDI status)
+
+def playlist_to_binary(play_list: list[dict]) -> bytes:
+    """
+    Packs a playlist into the binary playlist format, where each entry is a 16 bytes record.
+
+    Args:
+        play_list (list[dict]): The playlist as given by `getPlaylist`.
+
+    Returns:
+        bytes: The table of the distinct header entries, as JSON, followed by the records.
+    """
+    header_entries: dict[str, int] = {}
+    total_entries: int = sum(
+        play_dict["periodic"]["total_events"] if "periodic" in play_dict else 1 for play_dict in play_list
+    )
+    records = bytearray(BINARY_PLAYLIST_RECORD.size * total_entries)
+    pack_into = BINARY_PLAYLIST_RECORD.pack_into
+    offset: int = 0
+    for play_dict in expand_periodic_events(play_list):
+        midi_message: dict | None = play_dict.get("midi_message")
+        if midi_message is not None:
+            if "data_byte_1" in midi_message:
+                pack_into(records, offset, play_dict["time_ms"], midi_message["status_byte"],
+                          midi_message["data_byte_1"], midi_message["data_byte_2"], 2, 0)
+            elif "data_byte" in midi_message:
+                pack_into(records, offset, play_dict["time_ms"], midi_message["status_byte"],
+                          midi_message["data_byte"], 0, 1, 0)
+            else:
+                pack_into(records, offset, play_dict["time_ms"], midi_message["status_byte"], 0, 0, 0, 0)
+        else:   # Header entries like the devices and the clock ones keep their place
+            header_json: str = json.dumps(play_dict)
+            header_index: int = header_entries.setdefault(header_json, len(header_entries))
+            pack_into(records, offset, 0.0, BINARY_PLAYLIST_HEADER, 0, 0, 0, header_index)
+        offset += BINARY_PLAYLIST_RECORD.size
+    header = bytearray(BINARY_PLAYLIST_MAGIC)
+    header += struct.pack("<HH", BINARY_PLAYLIST_VERSION, len(header_entries))
+    for header_json in header_entries:
+        header_bytes: bytes = header_json.encode("utf-8")
+        header += struct.pack("<I", len(header_bytes)) + header_bytes
+    header += struct.pack("<I", offset // BINARY_PLAYLIST_RECORD.size)
+    return bytes(header + records[:offset])
+
+def binary_to_playlist(binary: bytes) -> list[dict]:
+    """
+    Pure Python decoder of the binary playlist format, the inverse of `playlist_to_binary`.
+
+    Args:
+        binary (bytes): The binary playlist.
+
+    Returns:
+        list[dict]: The same playlist as given by `getPlaylist`.
+    """
+    if binary[:4] != BINARY_PLAYLIST_MAGIC:
+        print(f"Warning: Not a binary playlist!")
+        return []
+    version, total_header_entries = struct.unpack_from("<HH", binary, 4)
+    if version != BINARY_PLAYLIST_VERSION:
+        print(f"Warning: Binary playlist version {version} isn't supported!")
+        return []
+    offset: int = 8
+    header_entries: list[str] = []
+    for _ in range(total_header_entries):
+        header_size: int = struct.unpack_from("<I", binary, offset)[0]
+        offset += 4
+        header_entries.append(binary[offset:offset + header_size].decode("utf-8"))
+        offset += header_size
+    total_records: int = struct.unpack_from("<I", binary, offset)[0]
+    offset += 4
+    play_list: list[dict] = []
+    records = memoryview(binary)[offset:offset + total_records * BINARY_PLAYLIST_RECORD.size]
+    for time_ms, status_byte, data_byte_1, data_byte_2, data_bytes, header_index in BINARY_PLAYLIST_RECORD.iter_unpack(records):
+        match data_bytes:
+            case 2:
+                midi_message = {"status_byte": status_byte, "data_byte_1": data_byte_1, "data_byte_2": data_byte_2}
+            case 1:
+                midi_message = {"status_byte": status_byte, "data_byte": data_byte_1}
+            case _:
+                if status_byte == BINARY_PLAYLIST_HEADER:
+                    play_list.append(json.loads(header_entries[header_index]))  # Decoupled dict
+                    continue
+                midi_message = {"status_byte": status_byte}
+        play_list.append({"time_ms": time_ms, "midi_message": midi_message})
+    return play_list
+
+def binaryMidiPlay(play_list: list[dict], verbose: bool = False):
+    """
+    Plays the playlist through the binary entry point of the `JsonMidiPlayer` library, \
+        falling back to `jsonMidiPlay` when the library has no such entry point.
+    """
+    if not lib and not not_found_library_message_already_shown: loadLibrary()
+    if lib and hasattr(lib, "PlayBinary_ctypes"):
+        if verbose: print() # Avoids verbose cluttering
+        binary: bytes = playlist_to_binary(play_list)
+        dll_thread = threading.Thread(target=run_binary_dll, args=(binary, verbose))
+        dll_thread.start()
+        dll_thread.join()  # Wait for the thread to finish
+    else:
+        jsonMidiPlay(play_list, verbose)
+
+# Function to run the DLL in a separate thread
+def run_binary_dll(binary, verbose):
+    if lib:
+        try:
+            # Call the C++ function with the packed records buffer
+            lib.PlayBinary_ctypes(binary, len(binary), 1 if verbose else 0)
+        except Exception as e:
+            print(f"An error occurred when calling the function 'PlayBinary_ctypes': {e}")
+
+def jsonMidiPlay(play_list: Iterable[dict], verbose: bool = False, talkie_delay_ms: int = 500):
+    """
+    Plays the playlist through the `JsonMidiPlayer` library. The playlist may be a stream, like the one of \
+        `iterPlaylist`, but because the `PlayList_ctypes` entry point takes a single JSON string, the whole \
+        JSON content is still built in memory before being played, only the playlist entries aren't.
+    """
     global lib
     global not_found_library_message_already_shown
     if not lib and not not_found_library_message_already_shown: loadLibrary()
     if not talkie_lib and not not_found_talkie_library: loadTalkieLibrary()
     if lib:
         if verbose: print() # Avoids verbose cluttering
-        json_file_dict = {
-                "filetype": "Json Midi Player",
-                "url": "https://github.com/ruiseixasm/JsonMidiPlayer",
-                "content": play_list
-            }
-        # Convert Python dictionary to JSON string
-        json_str = json.dumps([ json_file_dict ])
+        # Convert the playlist to the JSON string one entry at a time, the library takes it as a whole
+        json_str = "".join(json_midi_play_chunks(play_list, True))
 
         # Create and start a new thread to run the DLL
         dll_thread = threading.Thread(target=run_dll, args=(json_str, verbose))
@@ -223,166 +440,306 @@ def jsonMidiPlay(play_list: list[dict], verbose: bool = False, talkie_delay_ms:
 
 
 
-def saveMidiFile(midi_list: list[dict], filename="output.mid"):
-    
-    # Define ANSI escape codes for colors
-    RED = "\033[91m"
-    RESET = "\033[0m"
-            
-    try:
-        # pip install midiutil
-        from midiutil import MIDIFile
-    except ImportError:
-        print(f"{RED}Error: The 'midiutil' library is not installed.\033[0m")
-        print("Please install it by running 'pip install midiutil'.")
-        return
-    
-    processed_events: list[dict] = []
-    # Starts by validating all events by time
-    for event in midi_list:
-        if all(key in event for key in ("event", "track", "track_name", "tempo", "time", "channel")) \
-            and isinstance(event["track"], int) and isinstance(event["time"], (float, int)) \
-            and event["track"] >= 0 and event["time"] >= 0:
-
-            processed_events.append(event)
-        else:
-            print("\033[93mWarning: Some midi events aren't valid!\033[0m")
-    
-    if len(processed_events) > 0:
-        processed_events = sorted(processed_events, key=lambda x: (x["track"], x["time"]))
-
-        midi_tracks: set[int] = set()
-        for event in processed_events:
-            midi_tracks.add(event["track"]) # sets don't allow duplicates
-        MyMIDI = MIDIFile(len(midi_tracks))
-
-        last_event: dict = {
-            "track":        -1,
-            "tempo":        -1,
-            "numerator":    -1,
-            "denominator":  -1
-        }
-        for event in processed_events:
-            if event["track"] != last_event["track"]:  # events already sorted (processed)
-                if isinstance(event["track_name"], str):
-                    MyMIDI.addTrackName(
-                        event["track"],
-                        event["time"],
-                        event["track_name"]
-                    )
-                else:
-                    print("Error, Track name is NOT a string!")
-            if event["track"] != last_event["track"] or event["tempo"] != last_event["tempo"]:  # events already sorted (processed)
-                if isinstance(event["tempo"], (float, int)):
-                    last_event["tempo"] = event["tempo"]
-                    MyMIDI.addTempo(
-                        event["track"],
-                        event["time"],
-                        event["tempo"]
-                    )
+# Standard MIDI File resolution in ticks per quarter note
+MIDI_TICKS_PER_QUARTER: int = 960
+
+def midi_variable_length(value: int) -> bytes:
+    """Encodes a non negative integer as a MIDI variable-length quantity, most significant 7 bits first."""
+    variable_length = bytearray([value & 0x7F])
+    value >>= 7
+    while value:
+        variable_length.append(value & 0x7F | 0x80)
+        value >>= 7
+    variable_length.reverse()
+    return bytes(variable_length)
+
+# Spooled midi event, tick, order, track, insertion, status (-1 for meta events) and data size, followed by the data
+MIDI_SPOOL_RECORD: struct.Struct = struct.Struct("<QBqQhI")
+
+class MidiTrackEncoder:
+    """
+    Encodes the events of a single track, added one at a time by time, into its sorted midi events, \
+        spooled into a temporary file, so that only the sounding notes and the events of the current \
+        tick are kept in memory.
+
+    Each encoded event is a tuple `(tick, order, insertion, status, data)` where `status` is `None` \
+        for meta events and `insertion` is the `(track, index)` order of the event that adds it. Events \
+        at the same tick come as track name and time signature first, then controls, then note offs \
+        and finally note ons and tempo. Overlapping notes with the same channel and pitch are cut at \
+        the start of the next one and duplicated notes are dropped.
+
+    Args:
+        track (int): The track number of the events.
+        tempo_events (dict): The tempo map events of all tracks, by their key, to be added to.
+        add_tempo (bool): If False only the time signature events are added, like with a given tempo map.
+    """
+    def __init__(self, track: int, tempo_events: dict[tuple, tuple], add_tempo: bool = True):
+        self._track: int = track
+        self._tempo_events: dict[tuple, tuple] = tempo_events
+        self._add_tempo: bool = add_tempo
+        self._total_events: int = 0
+        self._last_time: float = -1.0
+        self._last_tempo: float = -1
+        self._last_numerator: int = -1
+        self._last_denominator: int = -1
+        self._tick_events: list[tuple] = []     # Events of the current tick
+        self._pending_offs: list[tuple] = []    # Heap of the note offs still to come
+        self._sounding_notes: dict[tuple[int, int], tuple[tuple[int, int], bytes]] = {}
+        self._last_note_on: dict[tuple[int, int], int] = {}
+        self._spool = tempfile.TemporaryFile()
+
+    def add(self, event: dict) -> bool:
+        """
+        Adds the next valid event of the track, returning False if it comes before the previous one.
+        """
+        if event["time"] < self._last_time:
+            return False
+        self._last_time = event["time"]
+        tick: int = int(event["time"] * MIDI_TICKS_PER_QUARTER)
+        insertion: int = self._total_events * 4 # Each event inserts its track name, tempo, time signature and itself
+        self._total_events += 1
+        if insertion == 0:
+            if isinstance(event["track_name"], str):
+                track_name: bytes = event["track_name"].encode("latin-1", errors="replace")
+                self._spool_event((tick, 0, (self._track, insertion), None,
+                                   b"\xFF\x03" + midi_variable_length(len(track_name)) + track_name))
+            else:
+                print("Error, Track name is NOT a string!")
+        self._add_tempo_events(tick, insertion, event)
+        if self._tick_events and self._tick_events[0][0] != tick:
+            self._flush_tick_events()
+        channel_midi_event = self._channel_event(tick, (self._track, insertion + 3), event)
+        if channel_midi_event is not None:
+            self._tick_events.append(channel_midi_event)
+        return True
+
+    def _add_tempo_events(self, tick: int, insertion: int, event: dict):
+        RED = "\033[91m"
+        # The first of the same tempo map events, in the tracks order, is the one kept
+        def add_tempo_event(event_key: tuple, tempo_event: tuple):
+            if event_key not in self._tempo_events or tempo_event[2] < self._tempo_events[event_key][2]:
+                self._tempo_events[event_key] = tempo_event
+        if self._add_tempo and event["tempo"] != self._last_tempo:
+            if isinstance(event["tempo"], (float, int)) and event["tempo"] > 0:
+                self._last_tempo = event["tempo"]
+                microseconds_per_quarter: int = int(60_000_000 / event["tempo"])
+                add_tempo_event(("tempo", tick, microseconds_per_quarter),
+                    (tick, 3, (self._track, insertion + 1), None, b"\xFF\x51\x03" + microseconds_per_quarter.to_bytes(3, "big")))
+            else:
+                print(f"{RED}Error: Tempo is NOT a number!")
+        if "numerator" in event and "denominator" in event:
+            if event["numerator"] != self._last_numerator or event["denominator"] != self._last_denominator:
+                if isinstance(event["numerator"], int) and isinstance(event["denominator"], int) \
+                    and event["numerator"] > 0 and event["denominator"] > 0:
+
+                    self._last_numerator = event["numerator"]
+                    self._last_denominator = event["denominator"]
+                    add_tempo_event(("time_signature", tick),
+                        (tick, 0, (self._track, insertion + 2), None,
+                            bytes([0xFF, 0x58, 0x04, event["numerator"], int(math.log2(event["denominator"])), 24, 8])))
                 else:
-                    print(f"{RED}Error: Tempo is NOT a number!")
-            if all(key in event for key in ("numerator", "denominator")):
-                if event["track"] != last_event["track"] \
-                    or event["numerator"] != last_event["numerator"] or event["denominator"] != last_event["denominator"]:
-
-                    if isinstance(event["numerator"], int) and isinstance(event["denominator"], int) \
-                        and event["numerator"] > 0 and event["denominator"] > 0:
-
-                        last_event["numerator"] = event["numerator"]
-                        last_event["denominator"] = event["denominator"]
-                        MyMIDI.addTimeSignature(
-                            event["track"],
-                            event["time"],
-                            event["numerator"],
-                            int(math.log2(event["denominator"])),
-                            24, 8
-                        )
-                    else:
-                        print(f"{RED}Error: Time Signature with wrong values!\033[0m")
-
-            last_event["track"] = event["track"]
-
-            match event["event"]:
-                case "Note":
-                    if isinstance(event["duration"], (float, int)) and event["duration"] > 0:
-                        if 0 <= event["channel"] < 16:
-                            if 0 <= event["pitch"] < 128:
-                                if 0 <= event["velocity"] < 128:
-                                    MyMIDI.addNote(
-                                        event["track"],
-                                        event["channel"],
-                                        event["pitch"],
-                                        event["time"],
-                                        event["duration"],
-                                        event["velocity"]
-                                    )
-                                else:
-                                    print(f"{RED}Error: Note Velocity with wrong values! ({event['velocity']})\033[0m")
-                            else:
-                                print(f"{RED}Error: Note Pitch with wrong values! ({event['pitch']})\033[0m")
-                        else:
-                            print(f"{RED}Error: Note Channel with wrong values! ({event['channel']})\033[0m")
-                    else:
-                        print(f"{RED}Error: Note Duration must be above zero! ({event['duration']})\033[0m")
-                case "ControllerEvent":
+                    print(f"{RED}Error: Time Signature with wrong values!\033[0m")
+
+    @staticmethod
+    def _channel_event(tick: int, insertion: tuple[int, int], event: dict) -> tuple | None:
+        RED = "\033[91m"
+        match event["event"]:
+            case "Note":
+                if isinstance(event["duration"], (float, int)) and event["duration"] > 0:
                     if 0 <= event["channel"] < 16:
-                        if 0 <= event["number"] < 128:
-                            if 0 <= event["value"] < 128:
-                                MyMIDI.addControllerEvent(
-                                    event["track"],
-                                    event["channel"],
-                                    event["time"],
-                                    event["number"],
-                                    event["value"]
-                                )
+                        if 0 <= event["pitch"] < 128:
+                            if 0 <= event["velocity"] < 128:
+                                return (tick, 3, insertion, 0x90 | event["channel"], bytes([event["pitch"], event["velocity"]]),
+                                        int(event["duration"] * MIDI_TICKS_PER_QUARTER))
                             else:
-                                print(f"{RED}Error: CC Value with wrong values! ({event['value']})\033[0m")
+                                print(f"{RED}Error: Note Velocity with wrong values! ({event['velocity']})\033[0m")
                         else:
-                            print(f"{RED}Error: CC Number with wrong values! ({event['number']})\033[0m")
-                    else:
-                        print(f"{RED}Error: CC Channel with wrong values! ({event['channel']})\033[0m")
-                case "PitchWheelEvent":
-                    if 0 <= event["channel"] < 16:
-                            if -8192 <= event["value"] < 8192:
-                                MyMIDI.addPitchWheelEvent(
-                                    event["track"],
-                                    event["channel"],
-                                    event["time"],
-                                    event["value"]
-                                )
-                            else:
-                                print(f"{RED}Error: Pitch Value with wrong values! ({event['value']})\033[0m")
+                            print(f"{RED}Error: Note Pitch with wrong values! ({event['pitch']})\033[0m")
                     else:
-                        print(f"{RED}Error: Pitch Channel with wrong values! ({event['channel']})\033[0m")
-                case "ChannelPressure":
-                    if 0 <= event["channel"] < 16:
-                        if 0 <= event["pressure"] < 128:
-                            MyMIDI.addChannelPressure(
-                                event["track"],
-                                event["channel"],
-                                event["time"],
-                                event["pressure"]
-                            )
+                        print(f"{RED}Error: Note Channel with wrong values! ({event['channel']})\033[0m")
+                else:
+                    print(f"{RED}Error: Note Duration must be above zero! ({event['duration']})\033[0m")
+            case "ControllerEvent":
+                if 0 <= event["channel"] < 16:
+                    if 0 <= event["number"] < 128:
+                        if 0 <= event["value"] < 128:
+                            return (tick, 1, insertion, 0xB0 | event["channel"], bytes([event["number"], event["value"]]))
                         else:
-                            print(f"{RED}Error: Channel Pressure Value with wrong values! ({event['pressure']})\033[0m")
+                            print(f"{RED}Error: CC Value with wrong values! ({event['value']})\033[0m")
                     else:
-                        print(f"{RED}Error: Channel Pressure Channel with wrong values! ({event['channel']})\033[0m")
-                case "ProgramChange":
-                    if 0 <= event["channel"] < 16:
-                        if 0 <= event["program"] < 128:
-                            MyMIDI.addProgramChange(
-                                event["track"],
-                                event["channel"],
-                                event["time"],
-                                event["program"]
-                            )
+                        print(f"{RED}Error: CC Number with wrong values! ({event['number']})\033[0m")
+                else:
+                    print(f"{RED}Error: CC Channel with wrong values! ({event['channel']})\033[0m")
+            case "PitchWheelEvent":
+                if 0 <= event["channel"] < 16:
+                        if -8192 <= event["value"] < 8192:
+                            pitch_wheel: int = event["value"] + 8192
+                            return (tick, 1, insertion, 0xE0 | event["channel"], bytes([pitch_wheel & 0x7F, pitch_wheel >> 7]))
                         else:
-                            print(f"{RED}Error: Program Change Program with wrong values! ({event['program']})\033[0m")
+                            print(f"{RED}Error: Pitch Value with wrong values! ({event['value']})\033[0m")
+                else:
+                    print(f"{RED}Error: Pitch Channel with wrong values! ({event['channel']})\033[0m")
+            case "ChannelPressure":
+                if 0 <= event["channel"] < 16:
+                    if 0 <= event["pressure"] < 128:
+                        return (tick, 1, insertion, 0xD0 | event["channel"], bytes([event["pressure"]]))
                     else:
-                        print(f"{RED}Error: Program Change Channel with wrong values! ({event['channel']})\033[0m")
+                        print(f"{RED}Error: Channel Pressure Value with wrong values! ({event['pressure']})\033[0m")
+                else:
+                    print(f"{RED}Error: Channel Pressure Channel with wrong values! ({event['channel']})\033[0m")
+            case "ProgramChange":
+                if 0 <= event["channel"] < 16:
+                    if 0 <= event["program"] < 128:
+                        return (tick, 1, insertion, 0xC0 | event["channel"], bytes([event["program"]]))
+                    else:
+                        print(f"{RED}Error: Program Change Program with wrong values! ({event['program']})\033[0m")
+                else:
+                    print(f"{RED}Error: Program Change Channel with wrong values! ({event['channel']})\033[0m")
+        return None
+
+    def _flush_tick_events(self):
+        self._tick_events.sort()
+        for tick_event in self._tick_events:
+            # The pending note offs that come before
+            while self._pending_offs and self._pending_offs[0] < tick_event:
+                self._note_off(heapq.heappop(self._pending_offs))
+            if tick_event[1] == 3:  # Note On
+                tick, _, insertion, status, data, duration = tick_event
+                note_key: tuple[int, int] = (status & 0x0F, data[0])
+                if self._last_note_on.get(note_key) == tick:
+                    continue    # Duplicated note
+                self._last_note_on[note_key] = tick
+                if note_key in self._sounding_notes:    # Cuts the overlapping note
+                    cut_insertion, cut_data = self._sounding_notes[note_key]
+                    self._spool_event((tick, 2, cut_insertion, 0x80 | note_key[0], cut_data))
+                self._sounding_notes[note_key] = (insertion, data)
+                heapq.heappush(self._pending_offs, (tick + duration, 2, insertion, 0x80 | note_key[0], data))
+                self._spool_event(tick_event[:5])
+            else:
+                self._spool_event(tick_event)
+        self._tick_events.clear()
+
+    def _note_off(self, off_event: tuple):
+        note_key: tuple[int, int] = (off_event[3] & 0x0F, off_event[4][0])
+        if note_key in self._sounding_notes and self._sounding_notes[note_key][0] == off_event[2]:
+            del self._sounding_notes[note_key]
+            self._spool_event(off_event)
+        # Otherwise the note was already cut by the next one
+
+    def _spool_event(self, midi_event: tuple):
+        tick, order, (track, insertion), status, data = midi_event
+        self._spool.write(MIDI_SPOOL_RECORD.pack(tick, order, track, insertion, -1 if status is None else status, len(data)))
+        self._spool.write(data)
+
+    def events(self) -> Iterator[tuple]:
+        """
+        Finishes the track and reads back its sorted midi events from the spool file, closing it at the end.
+        """
+        self._flush_tick_events()
+        while self._pending_offs:
+            self._note_off(heapq.heappop(self._pending_offs))
+        self._spool.seek(0)
+        try:
+            while record := self._spool.read(MIDI_SPOOL_RECORD.size):
+                tick, order, track, insertion, status, data_size = MIDI_SPOOL_RECORD.unpack(record)
+                yield (tick, order, (track, insertion), None if status < 0 else status, self._spool.read(data_size))
+        finally:
+            self._spool.close()
+
+def write_midi_track(output_file, midi_events):
+    """
+    Streams the given sorted midi events into an `MTrk` chunk, with variable-length delta times \
+        and running status, patching the chunk length at the end so that only a small buffer is kept.
+    """
+    output_file.write(b"MTrk")
+    length_position: int = output_file.tell()
+    output_file.write(b"\x00\x00\x00\x00")
+    track_length: int = 0
+    track_buffer = bytearray()
+    previous_tick: int = 0
+    running_status: int | None = None
+    for tick, _, _, status, data, *_ in midi_events:
+        track_buffer += midi_variable_length(tick - previous_tick)
+        previous_tick = tick
+        if status is None:  # Meta events cancel the running status
+            running_status = None
+        elif status != running_status:
+            track_buffer.append(status)
+            running_status = status
+        track_buffer += data
+        if len(track_buffer) > 65536:
+            output_file.write(track_buffer)
+            track_length += len(track_buffer)
+            track_buffer.clear()
+    track_buffer += b"\x00\xFF\x2F\x00"   # End of Track
+    output_file.write(track_buffer)
+    track_length += len(track_buffer)
+    output_file.seek(length_position)
+    output_file.write(track_length.to_bytes(4, "big"))
+    output_file.seek(0, os.SEEK_END)
+
+def saveMidiFile(midi_list: Iterable[dict], filename="output.mid", midi_format: int = 1,
+                 tempo_changes: list[tuple[float, float]] | None = None):
+    """
+    Writes the `getMidilist` events as a Standard MIDI File. The events are consumed one at a time, \
+        each track being encoded into its own temporary spool file, that is streamed to the file at the end, \
+        so, besides the given events, only the sounding notes and the tempo map events are kept in memory.
+    The events of each track are expected by time. A list whose track events aren't is sorted first, \
+        while out of order events of any other iterable are dropped.
+
+    Args:
+        midi_list (Iterable[dict]): The events given by `getMidilist`.
+        filename (str): The path of the midi file to be written.
+        midi_format (int): 1 for a multi track file with a leading tempo track, or 0 for a single track file.
+        tempo_changes (list[tuple[float, float]]): Optional `(beats, tempo)` changes of a tempo map.
+    """
+    def is_valid(event: dict) -> bool:
+        return all(key in event for key in ("event", "track", "track_name", "tempo", "time", "channel")) \
+            and isinstance(event["track"], int) and isinstance(event["time"], (float, int)) \
+            and event["track"] >= 0 and event["time"] >= 0
+
+    if isinstance(midi_list, list):
+        last_times: dict[int, float] = {}
+        for event in midi_list:
+            if is_valid(event):
+                if event["time"] < last_times.get(event["track"], 0):
+                    midi_list = sorted(filter(is_valid, midi_list), key=lambda x: (x["track"], x["time"]))
+                    break
+                last_times[event["track"]] = event["time"]
+
+    tempo_events: dict[tuple, tuple] = {}
+    track_encoders: dict[int, MidiTrackEncoder] = {}
+    for event in midi_list:
+        if not is_valid(event):
+            print("\033[93mWarning: Some midi events aren't valid!\033[0m")
+            continue
+        if event["track"] not in track_encoders:
+            track_encoders[event["track"]] = MidiTrackEncoder(event["track"], tempo_events, tempo_changes is None)
+        if not track_encoders[event["track"]].add(event):
+            print("\033[93mWarning: Some midi events aren't ordered by time!\033[0m")
+    
+    if track_encoders:
+        sorted_tempo_events: list[tuple] = list(tempo_events.values())
+        if tempo_changes is not None:   # The tempo map sets the tempo instead of the events
+            sorted_tempo_events.extend([
+                (int(change_beats * MIDI_TICKS_PER_QUARTER), 3, (-1, -1), None,
+                    b"\xFF\x51\x03" + int(60_000_000 / change_tempo).to_bytes(3, "big"))
+                for change_beats, change_tempo in tempo_changes
+            ])
+        sorted_tempo_events.sort()
+        sorted_encoders: list[MidiTrackEncoder] = [ track_encoders[track] for track in sorted(track_encoders) ]
+
         with open(filename, "wb") as output_file:   # opened to write in binary mode
-            MyMIDI.writeFile(output_file)
+            if midi_format == 0:
+                output_file.write(b"MThd" + struct.pack(">LHHH", 6, 0, 1, MIDI_TICKS_PER_QUARTER))
+                write_midi_track(output_file, heapq.merge(
+                    sorted_tempo_events, *(track_encoder.events() for track_encoder in sorted_encoders)
+                ))
+            else:
+                output_file.write(b"MThd" + struct.pack(">LHHH", 6, 1, len(sorted_encoders) + 1, MIDI_TICKS_PER_QUARTER))
+                write_midi_track(output_file, sorted_tempo_events)
+                for track_encoder in sorted_encoders:
+                    write_midi_track(output_file, track_encoder.events())
 
 
 
@@ -570,53 +927,6 @@ def chat_gpt_solution(midi_list: list[dict], filename="output.mid"):
 
 
 
-# Note Events
-# addNote: Adds a note-on and note-off pair for a specific pitch, channel, time, duration, and velocity.
-# Tempo and Time Events
-# addTempo: Sets the tempo for a given track and time, in beats per minute (BPM).
-# addTimeSignature: Adds a time signature event.
-# addKeySignature: Adds a key signature event.
-# Control Change (CC) Events
-# addControllerEvent: Adds a MIDI Control Change (CC) message, which is often used for controls like modulation, volume, pan, etc. Each control number corresponds to a specific MIDI controller (e.g., control number 7 is volume).
-# Program Change (PC) Events
-# addProgramChange: Changes the instrument for a specified channel at a particular time, often used to switch between instrument sounds within a track.
-# Pitch Bend and Aftertouch Events
-# addPitchWheelEvent: Adds a pitch bend message for a specific channel.
-# addChannelPressure: Adds a channel aftertouch (pressure) event for a specified channel and time.
-# addPolyPressure: Adds polyphonic (per-note) aftertouch events for individual notes.
-# System and Meta Events
-# addSysEx: Adds a System Exclusive (SysEx) message to the track, useful for custom data specific to MIDI hardware or software.
-# addUniversalSysEx: Adds a Universal System Exclusive message for broader, standard SysEx applications.
-# addText: Adds text to the MIDI file, often for lyrics, titles, or other annotations.
-# addCopyright: Adds copyright information to the file.
-# addTrackName: Adds a name to the track, which appears in most MIDI editors.
-# addMarker: Adds a marker at a specific point in the track, often for structural cues.
-# addCuePoint: Adds a cue point for synchronizing MIDI with external media.
-
-# #!/usr/bin/env python
-
-# from midiutil import MIDIFile
-
-# degrees  = [60, 62, 64, 65, 67, 69, 71, 72]  # MIDI note number
-# track    = 0
-# channel  = 0
-# time     = 0    # In beats
-# duration = 1    # In beats
-# tempo    = 60   # In BPM
-# volume   = 100  # 0-127, as per the MIDI standard
-
-# MyMIDI = MIDIFile(1)  # One track, defaults to format 1 (tempo track is created
-#                       # automatically)
-# MyMIDI.addTempo(track, time, tempo)
-
-# for i, pitch in enumerate(degrees):
-#     MyMIDI.addNote(track, channel, pitch, time + i, duration, volume)
-
-# with open("major-scale.mid", "wb") as output_file:
-#     MyMIDI.writeFile(output_file)
-
-# https://pypi.org/project/MIDIUtil/
-
 # In the line with open(filename, "wb") as output_file:, the "wb" stands for:
 
 # w: This indicates that the file is being opened for writing. If the file already exists, it will be truncated (i.e., its contents will be erased). If the file does not exist, a new file will be created.
@@ -14,10 +14,10 @@ https://github.com/ruiseixasm/JsonMidiCreator
 https://github.com/ruiseixasm/JsonMidiPlayer
 '''
 import logging
-from functools import cache
 from typing import Union, TypeVar, TYPE_CHECKING, Type, Callable, List, Tuple, Optional, Any, Generic
-from typing import Self
+from typing import Self, Iterator
 import ast
+import struct
 
 from fractions import Fraction
 # Json Midi Creator Libraries
@@ -153,9 +153,33 @@ def tag_to_int(tag: str) -> int:
 
 
 def minutes_to_time_ms(minutes: Fraction) -> float:
-    # Validation is done by JsonMidiPlayer and midiutil Midi Range Validation
+    # Validation is done by JsonMidiPlayer and saveMidiFile Midi Range Validation
     return round(float(minutes * 60_000), 3)
 
+# Fixed resolution of the integer tick grid, it exactly represents binary note values
+# down to 1/1024 of a beat and any nesting of triplets, quintuplets and septuplets
+TICKS_PER_BEAT: int = 2**10 * 3**3 * 5**2 * 7 * 11 * 13
+
+def beats_to_ticks(beats: Fraction | int) -> int | None:
+    """Returns the exact integer ticks of the given beats or None if they fall outside the tick grid."""
+    ticks_per_unit, remainder = divmod(TICKS_PER_BEAT, beats.denominator)
+    if remainder:
+        return None
+    return beats.numerator * ticks_per_unit
+
+def ticks_to_time_ms(ticks: int, tempo: Fraction, denominator: int = 1) -> float:
+    """
+    Pure integer equivalent of `minutes_to_time_ms(beats / tempo)` for `beats = ticks / denominator / TICKS_PER_BEAT`.
+    The integer true division is correctly rounded, so, the result is the same float of the `Fraction` math.
+    """
+    return round(
+        ticks * 60_000 * tempo.denominator / (denominator * TICKS_PER_BEAT * tempo.numerator), 3
+    )
+
+def ticks_to_beats(ticks: int, denominator: int = 1) -> float:
+    """Pure integer equivalent of `float(beats)` for `beats = ticks / denominator / TICKS_PER_BEAT`."""
+    return ticks / (denominator * TICKS_PER_BEAT)
+
 def time_ms_to_minutes(time_ms: float | int) -> Fraction:
     from . import operand_rational as ra
     return ra.Minutes(time_ms / 60_000)._rational
@@ -477,11 +501,38 @@ def string_rshift(left: str, shift: int) -> str:
 
 # GLOBAL FUNCTIONS
 
-@cache  # Important decorator to avoid repeated searches (class names are static, never change)
+# Registry of the Operand classes by name, filled up by `Operand.__init_subclass__` as they are defined
+operand_classes_registry: dict[str, type] = {}
+
+def register_operand_class(operand_class: type, name: str | None = None, replace: bool = False) -> type:
+    """
+    Registers a class by its name, so it can be found when deserializing. All `Operand` subclasses, \
+        including the ones defined outside this package, register themselves when defined.
+
+    Args:
+        operand_class: The class to be registered.
+        name (str): The registered name, by default the class name.
+        replace (bool): Replaces any other class already registered with the same name.
+
+    Returns:
+        The class registered with the given name.
+    """
+    if name is None:
+        name = operand_class.__name__
+    registered_class: type | None = operand_classes_registry.get(name)
+    if registered_class is not None and registered_class is not operand_class and not replace:
+        # A redefinition of the same class, like a module reload, replaces it
+        if (registered_class.__module__, registered_class.__qualname__) != (operand_class.__module__, operand_class.__qualname__):
+            print(f"Warning: The class name '{name}' of '{operand_class.__module__}' is already "
+                  f"registered by '{registered_class.__module__}', so, it's ignored!")
+            return registered_class
+    operand_classes_registry[name] = operand_class
+    return operand_class
+
 def find_class_by_name(root_class: type, name: str) -> type:
     """
-    Recursively searches for a class with a given name in the hierarchy 
-    starting from the root_class.
+    Finds the class with a given name in the hierarchy starting from the root_class, \
+        with a registry lookup for the `Operand` classes.
 
     Args:
         root_class: The starting class for the search.
@@ -493,6 +544,10 @@ def find_class_by_name(root_class: type, name: str) -> type:
     if not isinstance(root_class, type):
         raise TypeError("root_class must be a class.")
 
+    registered_class: type | None = operand_classes_registry.get(name)
+    if registered_class is not None:
+        return registered_class if issubclass(registered_class, root_class) else None
+
     # Check if the current class matches the name (class NOT an object)
     if root_class.__name__ == name:
         return root_class
@@ -505,6 +560,31 @@ def find_class_by_name(root_class: type, name: str) -> type:
     # If no matching subclass is found, return None
     return None
 
+def resolve_serialization_classes(serialization: any) -> dict[str, type | None]:
+    """
+    Resolves in a single pass all the class names referenced by a serialization tree.
+
+    Args:
+        serialization: The serialization given by `getSerialization`.
+
+    Returns:
+        dict: The class of each referenced name, or None for the unknown ones.
+    """
+    resolved_classes: dict[str, type | None] = {}
+    pending_data: list = [serialization]
+    while pending_data:
+        data = pending_data.pop()
+        if isinstance(data, dict):
+            class_name = data.get("class")
+            if isinstance(class_name, str) and class_name not in resolved_classes:
+                resolved_classes[class_name] = operand_classes_registry.get(class_name)
+                if resolved_classes[class_name] is None:
+                    print(f"Warning: Unknown class '{class_name}' in the serialization!")
+            pending_data.extend(data.values())
+        elif isinstance(data, (list, tuple)):
+            pending_data.extend(data)
+    return resolved_classes
+
 
 def list_all_operand_classes(root_class: type, all_classes: list = None) -> list:
     if not all_classes:
@@ -601,6 +681,424 @@ def playlist_time_ms(playlist: list[dict]) -> list[dict]:
     ]
 
 
+# BINARY SERIALIZATION
+
+BINARY_MAGIC: bytes = b"JMCB"
+BINARY_VERSION: int = 1
+
+# Value tags of the binary serialization
+BINARY_NONE, BINARY_FALSE, BINARY_TRUE, BINARY_INT, BINARY_FLOAT, BINARY_STR, BINARY_FRACTION, \
+    BINARY_LIST, BINARY_TUPLE, BINARY_DICT, BINARY_OPERAND, BINARY_OPERANDS = range(12)
+
+# Resolved `_serialization_attributes` by class, None for the classes that can't be read or written directly
+_operand_serialization_attributes: dict[type, tuple[tuple[str, str], ...] | None] = {}
+
+def serialization_attributes(operand_class: type) -> tuple[tuple[str, str], ...] | None:
+    """
+    Collects the `_serialization_attributes` declared along the class hierarchy, from the base to the \
+        given class, in the same order of the `getSerialization` parameters.
+
+    Args:
+        operand_class (type): The `Operand` class.
+
+    Returns:
+        tuple: The `(parameter, attribute)` pairs, or None if any class of the hierarchy that \
+            implements its own serialization doesn't declare its attributes.
+    """
+    if operand_class in _operand_serialization_attributes:
+        return _operand_serialization_attributes[operand_class]
+    attributes: dict[str, str] | tuple | None = {}
+    for hierarchy_class in reversed(operand_class.__mro__):
+        class_variables = vars(hierarchy_class)
+        if "getSerialization" in class_variables or "loadSerialization" in class_variables:
+            if "_serialization_attributes" not in class_variables:
+                attributes = None
+                break
+            # Like the parameters dictionary, a redefined parameter keeps its original place
+            attributes.update(class_variables["_serialization_attributes"])
+    if attributes is not None:
+        attributes = tuple(attributes.items())
+    _operand_serialization_attributes[operand_class] = attributes
+    return attributes
+
+
+def serialization_to_binary(serialization: any) -> bytes:
+    """
+    Encodes the `getSerialization` data into the compact binary format, where all strings, \
+        class names included, are stored once in a table and referred by their numeric id, \
+        the `"n/d"` strings become native integer pairs and each list of `Operand`s sharing \
+        the same class and parameters is stored as a length-prefixed array of values. \
+        Given an `Operand` instead, the classes with `_serialization_attributes` are written \
+        straight from their attributes without building their serialization dictionaries.
+
+    Args:
+        serialization: The data returned by `getSerialization`, or the `Operand` itself.
+
+    Returns:
+        bytes: The binary serialization, starting with the `BINARY_MAGIC` header.
+    """
+    symbols: dict[str, int] = {}
+    encoded_symbols: dict[str, bytes] = {}
+    encoded_strings: dict[str, bytes] = {}
+    body = bytearray()
+
+    def write_varint(value: int, buffer: bytearray = body):
+        while value > 0x7F:
+            buffer.append(value & 0x7F | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    def encode_symbol(string: str) -> bytes:
+        symbol_id: int | None = symbols.get(string)
+        if symbol_id is None:
+            symbol_id = symbols[string] = len(symbols)
+        encoded_symbol = bytearray()
+        write_varint(symbol_id, encoded_symbol)
+        encoded_symbols[string] = bytes(encoded_symbol)
+        return encoded_symbols[string]
+
+    def write_symbol(string: str):
+        body.extend(encoded_symbols.get(string) or encode_symbol(string))
+
+    def encode_string(string: str) -> bytes:
+        encoded_string = bytearray()
+        # Same "n/d" strings that `deserialize` converts back into a Fraction
+        if '/' in string:
+            try:
+                fraction = Fraction(string)
+                encoded_string.append(BINARY_FRACTION)
+                numerator: int = fraction.numerator
+                write_varint(numerator << 1 if numerator >= 0 else (-numerator << 1) - 1, encoded_string)
+                write_varint(fraction.denominator, encoded_string)
+                return bytes(encoded_string)
+            except ValueError:
+                pass
+        symbol_id: int | None = symbols.get(string)
+        if symbol_id is None:
+            symbol_id = symbols[string] = len(symbols)
+        encoded_string.append(BINARY_STR)
+        write_varint(symbol_id, encoded_string)
+        return bytes(encoded_string)
+
+    def is_operand(data: any) -> bool:
+        return type(data) is dict and len(data) == 4 and "class" in data and "masked" in data \
+            and "parameters" in data and "next_operand" in data \
+            and type(data["class"]) is str and type(data["parameters"]) is dict
+
+    def write(data: any):
+        data_type: type = type(data)
+        if data_type is str:    # Most common data, so, it's encoded only once
+            encoded_string: bytes | None = encoded_strings.get(data)
+            if encoded_string is None:
+                encoded_string = encoded_strings[data] = encode_string(data)
+            body.extend(encoded_string)
+            return
+        if data_type is int and 0 <= data < 0x40:  # Single byte integer, same as `write_varint` zigzag
+            body.append(BINARY_INT)
+            body.append(data << 1)
+            return
+        match data:
+            case Operand():
+                attributes: tuple[tuple[str, str], ...] | None = serialization_attributes(data_type)
+                if attributes is None:
+                    write(data.getSerialization())
+                else:
+                    body.append(BINARY_OPERAND)
+                    write_symbol(data_type.__name__)
+                    write(data._masked)
+                    write_varint(len(attributes))
+                    for key, attribute in attributes:
+                        body.extend(encoded_symbols.get(key) or encode_symbol(key))
+                        write(getattr(data, attribute))
+                    write(data._next_operand)
+            case None:
+                body.append(BINARY_NONE)
+            case bool():
+                body.append(BINARY_TRUE if data else BINARY_FALSE)
+            case int():
+                body.append(BINARY_INT)
+                write_varint(data << 1 if data >= 0 else (-data << 1) - 1)  # zigzag
+            case float():
+                body.append(BINARY_FLOAT)
+                body.extend(struct.pack("<d", data))
+            case Fraction():
+                body.append(BINARY_FRACTION)
+                numerator: int = data.numerator
+                write_varint(numerator << 1 if numerator >= 0 else (-numerator << 1) - 1)
+                write_varint(data.denominator)
+            case list():
+                if len(data) > 1 and isinstance(data[0], Operand):
+                    operand_type: type = type(data[0])
+                    attributes: tuple[tuple[str, str], ...] | None = serialization_attributes(operand_type)
+                    if attributes is not None:
+                        if all(type(single_data) is operand_type for single_data in data):
+                            body.append(BINARY_OPERANDS)
+                            write_varint(len(data))
+                            write_symbol(operand_type.__name__)
+                            write_varint(len(attributes))
+                            for key, _ in attributes:
+                                write_symbol(key)
+                            for single_data in data:
+                                write(single_data._masked)
+                                for _, attribute in attributes:
+                                    write(getattr(single_data, attribute))
+                                write(single_data._next_operand)
+                            return
+                        # Mixed classes are also written without building their serialization dictionaries
+                        body.append(BINARY_LIST)
+                        write_varint(len(data))
+                        for single_data in data:
+                            write(single_data)
+                        return
+                    data = Operand.serialize(data)  # Same arrays of the serialization dictionaries
+                if len(data) > 1 and is_operand(data[0]):
+                    operand_class: str = data[0]["class"]
+                    parameters_keys: tuple = tuple(data[0]["parameters"])
+                    if all(is_operand(single_data) and single_data["class"] == operand_class
+                           and tuple(single_data["parameters"]) == parameters_keys for single_data in data):
+                        body.append(BINARY_OPERANDS)
+                        write_varint(len(data))
+                        write_symbol(operand_class)
+                        write_varint(len(parameters_keys))
+                        for key in parameters_keys:
+                            write_symbol(key)
+                        for single_data in data:
+                            write(single_data["masked"])
+                            for value in single_data["parameters"].values():
+                                write(value)
+                            write(single_data["next_operand"])
+                        return
+                body.append(BINARY_LIST)
+                write_varint(len(data))
+                for single_data in data:
+                    write(single_data)
+            case tuple():
+                body.append(BINARY_TUPLE)
+                write_varint(len(data))
+                for single_data in data:
+                    write(single_data)
+            case dict():
+                if is_operand(data):
+                    body.append(BINARY_OPERAND)
+                    write_symbol(data["class"])
+                    write(data["masked"])
+                    write_varint(len(data["parameters"]))
+                    for key, value in data["parameters"].items():
+                        write_symbol(key)
+                        write(value)
+                    write(data["next_operand"])
+                else:
+                    body.append(BINARY_DICT)
+                    write_varint(len(data))
+                    for key, value in data.items():
+                        write(key)
+                        write(value)
+            case _:
+                if callable(data):
+                    write(Operand.serialize(data))
+                else:
+                    print(f"Warning: Unable to binary serialize the data of type {type(data).__name__}!")
+                    body.append(BINARY_NONE)
+
+    write(serialization)
+    # The symbols table goes first so that decoding is done in a single pass
+    header = bytearray(BINARY_MAGIC)
+    header.append(BINARY_VERSION)
+    write_varint(len(symbols), header)
+    for symbol in symbols:  # dicts keep the insertion order, the same of the ids
+        encoded_symbol: bytes = symbol.encode("utf-8")
+        write_varint(len(encoded_symbol), header)
+        header.extend(encoded_symbol)
+    return bytes(header + body)
+
+
+def binary_to_serialization(binary: bytes, root_operand: 'Operand' = None) -> any:
+    """
+    Decodes the binary format of `serialization_to_binary` straight into `Operand`s. The records \
+        of classes with `_serialization_attributes` are set directly as attributes of new instances, \
+        cloned from a cached one per class, while the other classes are loaded by `loadSerialization`.
+
+    Args:
+        binary (bytes): The binary serialization.
+        root_operand (Operand): If given, the root serialization is loaded into it instead of into a new `Operand`.
+
+    Returns:
+        any: The decoded `Operand` or data, `None` if the binary isn't a valid serialization.
+    """
+    if not isinstance(binary, (bytes, bytearray)) or binary[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+        print("Warning: Not a Json Midi Creator binary serialization!")
+        return None
+    if binary[len(BINARY_MAGIC)] != BINARY_VERSION:
+        print(f"Warning: Unsupported binary serialization version {binary[len(BINARY_MAGIC)]}!")
+        return None
+
+    position: int = len(BINARY_MAGIC) + 1
+    fractions: dict[tuple[int, int], Fraction] = {}   # Fractions are immutable, so, they can be shared
+    operand_classes: dict[int, type] = {}
+    record_attributes: dict[tuple[int, tuple[int, ...]], tuple[str, ...] | None] = {}
+    class_prototypes: dict[int, dict | None] = {}
+
+    def read_varint() -> int:
+        nonlocal position
+        byte: int = binary[position]
+        position += 1
+        if byte < 0x80:
+            return byte
+        value: int = byte & 0x7F
+        shift: int = 7
+        while True:
+            byte = binary[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def read_zigzag() -> int:
+        value: int = read_varint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    symbols_count: int = read_varint()
+    symbols: list[str] = []
+    for _ in range(symbols_count):
+        symbol_length: int = read_varint()
+        symbols.append(binary[position:position + symbol_length].decode("utf-8"))
+        position += symbol_length
+
+    def operand_class(class_id: int) -> type | None:
+        if class_id not in operand_classes:
+            operand_classes[class_id] = operand_classes_registry.get(symbols[class_id])
+            if operand_classes[class_id] is None and logging.getLogger().getEffectiveLevel() <= logging.DEBUG:
+                logging.warning("Find class didn't found any class!")
+        return operand_classes[class_id]
+
+    def load_operand(class_id: int, serialization: dict, is_root: bool) -> 'Operand':
+        if is_root and root_operand is not None:
+            return root_operand.loadSerialization(serialization)
+        if operand_class(class_id):
+            return operand_class(class_id)().loadSerialization(serialization)
+        return None
+
+    def operand_attributes(class_id: int, key_ids: tuple[int, ...]) -> tuple[str, ...] | None:
+        # The attributes are read directly only if the parameters match the class ones
+        record_key: tuple[int, tuple[int, ...]] = (class_id, key_ids)
+        if record_key in record_attributes:
+            return record_attributes[record_key]
+        attributes: tuple[tuple[str, str], ...] | None = None
+        if operand_class(class_id):
+            attributes = serialization_attributes(operand_class(class_id))
+        if attributes is not None and class_id not in class_prototypes:
+            # Immutable initial attributes can be shared by all the new operands of the class
+            prototype_dict: dict | None = operand_class(class_id)().__dict__
+            attribute_names: set[str] = {attribute for _, attribute in attributes}
+            if any(type(value) not in (type(None), bool, int, float, str, Fraction)
+                   for name, value in prototype_dict.items() if name not in attribute_names):
+                prototype_dict = None
+            class_prototypes[class_id] = prototype_dict
+        if attributes is not None and tuple(symbols[key_id] for key_id in key_ids) == tuple(key for key, _ in attributes):
+            record_attributes[record_key] = tuple(attribute for _, attribute in attributes)
+        else:
+            record_attributes[record_key] = None
+        return record_attributes[record_key]
+
+    def new_operand(class_id: int, masked: any, attributes: tuple[str, ...], values: list,
+                    next_operand: any) -> 'Operand':
+        prototype_dict: dict | None = class_prototypes[class_id]
+        if prototype_dict is None:
+            loaded_operand: Operand = operand_class(class_id)()
+        else:
+            loaded_operand: Operand = object.__new__(operand_classes[class_id])
+            loaded_operand.__dict__.update(prototype_dict)
+        loaded_operand.__dict__.update(zip(attributes, values))
+        loaded_operand._masked = masked
+        loaded_operand._next_operand = next_operand
+        return loaded_operand._loaded_serialization()
+
+    def read(is_root: bool = False) -> any:
+        nonlocal position
+        tag: int = binary[position]
+        position += 1
+        if tag == BINARY_INT and binary[position] < 0x80:  # Most common data, a single byte integer
+            value: int = binary[position]
+            position += 1
+            return value >> 1 if not value & 1 else -((value + 1) >> 1)
+        match tag:
+            case 0:     # BINARY_NONE
+                return None
+            case 1:     # BINARY_FALSE
+                return False
+            case 2:     # BINARY_TRUE
+                return True
+            case 3:     # BINARY_INT
+                return read_zigzag()
+            case 4:     # BINARY_FLOAT
+                position += 8
+                return struct.unpack_from("<d", binary, position - 8)[0]
+            case 5:     # BINARY_STR
+                return symbols[read_varint()]
+            case 6:     # BINARY_FRACTION
+                fraction_key: tuple[int, int] = (read_zigzag(), read_varint())
+                fraction: Fraction | None = fractions.get(fraction_key)
+                if fraction is None:
+                    fraction = fractions[fraction_key] = Fraction(*fraction_key)
+                return fraction
+            case 7:     # BINARY_LIST
+                return [read() for _ in range(read_varint())]
+            case 8:     # BINARY_TUPLE
+                return tuple(read() for _ in range(read_varint()))
+            case 9:     # BINARY_DICT
+                data_dict: dict = {}
+                for _ in range(read_varint()):
+                    key = read()
+                    data_dict[key] = read()
+                return data_dict
+            case 10:    # BINARY_OPERAND
+                class_id: int = read_varint()
+                masked = read()
+                key_ids: list[int] = []
+                values: list = []
+                for _ in range(read_varint()):
+                    key_ids.append(read_varint())
+                    values.append(read())
+                next_operand = read()
+                if not (is_root and root_operand is not None):
+                    attributes: tuple[str, ...] | None = operand_attributes(class_id, tuple(key_ids))
+                    if attributes is not None:
+                        return new_operand(class_id, masked, attributes, values, next_operand)
+                serialization: dict = {
+                    "class": symbols[class_id],
+                    "masked": masked,
+                    "parameters": {symbols[key_id]: value for key_id, value in zip(key_ids, values)},
+                    "next_operand": next_operand
+                }
+                return load_operand(class_id, serialization, is_root)
+            case 11:    # BINARY_OPERANDS
+                operands_count: int = read_varint()
+                class_id: int = read_varint()
+                key_ids: tuple[int, ...] = tuple(read_varint() for _ in range(read_varint()))
+                parameters_keys: list[str] = [symbols[key_id] for key_id in key_ids]
+                attributes: tuple[str, ...] | None = operand_attributes(class_id, key_ids)
+                operands: list = []
+                for _ in range(operands_count):
+                    masked = read()
+                    if attributes is not None:
+                        values: list = [read() for _ in attributes]
+                        operands.append(new_operand(class_id, masked, attributes, values, read()))
+                        continue
+                    serialization: dict = {
+                        "class": symbols[class_id],
+                        "masked": masked,
+                        "parameters": {key: read() for key in parameters_keys},
+                        "next_operand": read()
+                    }
+                    operands.append(load_operand(class_id, serialization, False))
+                return operands
+        print(f"Warning: Unknown binary serialization tag {tag}!")
+        return None
+
+    return read(True)
+
+
 # GLOBAL CLASSES
 
 class Operand:
@@ -615,6 +1113,14 @@ class Operand:
     ----------
     None : It has no parameters.
     """
+    # Pairs of `getSerialization` parameter and attribute, in the same order, that let the binary
+    # serialization write and read the attributes directly, see `serialization_attributes`
+    _serialization_attributes: tuple[tuple[str, str], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        register_operand_class(cls)
+
     def __init__(self, *parameters):
         self._next_operand: Operand | None  = None
         self._initiated: bool               = False
@@ -768,6 +1274,14 @@ class Operand:
     def getMidilist(self, midi_track = None, position_beats: Fraction | None = None) -> list[dict]:
         return []
 
+    def iterPlaylist(self) -> Iterator[dict]:
+        """Yields the entries of `getPlaylist`, time ordered by the `Composition` that can stream them."""
+        return iter(self.getPlaylist())
+
+    def getBinaryPlaylist(self) -> bytes:
+        """Returns the same content of `getPlaylist` packed in the binary playlist format."""
+        return c.playlist_to_binary(self.getPlaylist())
+
     def getSerialization(self) -> dict:
         next_operand = self._next_operand
         if isinstance(self._next_operand, Operand):
@@ -786,7 +1300,20 @@ class Operand:
             self._masked = self.deserialize(serialization["masked"])
             self._next_operand = self.deserialize(serialization["next_operand"])
         return self
-       
+
+    def _loaded_serialization(self) -> Self:
+        """Completes the binary loading of the `_serialization_attributes` set directly, like `loadSerialization` does."""
+        return self
+
+    def getBinarySerialization(self) -> bytes:
+        """Returns the same content of `getSerialization` in the compact binary format."""
+        return serialization_to_binary(self)
+
+    def loadBinarySerialization(self, binary: bytes) -> Self:
+        """Loads the binary format of `getBinarySerialization` straight into self."""
+        binary_to_serialization(binary, self)
+        return self
+
     def set(self, operand: any) -> Self:
         """Applies `<<` on the operand while keeping self"""
         return self.__lshift__(operand)
@@ -849,7 +1376,25 @@ class Operand:
         # !! DON'T DO THIS !!
         # return type(self)() << self << parameters
         return self_copy
-    
+
+    def _clone(self) -> Self:
+        """
+        Fast alternative to `type(self)() << self` that bypasses `__init__` and the `<<` parsing \
+            by cloning the attributes directly, intended for the `copy` of frequently copied classes.
+
+        Returns:
+            Operand: A new instance sharing the attribute values of self, meaning that any mutable \
+                attribute besides the `_next_operand` has to be copied by the caller.
+        """
+        self_clone: Self = object.__new__(type(self))
+        self_clone.__dict__.update(self.__dict__)
+        self_clone.__dict__.pop("_current_node", None)  # Iteration state isn't copied
+        self_clone.__dict__.pop("_render_cache", None)  # Neither is the render cache
+        self_clone._set = False   # by default a new copy of data unsets the Operand
+        # COPY THE SELF OPERANDS RECURSIVELY
+        self_clone._next_operand = self.deep_copy(self._next_operand)
+        return self_clone
+
     def reset(self, *parameters) -> Self:
         # RESET THE SELF OPERANDS RECURSIVELY
         if self._next_operand is not None:
@@ -1105,7 +1650,7 @@ class Operand:
                     if "class" in data and "parameters" in data and "next_operand" in data:
 
                         operand_name = data["class"]
-                        operand_class: type[Operand] = find_class_by_name(Operand, operand_name)   # Heavy duty call
+                        operand_class: type[Operand] = operand_classes_registry.get(operand_name)
                         if operand_class:
                             # Now able to load from the Operand perspective
                             return operand_class().loadSerialization(data)
@@ -1159,6 +1704,44 @@ class Operand:
             case _:
                 return data
 
+    # Back references and caches that aren't part of the Operand own state
+    _unkeyed_attributes: frozenset[str] = frozenset({
+        "_owner_clip", "_owner_part", "_upper_container", "_current_node", "_render_cache",
+        "_absolute_pitch_cache", "_identity_index"
+    })
+
+    @staticmethod
+    def state_key(data: any, excluded: frozenset[str] = frozenset()) -> any:
+        """
+        Recursively builds an hashable snapshot of the given data, where two equal keys \
+            mean an identical state, nested Operands included.
+
+        Args:
+            data (any): The Operand or any other data to snapshot.
+            excluded (frozenset[str]): Top level attributes of the Operand to leave out of the key.
+
+        Returns:
+            any: An hashable key of the data state.
+        """
+        match data:
+            case Operand():
+                return (type(data),) + tuple(
+                    (name, __class__.state_key(value)) for name, value in data.__dict__.items()
+                    if name not in excluded and name not in __class__._unkeyed_attributes
+                )
+            case dict():
+                return (dict,) + tuple((key, __class__.state_key(value)) for key, value in data.items())
+            case list() | tuple():
+                return (type(data),) + tuple(__class__.state_key(single_data) for single_data in data)
+            case set() | frozenset():
+                return frozenset(__class__.state_key(single_data) for single_data in data)
+            case _:
+                try:
+                    hash(data)
+                except TypeError:
+                    return (type(data), id(data))   # Unhashable data is only equal to itself
+                return data
+
     @staticmethod
     def deep_copy_dict(data: dict) -> dict:
         """
@@ -1213,3 +1796,5 @@ class Operand:
                 __class__.deep_clear(list(data))
 
 
+# The subclasses register themselves by `Operand.__init_subclass__`
+register_operand_class(Operand)
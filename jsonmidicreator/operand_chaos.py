@@ -21,6 +21,7 @@ from fractions import Fraction
 import json
 import enum
 import math
+from array import array
 # Json Midi Creator Libraries
 from . import creator as c
 from . import operand as o
@@ -31,6 +32,14 @@ from . import operand_data as od
 from . import operand_tamer as ot
 
 
+def splitmix64(value: int) -> int:
+    """SplitMix64 finalizer, spreads any integer into a well mixed 64 bits integer."""
+    value = (value + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return value ^ (value >> 31)
+
+
 class Chaos(o.Operand):
     """`Chaos`
 
@@ -117,6 +126,75 @@ class Chaos(o.Operand):
             results.add(new_result)
         return -1
 
+    def batch(self, n: int) -> array:
+        """
+        Returns the next n results in a single go, exactly as n calls of `self % float()` would.
+
+        Untamed `Chaos` without a chained `Chaos` use a kernel that avoids the per step
+        `Operand` overhead, otherwise the results are the ones of the scalar path.
+        Use `numpy.frombuffer(chaos.batch(n))` to get them as a NumPy array without copying.
+
+        Args:
+            n (int): The amount of results.
+
+        Returns:
+            array: An `array('d')` with the n results.
+        """
+        if n <= 0:
+            return array('d')
+        if type(self._tamer) is ot.Tamer and self._tamer._next_operand is None and not isinstance(self._next_operand, Chaos):
+            index: int = self._index
+            first: array = array('d')
+            if index < 0:   # The first result is the X0 one
+                first.append(self._batch_value())
+                index = 0
+            results: array | None = self._batch_results(n - len(first), index)
+            if results is not None:
+                iterations: int = len(results)
+                if iterations > 0:
+                    self._tamer._index += iterations
+                    self._tamer_tries = 1
+                    self._initiated = True
+                self._index = index + iterations
+                return first + results
+        return array('d', (self % float() for _ in range(n)))
+
+    def _batch_value(self) -> float:
+        return float(ra.Result(self._xn._rational)._rational)
+
+    def _batch_results(self, n: int, index: int) -> array | None:
+        """Kernel that does n untamed iterations and returns their results, None if not available"""
+        return None
+
+    def spawn(self, key: int) -> Self:
+        """
+        Derives an independent `Chaos` stream out of this one without iterating it.
+
+        The new stream is a copy seeded by mixing the current `Xn` with the given key,
+        so the same state and key always give the same stream, while different keys
+        give streams that don't share their orbits.
+
+        Args:
+            key (int): The stream identifier, like an iteration index.
+
+        Returns:
+            Chaos: A reset copy of self seeded for the given key.
+        """
+        spawned: Chaos = self.copy()
+        spawned._reseed(self._xn._rational, key)
+        return spawned
+
+    def _reseed(self, rational: Fraction, key: int) -> Self:
+        # SplitMix64 mixing of the state and the key, keeps the seed in a sane range
+        seed: int = splitmix64( splitmix64(rational.numerator ^ rational.denominator << 32) ^ splitmix64(key) ) >> 48
+        self << ra.Xn(seed)
+        self._x0 << self._xn
+        self._initiated = False
+        self._index     = -1
+        if isinstance(self._next_operand, Chaos):
+            self._next_operand._reseed(rational, key + 1)
+        return self
+
     def __str__(self) -> str:
         return f'{self._index + 1}: {self._xn % float()}'
     
@@ -359,6 +437,21 @@ class Sequence(Chaos):
         result: Fraction = previous_result + self._steps
         return result
 
+    def _batch_numerators(self, *rationals: Fraction) -> tuple[int, ...] | None:
+        """Converts the rationals to numerators of a common denominator, the last element"""
+        denominator: int = math.lcm(*(rational.denominator for rational in rationals))
+        if denominator > ra.Result._limit_denominator > 0:
+            return None # Results would be denominator limited, so, not exact
+        return *(rational.numerator * (denominator // rational.denominator) for rational in rationals), denominator
+
+    def _batch_results(self, n: int, index: int) -> array | None:
+        numerators = self._batch_numerators(self._xn._rational, self._steps)
+        if numerators is None:
+            return None
+        xn, steps, denominator = numerators
+        self._xn._rational = Fraction(xn + n * steps, denominator)
+        return array('d', ((xn + k * steps) / denominator for k in range(1, n + 1)))
+
 
 class Cycle(Sequence):
     """`Chaos -> Sequence -> Cycle`
@@ -429,6 +522,14 @@ class Cycle(Sequence):
         result %= self._modulus
         return result
 
+    def _batch_results(self, n: int, index: int) -> array | None:
+        numerators = self._batch_numerators(self._xn._rational, self._steps, self._modulus)
+        if numerators is None:
+            return None
+        xn, steps, modulus, denominator = numerators
+        self._xn._rational = Fraction((xn + n * steps) % modulus, denominator)
+        return array('d', ((xn + k * steps) % modulus / denominator for k in range(1, n + 1)))
+
 class Counter(Sequence):
     """`Chaos -> Sequence -> Counter`
 
@@ -477,6 +578,20 @@ class Ripple(Sequence):
                 result += self._steps
         return result
 
+    def _batch_results(self, n: int, index: int) -> array | None:
+        numerators = self._batch_numerators(self._xn._rational, self._steps)
+        if numerators is None:
+            return None
+        xn, steps, denominator = numerators
+        results: array = array('d')
+        for actual_index in range(index, index + n):
+            xn = -xn
+            if actual_index % 2:
+                xn = xn - steps if xn < 0 else xn + steps
+            results.append(xn / denominator)
+        self._xn._rational = Fraction(xn, denominator)
+        return results
+
 class Spiral(Sequence):
     """`Chaos -> Sequence -> Spiral`
 
@@ -498,6 +613,19 @@ class Spiral(Sequence):
             result += self._steps
         return result
 
+    def _batch_results(self, n: int, index: int) -> array | None:
+        numerators = self._batch_numerators(self._xn._rational, self._steps)
+        if numerators is None:
+            return None
+        xn, steps, denominator = numerators
+        results: array = array('d')
+        for _ in range(n):
+            xn = -xn
+            xn = xn - steps if xn < 0 else xn + steps
+            results.append(xn / denominator)
+        self._xn._rational = Fraction(xn, denominator)
+        return results
+
 
 class SinX(Chaos):
     """`Chaos -> SinX`
@@ -568,6 +696,20 @@ class SinX(Chaos):
     def _next_result(self, previous_result: Fraction) -> Fraction:
         return ra.Result(float(previous_result) + float(self._lambda._rational) * math.sin(float(previous_result)))._rational
 
+    def _batch_results(self, n: int, index: int) -> array | None:
+        # Each step is denominator limited like the scalar path, so it can't be a closed form
+        check_denominator = ra.Result().check_denominator
+        lambda_float: float = float(self._lambda._rational)
+        sin = math.sin
+        xn: Fraction = self._xn._rational
+        results: array = array('d')
+        for _ in range(n):
+            xn_float: float = float(xn)
+            xn = check_denominator(Fraction(xn_float + lambda_float * sin(xn_float)))
+            results.append(float(xn))
+        self._xn._rational = xn
+        return results
+
 
 
 
@@ -739,6 +881,25 @@ class Bouncer(Chaos):
             print(f"Warning: {self.__class__.__name__} Chaos couldn't be tamed!")
         return result, tamed
 
+    def _batch_value(self) -> float:
+        return float(self % od.Pipe(Fraction()))
+
+    def _batch_results(self, n: int, index: int) -> array | None:
+        rationals: tuple[Fraction, ...] = (self._xn._rational, self._yn._rational, self._dx._rational, self._dy._rational,
+                                           self._width._rational, self._height._rational)
+        denominator: int = math.lcm(*(rational.denominator for rational in rationals))
+        position_x, position_y, dx, dy, width, height = (rational.numerator * (denominator // rational.denominator) for rational in rationals)
+        check_denominator = ra.Result().check_denominator
+        hypot = math.hypot
+        results: array = array('d')
+        for _ in range(n):
+            position_x = (position_x + dx) % width
+            position_y = (position_y + dy) % height
+            results.append(float(check_denominator(Fraction(hypot(position_x / denominator, position_y / denominator)))))
+        self._xn._rational = Fraction(position_x, denominator)
+        self._yn._rational = Fraction(position_y, denominator)
+        return results
+
     def __str__(self) -> str:
         return f'{self._index + 1}: {self % tuple()}'
     
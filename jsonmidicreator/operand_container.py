@@ -15,9 +15,14 @@ https://github.com/ruiseixasm/JsonMidiPlayer
 '''
 # Example using typing.Union (compatible with Python < 3.10)
 from typing import Union, TypeVar, TYPE_CHECKING, Type, Callable, List, Tuple, Optional, Any, Generic
-from typing import Self, cast
+from typing import Self, cast, Iterator
 
 from fractions import Fraction
+from array import array
+from contextlib import contextmanager
+import bisect
+import heapq
+import itertools
 import json
 import enum
 import math
@@ -39,6 +44,157 @@ from . import operand_chaos as ch
 
 TypeContainer = TypeVar('TypeContainer', bound='Container')  # TypeContainer represents any subclass of Operand
 
+# The bits of each byte value as booleans, the least significant bit first
+_byte_bits: tuple[tuple[bool, ...], ...] = tuple(
+    tuple(byte_value >> bit & 1 == 1 for bit in range(8)) for byte_value in range(256)
+)
+
+
+def _channel_pitch(note: 'oe.Note') -> int:
+    """
+    Returns the key that identifies the `Note` sounding MIDI key, its channel and absolute pitch.
+    """
+    return note._channel_0 << 8 | note._pitch.get_absolute_pitch()
+
+
+def _in_items(items: list) -> Callable[[Any], bool]:
+    """
+    Returns a function equivalent to `single_item in items` that looks up the items by id first. Because two \
+        `Element` of the same class are only equal if their position and duration are the same, each one is \
+        only compared with the items of its class with the same position and duration.
+    """
+    item_ids: set[int] = {id(item) for item in items}
+    same_class_items: dict[tuple, list] = {}
+    for item in items:
+        if isinstance(item, oe.Element):
+            same_class_items.setdefault((type(item), item._position_beats, item._duration_beats), []).append(item)
+    other_class_items: dict[type, list] = {}
+
+    def in_items(single_item: Any) -> bool:
+        if id(single_item) in item_ids:
+            return True
+        if not isinstance(single_item, oe.Element):
+            return any(item == single_item for item in items)
+        item_class: type = type(single_item)
+        if item_class not in other_class_items:
+            other_class_items[item_class] = [item for item in items if type(item) is not item_class]
+        return any(
+            item == single_item for item in same_class_items.get(
+                (item_class, single_item._position_beats, single_item._duration_beats), ()
+            )
+        ) or any(item == single_item for item in other_class_items[item_class])
+
+    return in_items
+
+
+class IntervalIndex:
+    """
+    Snapshot of the time span of a list of `Element` for range queries. The elements are kept sorted by \
+        their start with a max tree of their finishes on top, so that the elements sounding at a position or \
+        overlapping a window are found in O(log n + k) instead of scanning all the elements.
+
+    The index doesn't follow later changes of the elements, so it shall be rebuilt once they are edited.
+
+    Args:
+        elements (list): The elements to be indexed.
+    """
+    def __init__(self, elements: list['oe.Element']):
+        self._elements: list[oe.Element] = sorted(
+            (single_element for single_element in elements if isinstance(single_element, oe.Element)),
+            key=lambda single_element: single_element._position_beats
+        )
+        self._starts: list[Fraction] = [single_element._position_beats for single_element in self._elements]
+        finishes: list[Fraction] = [
+            single_element._position_beats + single_element._duration_beats for single_element in self._elements
+        ]
+        self._size: int = 1 << max(len(finishes) - 1, 0).bit_length()
+        # Implicit binary tree where each node keeps the maximum finish of its leaves
+        self._max_finishes: list[Fraction | None] = [None] * self._size + finishes + [None] * (self._size - len(finishes))
+        for node in range(self._size - 1, 0, -1):
+            left_finish: Fraction | None = self._max_finishes[2 * node]
+            right_finish: Fraction | None = self._max_finishes[2 * node + 1]
+            self._max_finishes[node] = left_finish if right_finish is None \
+                or left_finish is not None and left_finish >= right_finish else right_finish
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def _finishing_after(self, total_leaves: int, after_beats: Fraction) -> list['oe.Element']:
+        # Descends only on the sub trees of the first `total_leaves` that finish after `after_beats`
+        elements: list[oe.Element] = []
+        nodes: list[tuple[int, int, int]] = [(1, 0, self._size)]
+        while nodes:
+            node, first_leaf, node_leaves = nodes.pop()
+            if first_leaf >= total_leaves:
+                continue
+            max_finish: Fraction | None = self._max_finishes[node]
+            if max_finish is None or max_finish <= after_beats:
+                continue
+            if node_leaves == 1:
+                elements.append(self._elements[first_leaf])
+            else:
+                half_leaves: int = node_leaves // 2
+                nodes.append((2 * node + 1, first_leaf + half_leaves, half_leaves))
+                nodes.append((2 * node, first_leaf, half_leaves))   # Left first keeps the start order
+        return elements
+
+    def _at_beats(self, position_beats: Fraction) -> list['oe.Element']:
+        return self._finishing_after(bisect.bisect_right(self._starts, position_beats), position_beats)
+
+    def _overlapping_beats(self, start_beats: Fraction, finish_beats: Fraction) -> list['oe.Element']:
+        if finish_beats <= start_beats:
+            return []
+        return self._finishing_after(bisect.bisect_left(self._starts, finish_beats), start_beats)
+
+    def _starting_beats(self, start_beats: Fraction, finish_beats: Fraction) -> list['oe.Element']:
+        return self._elements[
+            bisect.bisect_left(self._starts, start_beats):bisect.bisect_left(self._starts, finish_beats)
+        ]
+
+    def at(self, position: 'ra.Position') -> list['oe.Element']:
+        """
+        Gets the elements sounding at the given position, those with `start <= position < finish`.
+
+        Args:
+            position (Position): The position to look at.
+
+        Returns:
+            list: The elements sorted by their start.
+        """
+        return self._at_beats(position._rational)
+
+    def overlapping(self, start: 'ra.Position', finish: 'ra.Position') -> list['oe.Element']:
+        """
+        Gets the elements overlapping the window `[start, finish)`.
+
+        Args:
+            start (Position): The start of the window.
+            finish (Position): The finish of the window, not included.
+
+        Returns:
+            list: The elements sorted by their start.
+        """
+        return self._overlapping_beats(start._rational, finish._rational)
+
+    def starting(self, start: 'ra.Position', finish: 'ra.Position') -> list['oe.Element']:
+        """
+        Gets the elements starting inside the window `[start, finish)`.
+
+        Args:
+            start (Position): The start of the window.
+            finish (Position): The finish of the window, not included.
+
+        Returns:
+            list: The elements sorted by their start.
+        """
+        return self._starting_beats(start._rational, finish._rational)
+
+    def finish(self) -> Fraction | None:
+        """
+        Gets the maximum finish in beats of all the indexed elements, or None if there are none.
+        """
+        return self._max_finishes[1] if self._elements else None
+
 
 class Container(o.Operand):
     """`Container`
@@ -54,17 +210,79 @@ class Container(o.Operand):
     def __init__(self, *operands):
         super().__init__()
         self._items: list = []
+        self._dirty: bool = False   # Sorting of `_items` is pending
         self._items_iterator: int = 0
         self._upper_container: Container | None = None
+        self._batch_depth: int = 0
         for single_operand in operands:
             self << single_operand
 
+    @property
+    def _items(self) -> list:
+        # The list is always kept in `__dict__`, only its sorting is deferred until it's needed
+        if self._dirty:
+            self._clean_items()
+        return self.__dict__["_items"]
+
+    @_items.setter
+    def _items(self, items: list):
+        self.__dict__["_items"] = items
+        self._dirty = False
+
+    def _clean_items(self):
+        """
+        Does the pending sorting of the items flagged by `_dirty`.
+        """
+        self.__dict__["_items"].sort()
+        self._dirty = False
+
     def unmasked_items(self) -> list[Any]:
         return [
             item for item in self._items
             if not isinstance(item, o.Operand) or not item._masked
         ]
 
+    def iter_unmasked_items(self) -> Iterator[Any]:
+        """
+        Iterates over the unmasked items without copying them into a new list like `unmasked_items` does. \
+            The items can't be added or removed while iterating.
+        """
+        for item in self._items:
+            if not isinstance(item, o.Operand) or not item._masked:
+                yield item
+
+    def mask_bits(self) -> int:
+        """
+        Returns the mask as the bits of an `int`, where the nth bit is set if the nth item, \
+            masked ones included, is masked.
+        """
+        # Set byte by byte, the first item being the least significant bit
+        mask_bytes = bytearray((len(self._items) + 7) // 8)
+        for index, item in enumerate(self._items):
+            if isinstance(item, o.Operand) and item._masked:
+                mask_bytes[index >> 3] |= 1 << (index & 7)
+        return int.from_bytes(mask_bytes, "little")
+
+    def set_mask_bits(self, mask_bits: int) -> Self:
+        """
+        Masks the items with their bit set and unmasks all the other ones. Masks given by `mask_bits` \
+            can be composed with `|` (union), `&` (intersection) and `~` (complement) before being set.
+
+        Args:
+            mask_bits (int): The bits of the items to be masked, the nth bit for the nth item.
+
+        Returns:
+            Container: The same self object with the given mask.
+        """
+        total_items: int = len(self._items)
+        # Bits beyond the items are dropped, so, complements (negative ints) become positive ones
+        mask_bytes: bytes = (mask_bits & ((1 << total_items) - 1)).to_bytes((total_items + 7) // 8, "little")
+        items_masked: Iterator[bool] = itertools.chain.from_iterable(_byte_bits[mask_byte] for mask_byte in mask_bytes)
+        for item, item_masked in zip(self._items, items_masked):
+            if isinstance(item, o.Operand):
+                item._masked = item_masked
+        return self
+
 
     def __getitem__(self, index: Any) -> any:
         unmasked_items: list = self.unmasked_items()
@@ -73,10 +291,10 @@ class Container(o.Operand):
                 index._set_inside_container(self)
                 new_container = self.empty_copy()
                 new_container._upper_container = self
-                for single_item in unmasked_items:
-                    frame_result = index.frame(single_item)
-                    if single_item == frame_result:
-                        new_container._append(single_item)
+                new_container._extend([
+                    single_item for single_item, framed in zip(unmasked_items, self._frame_mask(index, unmasked_items))
+                    if framed
+                ])
                 return new_container
             case ch.Chaos():
                 new_container = self.empty_copy()
@@ -150,31 +368,52 @@ class Container(o.Operand):
             raise StopIteration
 
 
+    def _frame_mask(self, frame: 'of.Frame', items: list) -> list[bool]:
+        """
+        Returns if each item is selected by the frame, evaluated at once for the whole chain whenever \
+            its Frames allow it, otherwise framed one item at a time.
+        """
+        frame_mask: list[bool] | None = frame.frame_mask(items)
+        if frame_mask is None:
+            frame_mask = [single_item == frame.frame(single_item) for single_item in items]
+        return frame_mask
+
     def _item_index(self, item: Any) -> int | None:
         """
         Returns the index of a given item by its id or `None` if nonexistent in the unmasked list.
         """
-        for index, single_item in enumerate(self.unmasked_items()):
+        for index, single_item in enumerate(self.iter_unmasked_items()):
             if item is single_item:
                 return index
         return None
 
+    # Position of each item by its id, rebuilt only when found out of date
+    _identity_index: dict[int, int] | None = None
+
+    def _identity_position(self, item: Any) -> int | None:
+        """
+        Returns the position of the given item in `self._items` by its id or `None` if nonexistent.
+        The index is validated on each lookup, so, it's rebuilt lazily after any change of `self._items`.
+        """
+        items: list = self._items
+        if self._identity_index is not None:
+            item_position: int | None = self._identity_index.get(id(item))
+            if item_position is not None and item_position < len(items) and items[item_position] is item:
+                return item_position
+        identity_index: dict[int, int] = {}
+        for index, single_item in enumerate(items):
+            identity_index.setdefault(id(single_item), index)
+        self._identity_index = identity_index
+        return identity_index.get(id(item))
+
     def _previous_item(self, item: Any) -> Any:
-        item_index: int = None
-        for index, single_item in enumerate(self._items):
-            if single_item is item:
-                item_index = index
-                break
+        item_index: int | None = self._identity_position(item)
         if item_index is not None and item_index > 0:
             return self._items[item_index - 1]
         return None
 
     def _next_item(self, item: Any) -> Any:
-        item_index: int = None
-        for index, single_item in enumerate(self._items):
-            if single_item is item:
-                item_index = index
-                break
+        item_index: int | None = self._identity_position(item)
         if item_index is not None and item_index < len(self._items) - 1:
             return self._items[item_index + 1]
         return None
@@ -211,15 +450,17 @@ class Container(o.Operand):
         else:
             if by_id:
                 # removes by id instead
+                item_ids: set[int] = {id(item) for item in items}
                 self._items = [
                     single_item for single_item in self._items
-                    if not any(single_item is item for item in items)
+                    if id(single_item) not in item_ids
                 ]
             else:
                 # Uses "==" instead of id
+                in_items: Callable[[Any], bool] = _in_items(items)
                 self._items = [
                     single_item for single_item in self._items
-                    if single_item not in items
+                    if not in_items(single_item)
                 ]
         if self._upper_container is not None:   # Recursive call
             self._upper_container._delete(items, by_id)
@@ -241,26 +482,20 @@ class Container(o.Operand):
 
 
     def _replace(self, old_item: Any = None, new_item: Any = None) -> Self:
-        for index, item in enumerate(self._items):
-            if old_item is item:
-                self._items[index] = new_item
-                break   # There is no repeated items
+        old_index: int | None = self._identity_position(old_item)
+        if old_index is not None:   # There is no repeated items
+            self._items[old_index] = new_item
+            self._identity_index[id(new_item)] = old_index
         if self._upper_container is not None:   # Recursive call
             self._upper_container._replace(old_item, new_item)
         return self
 
 
     def _swap(self, left_item: Any = None, right_item: Any = None) -> Self:
-        first_index: int = None
-        for index, item in enumerate(self._items):
-            if item is left_item or item is right_item:
-                if first_index is None:
-                    first_index = index
-                else:
-                    temp_item: Any = self._items[first_index]
-                    self._items[first_index] = self._items[index]
-                    self._items[index] = temp_item
-                    break
+        left_index: int | None = self._identity_position(left_item)
+        right_index: int | None = self._identity_position(right_item)
+        if left_index is not None and right_index is not None:
+            self._items[left_index], self._items[right_index] = self._items[right_index], self._items[left_index]
         if self._upper_container is not None:   # Recursive call
             self._upper_container._swap(left_item, right_item)
         return self
@@ -268,11 +503,52 @@ class Container(o.Operand):
 
     def _sort_items(self) -> Self:
         # This works with a list method sort (Operands implement __lt__ and __gt__)
-        self._items.sort()
+        if self._batch_depth > 0:
+            return self # Sorted once at the end of the batch
+        self._dirty = True  # Defers the sorting until `_items` is needed again
         if self._upper_container is not None:   # Recursive call
             self._upper_container.sort()
         return self
 
+    def _insort(self, item: Any) -> Self:
+        """
+        Adds a single new item while keeping the sorting with a binary search insertion.
+        """
+        if self._batch_depth > 0:
+            self._items.append(item)    # Sorted once at the end of the batch
+        elif self._dirty:
+            self.__dict__["_items"].append(item)    # Already pending sorting
+        else:
+            bisect.insort(self._items, item)    # Same place as an append followed by a stable sort
+        if self._upper_container is not None:   # Recursive call
+            self._upper_container._extend([ item ])
+            if self._batch_depth == 0:
+                self._upper_container.sort()
+        return self
+
+    def _end_batch(self) -> Self:
+        return self._sort_items()
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that suspends the sorting of the items until its exit, allowing
+        the efficient adding of many items one by one, like `with clip.batch(): ...`.
+
+        Args:
+            None
+
+        Returns:
+            Container: The same self object to be used inside the context.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._end_batch()
+
     def _is_sorted(self) -> bool:
         items_copy_sorted = self._items.copy()
         if self._items != sorted(items_copy_sorted):
@@ -308,8 +584,8 @@ class Container(o.Operand):
         if include_masked:
             if self._items:
                 first_item = self._items[0]
-        elif self.unmasked_items():
-            first_item = self.unmasked_items()[0]
+        else:
+            first_item = next(self.iter_unmasked_items(), None)
         return first_item
 
     def last(self, include_masked: bool = False) -> Any:
@@ -326,8 +602,11 @@ class Container(o.Operand):
         if include_masked:
             if self._items:
                 last_item = self._items[-1]
-        elif self.unmasked_items():
-            last_item = self.unmasked_items()[-1]
+        else:
+            for item in reversed(self._items):
+                if not isinstance(item, o.Operand) or not item._masked:
+                    last_item = item
+                    break
         return last_item
 
     def __eq__(self, other: any) -> bool:
@@ -449,6 +728,8 @@ class Container(o.Operand):
             case _:
                 return super().__mod__(operand)
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("items", "_items"),)
+
     def getSerialization(self) -> dict:
         """
         Returns the serialization in a form of a dictionary of `Container` parameters.
@@ -971,10 +1252,9 @@ class Container(o.Operand):
                                 new_mask.append(any(single_item == cond_item for cond_item in single_condition))
                     case of.Frame():
                         single_condition._set_inside_container(self)
-                        for single_item in self._items:
-                            if isinstance(single_item, o.Operand):
-                                framed_result = single_condition.frame(single_item)
-                                new_mask.append(single_item == framed_result)
+                        new_mask.extend(self._frame_mask(single_condition, [
+                            single_item for single_item in self._items if isinstance(single_item, o.Operand)
+                        ]))
                     case ch.Chaos():
                         for single_item in self._items:
                             if isinstance(single_item, o.Operand):
@@ -1003,9 +1283,10 @@ class Container(o.Operand):
                             if isinstance(single_item, o.Operand):
                                 new_mask.append(single_item == single_condition)
             # Finally apply the mask
+            new_mask_iterator = iter(new_mask)  # Takes the first bools in order
             for single_item in self._items:
                 if isinstance(single_item, o.Operand):
-                    single_item._masked = new_mask.pop(0)   # Pops the first bool each time
+                    single_item._masked = next(new_mask_iterator)
         return self
 
 
@@ -1058,9 +1339,10 @@ class Container(o.Operand):
                         )
                     case of.Frame():
                         single_condition._set_inside_container(self)
-                        for single_item in self._items:
-                            if not single_item == single_condition.frame(single_item):
-                                excluded_item_ids.add(id(single_item))
+                        excluded_item_ids.update(
+                            id(single_item) for single_item, framed
+                            in zip(self._items, self._frame_mask(single_condition, self._items)) if not framed
+                        )
                     case ch.Chaos():
                         for single_item in self._items:
                             chaotic_result = single_condition.chaoticize()
@@ -1468,6 +1750,8 @@ class Composition(Container):
     def getMidilist(self, position_beats: Fraction | None = None) -> list[dict]:
         return []
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("name", "_name"), ("time_signature", "_time_signature"))
+
     def getSerialization(self) -> dict:
         """
         Returns the serialization in a form of a dictionary of `Clip` parameters.
@@ -1547,7 +1831,7 @@ class Composition(Container):
             case od.Pipe():
                 match operand._data:
                     case og.TimeSignature():
-                        self._time_signature = operand._data
+                        self._time_signature = operand._data.copy()   # Never a shared one
                     case _:                 super().__lshift__(operand)
 
             case od.Name():
@@ -1679,6 +1963,8 @@ class Clip(Composition):  # Just a container of Elements
         self._devices: list[str]        = og.settings._devices.copy()
         self._track_number: int         = 1 # Only useful to render .midi files
         self._auto: bool                = False
+        self._columns: dict[str, array] | None = None   # Columnar storage, see `columnar()`
+        self._columns_values: list[Any] | None = None   # Values referred by index in the columns
         self._items: list[oe.Element]   = []
         for single_operand in operands:
             self << single_operand
@@ -1715,13 +2001,30 @@ class Clip(Composition):  # Just a container of Elements
         return super().__next__()
 
     def _sort_items(self) -> Self:
+        if self._batch_depth > 0:
+            return self # Sorted once at the end of the batch
         super()._sort_items()
+        return self._auto_fit()
+
+    def _insort(self, item: Any) -> Self:
+        if self.is_columnar():
+            self._materialize_columns()
+        super()._insort(item)
+        if self._batch_depth > 0:
+            return self
+        return self._auto_fit()
+
+    def _auto_fit(self) -> Self:
         if self._auto:  # Does auto formatting
             self.fit()
             if self._upper_container is not None:   # Recursive call
                 self._upper_container.fit() # upper container is a Clip too
         return self
 
+    def _end_batch(self) -> Self:
+        self._set_owner_clip()
+        return self._sort_items()
+
 
     def _replace(self, old_item: Any = None, new_item: Any = None) -> Self:
         if isinstance(new_item, oe.Element):
@@ -1735,6 +2038,8 @@ class Clip(Composition):  # Just a container of Elements
         with a shallow `Clip`.
         """
         if owner_clip is None:
+            if self._batch_depth > 0:
+                return self # Set once at the end of the batch
             for single_element in self._items:
                 single_element._set_owner_clip(self)
         elif isinstance(owner_clip, Clip):
@@ -1753,10 +2058,309 @@ class Clip(Composition):  # Just a container of Elements
         return True
 
 
+    # COLUMNAR STORAGE
+
+    # Column name, array typecode
+    _columns_typecodes: tuple[tuple[str, str], ...] = (
+        ("position", 'q'),          # Ticks
+        ("duration", 'q'),          # Ticks
+        ("pitch", 'h'),
+        ("velocity", 'h'),
+        ("channel", 'h'),           # 0 based
+        ("gate_numerator", 'q'),
+        ("gate_denominator", 'q'),
+        ("enabled", 'b'),
+        ("masked", 'b'),
+        # The remaining `Note` state, so that it's materialized exactly as it was
+        ("time_signature", 'h'),    # Index in `_columns_values`
+        ("key_signature", 'h'),     # Index in `_columns_values`
+        ("tonic_key", 'h'),
+        ("octave_0", 'h'),
+        ("degree_0", 'h'),
+        ("accidental", 'h'),
+        ("transposition", 'h'),
+        ("scale", 'h')              # Index in `_columns_values`
+    )
+
+    @Container._items.setter
+    def _items(self, items: list):
+        self._columns = None    # Any columnar storage is outdated by the new `_items`
+        Container._items.fset(self, items)
+
+    def _clean_items(self):
+        if self._columns is not None:   # `_items` was released by the columnar storage
+            self._materialize_columns()
+        else:
+            super()._clean_items()
+
+    def is_columnar(self) -> bool:
+        """
+        Returns True if the `Clip` elements are kept in the columnar storage and not as `Element` objects.
+        """
+        return self._columns is not None
+
+    def columnar(self) -> Self:
+        """
+        Moves the `Clip` elements into a columnar storage of parallel `array` columns, namely,
+        Position and Duration in integer ticks, Pitch, Velocity, Channel, Gate, Enable and Mask,
+        besides the `TimeSignature` and the `Pitch` state, like its `KeySignature`, `Degree` and `Scale`.
+        The `Note` objects are only materialized again when the elements are accessed, while
+        `getPlaylist`, `getMidilist`, `len`, `stack`, `fit` and `quantize` are processed
+        as column passes. Only applicable to a `Clip` of plain, untied `Note` elements
+        placed in the integer tick grid, otherwise the `Clip` is kept as is.
+
+        Args:
+            None
+
+        Returns:
+            Clip: The same self object, in columnar storage if applicable.
+        """
+        if self.is_columnar():
+            return self
+        columns: dict[str, array] = {
+            column_name: array(typecode) for column_name, typecode in self._columns_typecodes
+        }
+        # Shared and list values are kept once and referred by their index
+        columns_values: list[Any] = []
+        values_indexes: dict[Any, int] = {}
+        def value_index(value: Any, value_key: Any) -> int:
+            if value_key not in values_indexes:
+                values_indexes[value_key] = len(columns_values)
+                columns_values.append(value)
+            return values_indexes[value_key]
+        for single_element in self._items:
+            if type(single_element) is not oe.Note or single_element._tied or single_element._note_effect is not None \
+                    or single_element._next_operand is not None or single_element._pitch._next_operand is not None:
+                return self
+            single_pitch: og.Pitch = single_element._pitch
+            position_ticks: int | None = o.beats_to_ticks(single_element._position_beats)
+            duration_ticks: int | None = o.beats_to_ticks(single_element._duration_beats)
+            if position_ticks is None or duration_ticks is None:
+                return self
+            try:
+                columns["position"].append(position_ticks)
+                columns["duration"].append(duration_ticks)
+                columns["pitch"].append(single_element._pitch.get_absolute_pitch())
+                columns["velocity"].append(single_element._velocity)
+                columns["channel"].append(single_element._channel_0)
+                columns["gate_numerator"].append(single_element._gate.numerator)
+                columns["gate_denominator"].append(single_element._gate.denominator)
+                columns["enabled"].append(single_element._enabled)
+                columns["masked"].append(single_element._masked)
+                time_signature: og.TimeSignature = og.shared_time_signature(single_element._time_signature)
+                columns["time_signature"].append(value_index(time_signature, id(time_signature)))
+                key_signature: ou.KeySignature = ou.shared_key_signature(single_pitch._key_signature)
+                columns["key_signature"].append(value_index(key_signature, id(key_signature)))
+                columns["tonic_key"].append(single_pitch._tonic_key)
+                columns["octave_0"].append(single_pitch._octave_0)
+                columns["degree_0"].append(single_pitch._degree_0)
+                columns["accidental"].append(single_pitch._accidental)
+                columns["transposition"].append(single_pitch._transposition)
+                scale: tuple[int, ...] = tuple(single_pitch._scale)
+                columns["scale"].append(value_index(scale, scale))
+            except (OverflowError, TypeError):  # Out of the columns range or type
+                return self
+        self._items = []    # Released until the elements are accessed again
+        self._columns = columns
+        self._columns_values = columns_values
+        self._dirty = True
+        return self
+
+    def cache_render(self, enabled: bool = True) -> Self:
+        """
+        Enables or disables the render cache of all the `Clip` elements, so that on each new render,
+        like the ones of a `Plot` or `plot_iterations`, only the changed elements are fully rendered again.
+
+        Args:
+            enabled (bool): Enables the cache if `True` and drops it if `False`.
+
+        Returns:
+            Clip: The same self object.
+        """
+        for single_element in self._items:
+            single_element.cache_render(enabled)
+        return self
+
+    def _materialize_columns(self) -> list['oe.Element']:
+        """
+        Materializes the columnar storage back into `Note` objects owned by this `Clip`.
+        """
+        sorted_rows: list[int] = self._columns_sorted_rows()
+        columns: dict[str, array] = self._columns
+        columns_values: list[Any] = self._columns_values
+        self._items = []    # Also drops the columnar storage
+        self._columns_values = None
+        for position_ticks, duration_ticks, _, velocity, channel_0, gate_numerator, gate_denominator, enabled, masked, \
+                time_signature, key_signature, tonic_key, octave_0, degree_0, accidental, transposition, scale \
+                in zip(*([ columns[column_name][row] for row in sorted_rows ] for column_name, _ in self._columns_typecodes)):
+            new_note: oe.Note = oe.Note()
+            new_note._position_beats = Fraction(position_ticks, o.TICKS_PER_BEAT)
+            new_note._duration_beats = Fraction(duration_ticks, o.TICKS_PER_BEAT)
+            new_note._time_signature = columns_values[time_signature]
+            new_pitch: og.Pitch = new_note._pitch
+            new_pitch._key_signature = columns_values[key_signature]
+            new_pitch._tonic_key = tonic_key
+            new_pitch._octave_0 = octave_0
+            new_pitch._degree_0 = degree_0
+            new_pitch._accidental = accidental
+            new_pitch._transposition = transposition
+            new_pitch._scale = list(columns_values[scale])
+            new_note._velocity = velocity
+            new_note._channel_0 = channel_0
+            new_note._gate = Fraction(gate_numerator, gate_denominator)
+            new_note._enabled = bool(enabled)
+            new_note._masked = bool(masked)
+            new_note._owner_clip = self
+            self.__dict__["_items"].append(new_note)
+        return self.__dict__["_items"]
+
+    def len(self, include_masked: bool = False) -> int:
+        if self.is_columnar():
+            if include_masked:
+                return len(self._columns["masked"])
+            return self._columns["masked"].count(0)
+        return super().len(include_masked)
+
+    def _columns_quantize(self, quantization_ticks: int, quantize_duration: bool) -> Self:
+        # Same as a full amount `quantize`, a tie rounds half to even, so, it rounds down
+        positions: array = self._columns["position"]
+        durations: array = self._columns["duration"]
+        for row, masked in enumerate(self._columns["masked"]):
+            if masked:
+                continue
+            unquantized_ticks: int = positions[row] % quantization_ticks
+            if 2 * unquantized_ticks > quantization_ticks:
+                positions[row] += quantization_ticks - unquantized_ticks
+            else:
+                positions[row] -= unquantized_ticks
+            if quantize_duration:
+                unquantized_ticks = (positions[row] + durations[row]) % quantization_ticks
+                if 2 * unquantized_ticks > quantization_ticks:
+                    durations[row] += quantization_ticks - unquantized_ticks
+                else:
+                    durations[row] -= unquantized_ticks
+                while durations[row] <= 0:
+                    durations[row] += quantization_ticks
+        return self
+
+    def _columns_sorted_rows(self) -> list[int]:
+        """
+        Returns the rows indexes in the same order of the `Note` sorting.
+        """
+        positions: array = self._columns["position"]
+        durations: array = self._columns["duration"]
+        pitches: array = self._columns["pitch"]
+        channels: array = self._columns["channel"]
+        return sorted(
+            range(len(positions)), key=lambda row: (positions[row], pitches[row], -durations[row], channels[row])
+        )
+
+    @staticmethod
+    def _columns_row_is_clipped(position_ticks: int, duration_ticks: int, pitch: int, velocity: int, channel_0: int) -> bool:
+        # Same as `Note.is_clipped`
+        return position_ticks < 0 or duration_ticks <= 0 \
+            or channel_0 < 0 or channel_0 > 16 \
+            or velocity < 0 or velocity > 128 \
+            or pitch < 0 or pitch > 128
+
+    def _columns_playlist(self, offset_ticks: int) -> list[dict]:
+        columns: dict[str, array] = self._columns
+        tempo: Fraction = og.settings._tempo
+        tempo_map: og.TempoMap | None = og.settings._tempo_map
+        self_playlist: list[dict] = []
+        for row in self._columns_sorted_rows():
+            if not columns["enabled"][row]:
+                continue
+            position_ticks: int = columns["position"][row]
+            duration_ticks: int = columns["duration"][row]
+            absolute_position_ticks: int = offset_ticks + position_ticks
+            if absolute_position_ticks < 0 or duration_ticks <= 0:
+                continue
+            pitch_int: int = columns["pitch"][row]
+            velocity: int = columns["velocity"][row]
+            channel_0: int = columns["channel"][row]
+            if self._columns_row_is_clipped(position_ticks, duration_ticks, pitch_int, velocity, channel_0):
+                continue
+            gate_numerator: int = columns["gate_numerator"][row]
+            gate_denominator: int = columns["gate_denominator"][row]
+            off_ticks: int = absolute_position_ticks * gate_denominator + duration_ticks * gate_numerator
+            if tempo_map is None:
+                note_on_ms: float = o.ticks_to_time_ms(absolute_position_ticks, tempo)
+                note_off_ms: float = o.ticks_to_time_ms(off_ticks, tempo, gate_denominator)
+            else:
+                note_on_ms: float = tempo_map.ticks_to_time_ms(absolute_position_ticks)
+                note_off_ms: float = tempo_map.ticks_to_time_ms(off_ticks, gate_denominator)
+            self_playlist.append(
+                {
+                    "time_ms": note_on_ms,
+                    "midi_message": {
+                        "status_byte": 0x90 | channel_0,
+                        "data_byte_1": pitch_int,
+                        "data_byte_2": velocity
+                    }
+                }
+            )
+            self_playlist.append(
+                {
+                    "time_ms": note_off_ms,
+                    "midi_message": {
+                        "status_byte": 0x80 | channel_0,
+                        "data_byte_1": pitch_int,
+                        "data_byte_2": 0
+                    }
+                }
+            )
+        return self_playlist
+
+    def _columns_midilist(self, offset_ticks: int) -> list[dict]:
+        columns: dict[str, array] = self._columns
+        self_numerator: int = self._time_signature._top
+        self_denominator: int = self._time_signature._bottom
+        self_tempo: float = float(og.settings._tempo)
+        tempo_map: og.TempoMap | None = og.settings._tempo_map
+        self_midilist: list[dict] = []
+        for row in self._columns_sorted_rows():
+            if not columns["enabled"][row]:
+                continue
+            position_ticks: int = columns["position"][row]
+            duration_ticks: int = columns["duration"][row]
+            self_duration: float = o.ticks_to_beats(
+                duration_ticks * columns["gate_numerator"][row], columns["gate_denominator"][row]
+            )
+            if self_duration == 0:
+                continue
+            pitch_int: int = columns["pitch"][row]
+            velocity: int = columns["velocity"][row]
+            channel_0: int = columns["channel"][row]
+            if self._columns_row_is_clipped(position_ticks, duration_ticks, pitch_int, velocity, channel_0):
+                continue
+            absolute_position_ticks: int = offset_ticks + position_ticks
+            if tempo_map is not None:
+                self_tempo = tempo_map.tempo_at(o.ticks_to_beats(absolute_position_ticks))
+            # Same keys order as `Note.getMidilist`
+            self_midilist.append(
+                {
+                    "event":        "Note",
+                    "track":        self._track_number - 1,
+                    "track_name":   self._name,
+                    "numerator":    self_numerator,
+                    "denominator":  self_denominator,
+                    "time":         o.ticks_to_beats(absolute_position_ticks),
+                    "duration":     self_duration,
+                    "tempo":        self_tempo,
+                    "channel":      channel_0,
+                    "velocity":     velocity,
+                    "pitch":        pitch_int,
+                    "position_on":  Fraction(absolute_position_ticks, o.TICKS_PER_BEAT)
+                }
+            )
+        return self_midilist
+
+
     def _has_elements(self, include_masked: bool = False) -> bool:
         if include_masked:
             return len(self._items) > 0
-        return len(self.unmasked_items()) > 0
+        return any(True for _ in self.iter_unmasked_items())
 
     def _total_elements(self, include_masked: bool = False) -> int:
         if include_masked:
@@ -1833,6 +2437,22 @@ class Clip(Composition):  # Just a container of Elements
             if single_element._position_beats <= position_beats < single_element._position_beats + single_element._duration_beats
         ] 
 
+    def interval_index(self, include_masked: bool = False) -> IntervalIndex:
+        """
+        Builds an `IntervalIndex` of the `Clip` elements for repeated time range queries, like measure by \
+            measure editing or windowed rendering. The index is a snapshot, so it shall be rebuilt after the \
+            `Clip` is changed.
+
+        Args:
+            include_masked (bool): Includes the masked elements too.
+
+        Returns:
+            IntervalIndex: The index of the elements by their time span.
+        """
+        if include_masked:
+            return IntervalIndex(self._items)
+        return IntervalIndex(list(self.iter_unmasked_items()))
+
 
     def __mod__(self, operand: o.T) -> o.T:
         """
@@ -1888,44 +2508,139 @@ class Clip(Composition):  # Just a container of Elements
 
 
     @staticmethod
-    def _get_left_note_index(notes: list['oe.Note'], extended_durations: list[Fraction], tied_note: 'oe.Note') -> int:
-        right_start: Fraction = tied_note._position_beats
-        right_pitch: int = tied_note._pitch.get_absolute_pitch()
-        for index, single_note in enumerate(notes):
-            if extended_durations[index] >= 0:
-                left_end: Fraction = single_note._position_beats + single_note._duration_beats + extended_durations[index]
-                if left_end == right_start:
-                    left_pitch: int = single_note._pitch.get_absolute_pitch()
-                    if left_pitch == right_pitch:
-                        return index
-        return -1
+    def _tied_durations(notes: list['oe.Note'], merged_into: list[int] | None = None) -> list[Fraction | None]:
+        """
+        Merges the tied notes in a single sweep by position, where each tied `Note` continues the \
+            `Note` with the same channel and pitch that finishes at its start, if any.
+
+        Args:
+            notes (list): The notes to be merged.
+            merged_into (list): If given, it's filled with the index of the note each one is merged into, \
+                its own index for the notes not merged.
+
+        Returns:
+            list: The duration of each note extended by the tied notes that continue it, \
+                or None for the tied notes merged into a previous one.
+        """
+        durations: list[Fraction | None] = [single_note._duration_beats for single_note in notes]
+        if merged_into is not None:
+            merged_into[:] = range(len(notes))
+        tied_starts: set[Fraction] = {
+            single_note._position_beats for single_note in notes if single_note._tied
+        }
+        if not tied_starts:
+            return durations    # Typical scenario, no tied notes at all
+        # Only the tied notes and the ones finishing where a tied note starts can take part in a tie
+        tie_indexes: list[int] = [
+            index for index, single_note in enumerate(notes)
+            if single_note._tied or single_note._position_beats + single_note._duration_beats in tied_starts
+        ]
+        tie_indexes.sort(key=lambda note_index: notes[note_index]._position_beats)
+        # Indexes of the notes that can still be continued, by channel pitch and finish position
+        open_notes: dict[tuple[int, Fraction], list[int]] = {}
+        for index in tie_indexes:
+            single_note: oe.Note = notes[index]
+            channel_pitch: int = _channel_pitch(single_note)
+            if single_note._tied:
+                left_indexes: list[int] | None = open_notes.get((channel_pitch, single_note._position_beats))
+                if left_indexes:
+                    left_index: int = min(left_indexes)
+                    left_indexes.remove(left_index)
+                    durations[left_index] += single_note._duration_beats
+                    durations[index] = None
+                    if merged_into is not None:
+                        merged_into[index] = left_index
+                    open_notes.setdefault(
+                        (channel_pitch, notes[left_index]._position_beats + durations[left_index]), []
+                    ).append(left_index)
+                    continue
+            open_notes.setdefault(
+                (channel_pitch, single_note._position_beats + single_note._duration_beats), []
+            ).append(index)
+        return durations
 
     def get_component_elements(self) -> list['oe.Element']:
         """Returns the elements directly, NO decoupling guaranteed (no copy)"""
         component_elements: list[oe.Element] = []
         component_notes: list[oe.Note] = []
         for clip_element in self._items:
-            element_components = clip_element.get_component_elements()
+            element_components = clip_element._render_components()
             for element_element in element_components:
                 if isinstance(element_element, oe.Note):
                     component_notes.append(element_element)
                 else:
                     component_elements.append(element_element)
-        note_extended_durations: list[Fraction] = [Fraction(0)] * len(component_notes)
-        for index, clip_note in enumerate(component_notes):
-            if clip_note._tied: # For tied notes processing
-                note_tied_index: int = Clip._get_left_note_index(component_notes, note_extended_durations, clip_note)
-                if note_tied_index >= 0:
-                    note_extended_durations[note_tied_index] += clip_note._duration_beats
-                    note_extended_durations[index] = Fraction(-1)   # Negative extended duration, means to be excluded
-        for single_note, extended_duration in zip(component_notes, note_extended_durations):
-            if extended_duration == 0:    # Typical scenario comes first (optimization)
+        if not any(single_note._tied for single_note in component_notes):
+            component_elements.extend(component_notes)  # Typical scenario, no tied notes to be merged
+            return sorted(component_elements)
+        for single_note, tied_duration in zip(component_notes, Clip._tied_durations(component_notes)):
+            if tied_duration == single_note._duration_beats:    # Typical scenario comes first (optimization)
                 component_elements.append(single_note)  # Note as is, no extension, untouched
-            elif extended_duration > 0:
+            elif tied_duration is not None:
                 copied_note = single_note.copy()    # Needs to be decouples
-                copied_note._duration_beats += extended_duration
+                copied_note._duration_beats = tied_duration
                 component_elements.append(copied_note)
-        return sorted(component_elements)
+        return sorted(component_elements)   # Already sorted runs are merged in linear time
+
+    def iter_component_elements(self) -> Iterator['oe.Element']:
+        """
+        Yields the same elements of `get_component_elements`, in the same order, but rendering the \
+            `Clip` elements one at a time. Because the elements are sorted by position, the components \
+            are yielded once no later element can precede them or continue them as a tied `Note`, \
+            given that no component starts before its own element.
+        """
+        pending_elements: list[oe.Element] = []
+        clip_elements: list[oe.Element] = self._items
+        for element_index, clip_element in enumerate(clip_elements):
+            pending_elements.extend(clip_element._render_components())
+            if element_index + 1 < len(clip_elements):
+                next_beats: Fraction = clip_elements[element_index + 1]._position_beats
+                if next_beats > clip_element._position_beats:
+                    released_elements, pending_elements = self._release_components(pending_elements, next_beats)
+                    yield from released_elements
+        yield from self._release_components(pending_elements)[0]
+
+    @staticmethod
+    def _release_components(component_elements: list['oe.Element'],
+                            next_beats: Fraction = None) -> tuple[list['oe.Element'], list['oe.Element']]:
+        """
+        Splits the rendered components into the ones that can be yielded, sorted and with their tied \
+            notes merged, and the ones to be kept because elements starting at `next_beats` or later \
+            may precede them or continue them. All of them are released without `next_beats`.
+        """
+        component_notes: list[oe.Note] = [
+            single_element for single_element in component_elements if isinstance(single_element, oe.Note)
+        ]
+        left_indexes: list[int] = []
+        tied_durations: list[Fraction | None] = Clip._tied_durations(component_notes, left_indexes)
+        release_beats: Fraction | None = next_beats
+        if next_beats is not None:
+            for single_note, tied_duration in zip(component_notes, tied_durations):
+                if tied_duration is not None and single_note._position_beats + tied_duration >= next_beats:
+                    # May still be continued by a later tied note
+                    release_beats = min(release_beats, single_note._position_beats)
+        notes_merging: dict[int, tuple] = {
+            id(single_note): (tied_duration, component_notes[left_index])
+            for single_note, tied_duration, left_index in zip(component_notes, tied_durations, left_indexes)
+        }
+        released_elements: list[oe.Element] = []
+        kept_elements: list[oe.Element] = []
+        for single_element in component_elements:
+            if isinstance(single_element, oe.Note):
+                tied_duration, left_note = notes_merging[id(single_element)]
+                if release_beats is not None and left_note._position_beats >= release_beats:
+                    kept_elements.append(single_element)    # Kept together with the note it's merged into
+                elif tied_duration == single_element._duration_beats:
+                    released_elements.append(single_element)
+                elif tied_duration is not None:
+                    copied_note = single_element.copy()    # Needs to be decouples
+                    copied_note._duration_beats = tied_duration
+                    released_elements.append(copied_note)
+            elif release_beats is not None and single_element._position_beats >= release_beats:
+                kept_elements.append(single_element)
+            else:
+                released_elements.append(single_element)
+        return sorted(released_elements), kept_elements
 
     if TYPE_CHECKING:
         from operand_metrics import Vector
@@ -1992,6 +2707,12 @@ class Clip(Composition):  # Just a container of Elements
         if not isinstance(position_beats, Fraction):
             position_beats = Fraction(0, 1)
 
+        if self.is_columnar():
+            offset_ticks: int | None = o.beats_to_ticks(position_beats)
+            if offset_ticks is not None:
+                self_playlist.extend( self._columns_playlist(offset_ticks) )
+                return self_playlist
+
         component_elements = self.get_component_elements()
         for single_element in component_elements:
             self_playlist.extend(
@@ -1999,6 +2720,96 @@ class Clip(Composition):  # Just a container of Elements
             )
         return self_playlist
 
+    def getRepeatedPlaylist(self, times: int, position_beats: Fraction = None) -> list[dict]:
+        """
+        Returns the same playlist of `self * times` without copying any `Element`, each repetition \
+            is rendered from the same elements offset by the gross length of the Clip. Tied notes \
+            aren't joined across repetitions.
+
+        Args:
+            times (int): The number of times the Clip is played.
+            position: The reference Position where the Clip starts at.
+
+        Returns:
+            list[dict]: A list with multiple Play configuration dictionaries.
+        """
+        self_playlist: list[dict] = [
+            {"devices": self._devices}
+        ]
+        if not isinstance(position_beats, Fraction):
+            position_beats = Fraction(0, 1)
+        if times < 1:
+            return self_playlist
+
+        if self.is_columnar():
+            positions: array = self._columns["position"]
+            if not positions:
+                return self_playlist
+            offset_ticks: int | None = o.beats_to_ticks(position_beats)
+            measure_ticks: int | None = o.beats_to_ticks(ra.Position(self, ra.Measure(1))._rational)
+            if offset_ticks is not None and measure_ticks is not None:
+                # Same as `gross_length` but from the columns, so, without materializing the elements
+                durations: array = self._columns["duration"]
+                finish_ticks: int = max(map(operator.add, positions, durations))
+                period_ticks: int = max(positions[-1] // measure_ticks + 1, finish_ticks // measure_ticks) * measure_ticks
+                for repetition in range(times):
+                    self_playlist.extend( self._columns_playlist(offset_ticks + repetition * period_ticks) )
+                return self_playlist
+
+        if not self._items:
+            return self_playlist
+        period_beats: Fraction = self.gross_length()._rational
+        component_elements = self.get_component_elements()
+        for repetition in range(times):
+            repetition_beats: Fraction = position_beats + repetition * period_beats
+            for single_element in component_elements:
+                self_playlist.extend(
+                    single_element.getPlaylist(repetition_beats, False)
+                )
+        return self_playlist
+
+    def iterPlaylist(self, position_beats: Fraction = None) -> Iterator[dict]:
+        """
+        Yields the same entries of `getPlaylist` but ordered by time, without materializing them all.
+
+        Because the elements are sorted by position, they are rendered one at a time by \
+            `iter_component_elements`, and only the entries of the elements still playing \
+            are kept pending, with same time entries keeping the `getPlaylist` order.
+
+        Args:
+            position: The reference Position where the Clip starts at.
+
+        Returns:
+            Iterator[dict]: The time ordered playlist entries, after the devices one.
+        """
+        yield {"devices": self._devices}
+        if not isinstance(position_beats, Fraction):
+            position_beats = Fraction(0, 1)
+
+        if self.is_columnar():
+            offset_ticks: int | None = o.beats_to_ticks(position_beats)
+            if offset_ticks is not None:
+                columns_playlist: list[dict] = self._columns_playlist(offset_ticks)
+                columns_playlist.sort(key=lambda play_dict: play_dict["time_ms"])   # Stable sort
+                yield from columns_playlist
+                return
+
+        pending_entries: list[tuple[float, int, dict]] = []
+        insertion: int = 0
+        for single_element in self.iter_component_elements():
+            element_entries: list[dict] = [
+                play_dict for play_dict in single_element.getPlaylist(position_beats, False) if "time_ms" in play_dict
+            ]
+            if element_entries:
+                element_start_ms: float = min(play_dict["time_ms"] for play_dict in element_entries)
+                while pending_entries and pending_entries[0][0] < element_start_ms:
+                    yield heapq.heappop(pending_entries)[2]
+                for play_dict in element_entries:
+                    heapq.heappush(pending_entries, (play_dict["time_ms"], insertion, play_dict))
+                    insertion += 1
+        while pending_entries:
+            yield heapq.heappop(pending_entries)[2]
+
 
     def getMidilist(self, position_beats: Fraction = None) -> list[dict]:
         """
@@ -2013,6 +2824,11 @@ class Clip(Composition):  # Just a container of Elements
         if not isinstance(position_beats, Fraction):
             position_beats = Fraction(0, 1)
 
+        if self.is_columnar():
+            offset_ticks: int | None = o.beats_to_ticks(position_beats)
+            if offset_ticks is not None and offset_ticks >= 0:
+                return self._columns_midilist(offset_ticks)
+
         self_midilist: list[dict] = []
         component_elements = self.get_component_elements()
         for single_element in component_elements:
@@ -2021,6 +2837,8 @@ class Clip(Composition):  # Just a container of Elements
             )
         return self_midilist
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("track_number", "_track_number"), ("auto", "_auto"))
+
     def getSerialization(self) -> dict:
         """
         Returns the serialization in a form of a dictionary of `Clip` parameters.
@@ -2058,6 +2876,10 @@ class Clip(Composition):  # Just a container of Elements
             self._set_owner_clip()
         return self
 
+    def _loaded_serialization(self) -> Self:
+        super()._loaded_serialization()
+        return self._set_owner_clip()
+
     def empty_copy(self, *parameters) -> Self:
         """
         Returns a Clip with all the same parameters but the list that is empty.
@@ -2192,7 +3014,7 @@ class Clip(Composition):  # Just a container of Elements
 
             case oe.Element():
                 new_element: oe.Element = operand.copy()._set_owner_clip(self)
-                return self._append(new_element)._sort_items()  # Shall be sorted!
+                return self._insort(new_element)  # Shall be sorted!
             
             case list():
                 if all(isinstance(item, oe.Element) for item in operand):
@@ -2237,6 +3059,29 @@ class Clip(Composition):  # Just a container of Elements
                 super().__isub__(operand)
         return self._sort_items()  # Shall be sorted!
 
+    def _tiled_items(self, times: int, period_beats: Fraction) -> list['oe.Element']:
+        """
+        Copies all the items for each of the `times - 1` repetitions in a single pass, with the \
+            repetition `n` offset by `n * period_beats`. If the items are sorted and `period_beats` \
+            isn't shorter than their span, the resulting items are sorted too.
+
+        Args:
+            times (int): The total number of times, the existing items included.
+            period_beats (Fraction): The offset in beats between consecutive repetitions.
+
+        Returns:
+            list: The new items of all the repetitions, owned by self.
+        """
+        source_items: list[oe.Element] = self._items.copy()
+        tiled_items: list[oe.Element] = []
+        for repetition in range(1, times):
+            offset_beats: Fraction = repetition * period_beats
+            for single_element in source_items:
+                element_copy: oe.Element = single_element.copy()._set_owner_clip(self)
+                element_copy._position_beats += offset_beats
+                tiled_items.append(element_copy)
+        return tiled_items
+
     # in-place multiply (NO COPY!)
     def __imul__(self, operand: any) -> Self:
         match operand:
@@ -2260,9 +3105,13 @@ class Clip(Composition):  # Just a container of Elements
 
             case int():
                 if operand > 1:
-                    single_shallow_copy: Clip = self.shallow_copy()
-                    for _ in range(operand - 1):
-                        self.__imul__(single_shallow_copy)
+                    if self._auto:  # Auto formatting may change the length after each repetition
+                        single_shallow_copy: Clip = self.shallow_copy()
+                        for _ in range(operand - 1):
+                            self.__imul__(single_shallow_copy)
+                    elif self._items:
+                        # Each repetition is offset by the same gross length, a whole number of Measures
+                        self._items.extend(self._tiled_items(operand, self.gross_length()._rational))
                 elif operand == 0:
                     self._delete()
 
@@ -2331,9 +3180,17 @@ class Clip(Composition):  # Just a container of Elements
 
             case int():
                 if operand > 1:
-                    single_shallow_copy: Clip = self.shallow_copy()
-                    for _ in range(operand - 1):
-                        self.__itruediv__(single_shallow_copy)
+                    if self._auto or self._items and (self.len() != len(self._items) or self._items[0]._position_beats < 0):
+                        # Masked elements aren't stacked but still count for the finish, while a finish
+                        # before 0 is clamped to 0, making the first offsets distinct from the next ones
+                        single_shallow_copy: Clip = self.shallow_copy()
+                        for _ in range(operand - 1):
+                            self.__itruediv__(single_shallow_copy)
+                    elif self._items:
+                        # Each repetition is offset by the same net length
+                        self._extend(self._tiled_items(
+                            operand, self.net_finish()._rational - self._items[0]._position_beats
+                        ))
                 elif operand == 0:
                     self._delete()
 
@@ -2525,7 +3382,10 @@ class Clip(Composition):  # Just a container of Elements
 
     def drop(self, *measures) -> Self:
         """
-        Drops from the `Composition` all `Measure`'s given by the numbers as parameters.
+        Drops from the `Composition` all `Measure`'s given by the numbers as parameters, \
+            with the following measures shifted back to occupy the dropped ones.
+        Masked elements are shifted too, but, because only unmasked elements are dropped, the masked \
+            ones in a dropped measure are kept and end up overlapping the measure that takes its place.
 
         Parameters
         ----------
@@ -2544,26 +3404,32 @@ class Clip(Composition):  # Just a container of Elements
                         if isinstance(measure, (int, float, Fraction)):
                             measures_list.append(int(measure))
                 elif isinstance(single_measure, (int, float, Fraction)):
-                    measures_list.append(int(measure))
+                    measures_list.append(int(single_measure))
             
             end_measure: int = finish_position % ra.Measure() % int()
-            # Pre processing of the measures_list, to start dropping from the end
             measures_list = [
-                validated_measure for validated_measure in sorted(set(measures_list), reverse=True)
+                validated_measure for validated_measure in sorted(set(measures_list))
                 if validated_measure <= end_measure
             ]
+            if not measures_list:
+                return self
 
+            measure_beats: Fraction = ra.Position(self, ra.Measure(1))._rational
+            elements_index: IntervalIndex = self.interval_index()
+            # removes all Elements starting at each Measure
+            elements_to_remove: list[oe.Element] = []
             for single_measure in measures_list:
-                # removes all Elements at the Measure
-                elements_to_remove: list[oe.Element] = [
-                    measure_element for measure_element in self.unmasked_items()
-                    if measure_element == ra.Measure(single_measure)
-                ]
-                self._delete(elements_to_remove, True)
-                # offsets the right side of it to occupy the dropped measure
-                for single_element in self.unmasked_items():
-                    if single_element > ra.Measure(single_measure):
-                        single_measure -= ra.Measure(1)
+                elements_to_remove.extend(
+                    elements_index._starting_beats(single_measure * measure_beats, (single_measure + 1) * measure_beats)
+                )
+            self._delete(elements_to_remove, True)
+            # offsets the right side of each dropped measure to occupy it, masked elements included
+            for single_element in self._items:
+                element_measure: int = int(single_element._position_beats // measure_beats)
+                dropped_measures: int = bisect.bisect_left(measures_list, element_measure)
+                if dropped_measures > 0:
+                    single_element._position_beats -= dropped_measures * measure_beats
+            return self._sort_items()
 
         return self
 
@@ -2588,7 +3454,7 @@ class Clip(Composition):  # Just a container of Elements
                         if isinstance(measure, (int, float, Fraction)):
                             measures_list.append(int(measure))
                 elif isinstance(single_measure, (int, float, Fraction)):
-                    measures_list.append(int(measure))
+                    measures_list.append(int(single_measure))
             
             end_measure: int = finish_position % ra.Measure() % int()
             
@@ -3164,9 +4030,11 @@ class Clip(Composition):  # Just a container of Elements
         if isinstance(length, (int, float, Fraction, ra.Length)):
             punch_out = punch_in + ra.Beats(length)
         
+        punch_in_beats: Fraction = punch_in._rational
+        punch_out_beats: Fraction = punch_out._rational
         included_elements: list[oe.Element] = [
             inside_element for inside_element in self._items
-            if punch_in <= inside_element % od.Pipe( ra.Position() ) < punch_out
+            if punch_in_beats <= inside_element._position_beats < punch_out_beats
         ]
 
         self._delete(self._items, True)
@@ -3187,15 +4055,12 @@ class Clip(Composition):  # Just a container of Elements
         Returns:
             Clip: The same self object with the items processed.
         """
-        if self.len() > 1:
-            # Starts by sorting by Position
-            shallow_copy: Clip = self.shallow_copy()._sort_items()
-            for index in range(shallow_copy.len()):
-                current_element: oe.Element = shallow_copy._items[index]
-                next_element: oe.Element = shallow_copy._items[index + 1]
-                if current_element.net_finish() > next_element.net_start():
-                    new_length: ra.Length = ra.Length( next_element.net_start() - current_element.net_start() )
-                    current_element << new_length
+        # The items are sorted by Position, so, each element only overlaps the next one first
+        sorted_elements: list[oe.Element] = self._items
+        for current_element, next_element in zip(sorted_elements, sorted_elements[1:]):
+            next_start: Fraction = next_element._position_beats
+            if current_element._position_beats + current_element._duration_beats > next_start:
+                current_element << ra.Length(self, next_start - current_element._position_beats)
         return self
 
     def fill(self) -> Self:
@@ -3243,6 +4108,16 @@ class Clip(Composition):  # Just a container of Elements
         Returns:
             Clip: The same self object with the items processed.
         """
+        if self.is_columnar():
+            positions: array = self._columns["position"]
+            durations: array = self._columns["duration"]
+            for i in range(1, len(positions)):
+                previous_finish_ticks: int = positions[i - 1] + durations[i - 1]
+                finish_ticks: int = positions[i] + durations[i]
+                if previous_finish_ticks < finish_ticks:
+                    durations[i] = finish_ticks - previous_finish_ticks
+                    positions[i] = previous_finish_ticks
+            return self
         last_index: int = len(self._items) - 1
         for i, single_element in enumerate(self._items):
             # Sets the Position and the Duration
@@ -3286,6 +4161,12 @@ class Clip(Composition):  # Just a container of Elements
         Returns:
             Clip: The same self object with the items processed.
         """
+        if self.is_columnar():
+            positions: array = self._columns["position"]
+            durations: array = self._columns["duration"]
+            for index in range(1, len(positions)):
+                positions[index] = positions[index - 1] + durations[index - 1]
+            return self
         for index, single_element in enumerate(self._items):
             if index > 0:   # Not the first element
                 duration_beats: Fraction = self._items[index - 1]._duration_beats
@@ -3322,6 +4203,11 @@ class Clip(Composition):  # Just a container of Elements
         """
         quantization_beats: Fraction = og.settings._quantization    # Quantization is a Beats value already
         amount_rational: Fraction = ra.Amount(amount) % Fraction()
+        if self.is_columnar() and amount_rational == 1:
+            quantization_ticks: int | None = o.beats_to_ticks(quantization_beats)
+            if quantization_ticks is not None and quantization_ticks > 0:
+                self._columns_quantize(quantization_ticks, quantize_duration)
+                return self
         for single_element in self.unmasked_items():
             # Position On
             element_position_on: Fraction = single_element._position_beats
@@ -3444,7 +4330,7 @@ class Clip(Composition):  # Just a container of Elements
         removed_notes: list[oe.Note] = []
         extended_notes: dict[int, oe.Note] = {}
         for note in all_notes:
-            channel_pitch: int = note._channel_0 << 8 | note._pitch.get_absolute_pitch()
+            channel_pitch: int = _channel_pitch(note)
             if channel_pitch in extended_notes:
                 extended_note: oe.Note = extended_notes[channel_pitch]
                 extended_note_position: Fraction = extended_note._position_beats
@@ -3877,16 +4763,23 @@ class Section(Composition):
         Returns:
             list[dict]: A list with multiple Play configuration dictionaries.
         """
-        play_list: list = []
+        return list(self.iterPlaylist(from_part))
+
+    def iterPlaylist(self, from_part: bool = False) -> Iterator[dict]:
+        """
+        Yields the playlist of all its clips as a single time ordered stream, merged lazily.
+
+        Args:
+            from_part (bool): If True the Section position is considered.
+
+        Returns:
+            Iterator[dict]: The time ordered playlist entries.
+        """
         # AS A BLOCK THE PLAYING IS DONE RIGHT AWAY, WITHOUT ANY CONSIDERATION TO POSITION
         # ONLY WHEN from_part, IS THE Block POSITION SET
         if not from_part:   # Block by itself is played right away, so, no position considered
-            for single_clip in self._items:
-                play_list.extend(single_clip.getPlaylist())
-        else:
-            for single_clip in self._items:
-                play_list.extend(single_clip.getPlaylist(self._position_beats))
-        return play_list
+            return c.merge_playlists(single_clip.iterPlaylist() for single_clip in self._items)
+        return c.merge_playlists(single_clip.iterPlaylist(self._position_beats) for single_clip in self._items)
 
     def getMidilist(self, from_part: bool = False) -> list[dict]:
         """
@@ -3904,6 +4797,8 @@ class Section(Composition):
                 midi_list.extend(single_clip.getMidilist(self._position_beats))
         return midi_list
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("position", "_position_beats"), ("name", "_name"))
+
     def getSerialization(self) -> dict:
         """
         Returns the serialization in a form of a dictionary of `Block` parameters.
@@ -4447,10 +5342,19 @@ class Part(Composition):
         Returns:
             list[dict]: A list with multiple Play configuration dictionaries.
         """
-        play_list: list = []
-        for block in self._items:
-            play_list.extend(block.getPlaylist(True))
-        return play_list
+        return list(self.iterPlaylist())
+
+    def iterPlaylist(self) -> Iterator[dict]:
+        """
+        Yields the playlist of all its sections as a single time ordered stream, merged lazily.
+
+        Args:
+            None
+
+        Returns:
+            Iterator[dict]: The time ordered playlist entries.
+        """
+        return c.merge_playlists(block.iterPlaylist(True) for block in self._items)
 
     def getMidilist(self) -> list[dict]:
         """
@@ -4467,6 +5371,8 @@ class Part(Composition):
             midi_list.extend(block.getMidilist(True))
         return midi_list
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("time_signature", "_time_signature"), ("name", "_name"))
+
     def getSerialization(self) -> dict:
         """
         Returns the serialization in a form of a dictionary of `Part` parameters.
@@ -4504,6 +5410,10 @@ class Part(Composition):
             self._set_owner_part()
         return self
 
+    def _loaded_serialization(self) -> Self:
+        super()._loaded_serialization()
+        return self._set_owner_part()
+
     def __lshift__(self, operand: any) -> Self:
         match operand:
             case Part():
@@ -18,6 +18,7 @@ from typing import Union, TypeVar, TYPE_CHECKING, Type, Callable, List, Tuple, O
 from typing import Self
 
 from fractions import Fraction
+from functools import lru_cache
 import re
 # Json Midi Creator Libraries
 from . import creator as c
@@ -25,6 +26,11 @@ from . import operand as o
 from . import operand_label as ol
 
 
+# Whitespace around a separator is dropped and any other whitespace becomes a ',' separator
+_dsl_whitespace = re.compile(r"\s*([,:_])\s*|\s+")
+_dsl_commas = re.compile(r",{2,}")
+
+@lru_cache(maxsize=4096)   # The same lines and tokens are normalized over and over while parsing
 def _normalize_dsl(dsl: str) -> str:
     """
     Converts a raw DSL string into a strict canonical format:
@@ -36,30 +42,29 @@ def _normalize_dsl(dsl: str) -> str:
     DSL stands for Domain-Specific Language
     """
 
-    # 1. Normalize line breaks to spaces
-    dsl = dsl.replace("\n", " ")
-
-    # 2a. Remove spaces around commas
-    dsl = re.sub(r"\s*,\s*", ",", dsl)
-
-    # 2b. Remove spaces around colons
-    dsl = re.sub(r"\s*:\s*", ":", dsl)
+    # 1. Removes the whitespace around separators and converts the remaining one into commas
+    dsl = _dsl_whitespace.sub(lambda match: match.group(1) or ",", dsl)
 
-    # 2c. Remove spaces around underscores
-    dsl = re.sub(r"\s*_\s*", "_", dsl)
+    # 2. Collapses multiple commas
+    dsl = _dsl_commas.sub(",", dsl)
 
-    # 3. Convert remaining whitespace between elements into commas
-    # (only if not already adjacent to separators)
-    dsl = re.sub(r"\s+", ",", dsl)
+    # 3. Removes leading/trailing commas
+    return dsl.strip(",")
 
-    # 4. Collapse multiple commas
-    dsl = re.sub(r",+", ",", dsl)
+@lru_cache(maxsize=4096)
+def _dsl_token_fields(token: str) -> tuple[str, ...]:
+    """Returns the normalized fields(:) of a token, parsed once for each distinct token string."""
+    return tuple(_normalize_dsl(token).split(":"))
 
-    # 5. Remove leading/trailing commas
-    dsl = dsl.strip(",")
-
-    return dsl
+def _dsl_field(fields: tuple[str, ...] | list[str], index: int) -> str | None:
+    """Returns the field at the given index or None if the token has no such field."""
+    if index < len(fields):
+        return fields[index]
+    return None
 
+def _dsl_line_tokens(line: str) -> list[str]:
+    """Returns the normalized tokens(,) of a line, normalized once for the entire line."""
+    return _normalize_dsl(line).split(",")
 
 
 class Data(o.Operand):
@@ -373,12 +378,7 @@ class Field(Data):
             self._data = ""
 
     def get_parameter(self, index: int) -> str | None:
-        token_dsl: str = self._data
-        normalized_dsl: str = _normalize_dsl(token_dsl)
-        element_fields: list[str] = normalized_dsl.split("_")
-        if index < len(element_fields):
-            return element_fields[index]
-        return None
+        return _dsl_field(self.get_parameters(), index)
 
     def get_parameters(self) -> list[str]:
         line_dsl: str = self._data
@@ -451,17 +451,10 @@ class Token(Data):
             self._data = ""
 
     def get_field(self, index: int) -> str | None:
-        token_dsl: str = self._data
-        normalized_dsl: str = _normalize_dsl(token_dsl)
-        element_fields: list[str] = normalized_dsl.split(":")
-        if index < len(element_fields):
-            return element_fields[index]
-        return None
+        return _dsl_field(_dsl_token_fields(self._data), index)
 
     def get_fields(self) -> list[str]:
-        line_dsl: str = self._data
-        normalized_dsl: str = _normalize_dsl(line_dsl)
-        return normalized_dsl.split(":")
+        return list(_dsl_token_fields(self._data))
     
     def len(self) -> int:
         return len(self.get_fields())
@@ -545,17 +538,10 @@ class Line(Data):
             self._data = ""
 
     def get_token(self, index: int) -> str | None:
-        line_dsl: str = self._data
-        normalized_dsl: str = _normalize_dsl(line_dsl)
-        element_tokens: list[str] = normalized_dsl.split(",")
-        if index < len(element_tokens):
-            return element_tokens[index]
-        return None
+        return _dsl_field(self.get_tokens(), index)
 
     def get_tokens(self) -> list[str]:
-        line_dsl: str = self._data
-        normalized_dsl: str = _normalize_dsl(line_dsl)
-        return normalized_dsl.split(",")
+        return _dsl_line_tokens(self._data)
 
     def __mod__(self, operand: o.T) -> o.T:
         match operand:
@@ -961,10 +947,17 @@ class Load(Serialization):
 
     Parameters
     ----------
-    str("json/_Save_jsonMidiCreator.json") : The filename and respective path to load the `Operand` serialization from.
+    str("json/_Save_jsonMidiCreator.json") : The filename and respective path to load the `Operand` serialization from, \
+        a ".jmcb" extension loads it from the binary format.
     """
     def __new__(self, filename: str = "json/_Save_jsonMidiCreator.json"):
+        from . import operand_generic as og
         if isinstance(filename, str):
+            if filename.endswith(".jmcb"):
+                binary_data: bytes = c.loadBinaryMidiCreator(og.settings._folder + filename)
+                if binary_data:
+                    return o.binary_to_serialization(binary_data)
+                return None
             operand_data = self.load_operand_data(filename)
             if operand_data:
                 return self.deserialize(operand_data)   # Must convert to an Operand
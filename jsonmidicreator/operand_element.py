@@ -23,6 +23,7 @@ import enum
 import time
 import math
 import re
+import operator
 # Json Midi Creator Libraries
 from . import creator as c
 from . import operand as o
@@ -66,6 +67,10 @@ if TYPE_CHECKING:
 def clamp_value_128(value: int) -> int:
     return max(0, min(127, value))
 
+# Immutable values that don't hold any further state to be stamped
+_stamp_leaf_types: frozenset[type] = frozenset({int, bool, float, str, Fraction, type(None)})
+
+
 class Element(o.Operand):
     """`Element`
 
@@ -83,7 +88,7 @@ class Element(o.Operand):
         self._enabled: bool                 = True
         self._position_beats: Fraction      = Fraction(0)   # in Beats
         self._duration_beats: Fraction      = Fraction(1)
-        self._time_signature: og.TimeSignature  = og.settings._time_signature.copy()
+        self._time_signature: og.TimeSignature  = og.shared_time_signature(og.settings._time_signature)
 
         self._owner_clip: oc.Clip | None    = None
         for single_parameter in parameters: # Faster than passing a tuple
@@ -152,9 +157,8 @@ class Element(o.Operand):
     def _set_element_from_token(self, token: str, previous_element: Union['Element', None] = None) -> Self:
         if isinstance(previous_element, Element):   # Same as `previous_element.finish()`
             self._position_beats = previous_element._position_beats + previous_element._duration_beats
-        token = od._normalize_dsl(token)
-        token_operand = od.Token(token)
-        field_1: str = token_operand.get_field(1)
+        token_fields: tuple[str, ...] = od._dsl_token_fields(token)
+        field_1: str = od._dsl_field(token_fields, 1)
         if field_1 is not None and field_1 != "":
             if field_1[0] == "_":
                 field_1 = "0" + field_1 # Durations of zero aren't set (safe)
@@ -224,6 +228,90 @@ class Element(o.Operand):
         """Returns the elements directly, NO decoupling guaranteed (no copy)"""
         return [ self ]
 
+    # Only Elements whose components are new Elements, and not shared ones, can have them cached
+    _render_cacheable: bool = False
+    _render_cache: list | None = None   # [render stamp, render phase, position beats, component elements]
+
+    def cache_render(self, enabled: bool = True) -> Self:
+        """
+        Enables or disables the render cache of this `Element`, an opt-in cache of its component elements, \
+            used by `getPlaylist`, `getMidilist` and `getPlotlist`, that is kept while the `Element` state is the same.
+
+        Args:
+            enabled (bool): Enables the cache if `True` and drops it if `False`.
+
+        Returns:
+            Element: The same self object.
+        """
+        if enabled and self._render_cacheable:
+            if self._render_cache is None:
+                self._render_cache = []
+        else:
+            self.__dict__.pop("_render_cache", None)
+        return self
+
+    def _render_phase(self) -> Fraction:
+        """The part of the position that the component elements depend on, none by default"""
+        return Fraction(0)
+
+    def _render_stamp(self) -> list:
+        """
+        A cheap version of the state of self, the very objects it holds besides the position, \
+            that, because it keeps them referenced, is the same only if none of them was replaced.
+        """
+        unkeyed_attributes: frozenset[str] = o.Operand._unkeyed_attributes
+        pending_data: list = [
+            value for name, value in self.__dict__.items()
+                if name != "_position_beats" and name not in unkeyed_attributes
+        ]
+        pending_data.append(self._get_time_signature())
+        render_stamp: list = []
+        while pending_data:
+            data: any = pending_data.pop()
+            render_stamp.append(data)
+            if type(data) in _stamp_leaf_types:
+                continue
+            if isinstance(data, o.Operand):
+                pending_data.extend(
+                    value for name, value in data.__dict__.items() if name not in unkeyed_attributes
+                )
+            elif isinstance(data, (list, tuple)):
+                pending_data.extend(data)
+            elif isinstance(data, dict):
+                pending_data.extend(data.values())
+        return render_stamp
+
+    def _render_components(self) -> list['Element']:
+        """
+        Same as `get_component_elements`, except that, when the render cache is enabled, \
+            the components are copies of the cached ones for as long as the state of self stays the same.
+        Because the cache is relative to the position, a pure shift of self just shifts the copied components.
+        """
+        if self._render_cache is None:
+            return self.get_component_elements()
+        render_stamp: list = self._render_stamp()
+        render_phase: Fraction = self._render_phase()
+        render_cache: list = self._render_cache
+        if render_cache and render_cache[1] == render_phase and len(render_stamp) == len(render_cache[0]) \
+                and all(map(operator.is_, render_stamp, render_cache[0])):
+            shift_beats: Fraction = self._position_beats - render_cache[2]
+            component_elements: list[Element] = [
+                single_element.copy() for single_element in render_cache[3]
+            ]
+            if shift_beats != 0:
+                for single_element in component_elements:
+                    single_element._position_beats += shift_beats
+            return component_elements
+        component_elements: list[Element] = self.get_component_elements()
+        if any(single_element is self for single_element in component_elements):
+            render_cache.clear()    # Nothing to be cached
+        else:   # The cached components are never handed out, only their copies
+            render_cache[:] = [
+                render_stamp, render_phase, self._position_beats,
+                [single_element.copy() for single_element in component_elements]
+            ]
+        return component_elements
+
     def __eq__(self, other: o.Operand) -> bool:
         from . import operand_frame as of
         match other:
@@ -333,6 +421,11 @@ class Element(o.Operand):
                     derived_element: 'Element' = None) -> list:
         return []
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (
+        ("enabled", "_enabled"), ("position", "_position_beats"), ("duration", "_duration_beats"),
+        ("time_signature", "_time_signature")
+    )
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["enabled"]          = self.serialize(self._enabled)
@@ -352,9 +445,13 @@ class Element(o.Operand):
             self._enabled           = self.deserialize(serialization["parameters"]["enabled"])
             self._position_beats    = self.deserialize(serialization["parameters"]["position"])
             self._duration_beats    = self.deserialize(serialization["parameters"]["duration"])
-            self._time_signature    = self.deserialize(serialization["parameters"]["time_signature"])
+            self._time_signature    = og.shared_time_signature(self.deserialize(serialization["parameters"]["time_signature"]))
         return self
 
+    def _loaded_serialization(self) -> Self:
+        self._time_signature = og.shared_time_signature(self._time_signature)
+        return super()._loaded_serialization()
+
     def __lshift__(self, operand: any) -> Self:
         from . import operand_container as oc
         operand = self._tail_wrap(operand)    # Processes the tailed self operands if existent
@@ -365,7 +462,7 @@ class Element(o.Operand):
                 # No conversion is done, beat and note_value values are directly copied (Same for Block)
                 self._position_beats        = operand._position_beats
                 self._duration_beats        = operand._duration_beats
-                self._time_signature        << operand._time_signature
+                self._time_signature        = og.shared_time_signature(operand._time_signature)
                 # Because an Element is also defined by the Owner Clip, this also needs to be copied!
                 if self._owner_clip is None:    # << and copy operation doesn't override ownership
                     self._owner_clip        = operand._owner_clip
@@ -377,7 +474,7 @@ class Element(o.Operand):
                                             self._duration_beats = operand._data._rational
                     case Fraction():        self._duration_beats = operand._data
                     case og.TimeSignature():
-                                            self._time_signature = operand._data
+                                            self._time_signature = og.shared_time_signature(operand._data)
                     case ou.Enable():
                         self._enabled               = operand._data._unit != 0
                     case ou.Disable():
@@ -457,13 +554,13 @@ class Element(o.Operand):
                     self._owner_clip._remove(self, True)
 
             case og.TimeSignature():
-                self._time_signature << operand
+                self._time_signature = og.shared_time_signature(operand)
             case ou.Enable():
                 self._enabled               = operand._unit != 0
             case ou.Disable():
                 self._enabled               = operand._unit == 0
             case oc.Composition():
-                self._time_signature << operand._time_signature
+                self._time_signature = og.shared_time_signature(operand._time_signature)
             case tuple():
                 for single_operand in operand:
                     self << single_operand
@@ -646,8 +743,7 @@ class Element(o.Operand):
                     new_clip: oc.Clip = oc.Clip(self._get_time_signature())
                     new_clip += self
                     if operand > 1:
-                        for _ in range(operand - 1):
-                            new_clip.__imul__(self)
+                        new_clip.__imul__(operand)  # Repeated by the Clip in a single pass
                     return new_clip
                 
             case Fraction() | float():
@@ -729,8 +825,7 @@ class Element(o.Operand):
                     new_clip: oc.Clip = oc.Clip(self._get_time_signature())
                     new_clip += self
                     if operand > 1:
-                        for _ in range(operand - 1):
-                            new_clip.__itruediv__(self)
+                        new_clip.__itruediv__(operand)  # Repeated by the Clip in a single pass
                     return new_clip
                 
             case Fraction() | float():
@@ -1770,13 +1865,13 @@ class DeviceElement(Element):
         if position_beats is not None:
             absolute_position_beats = position_beats + self._position_beats
 
-        self_position_min: Fraction = og.settings.beats_to_minutes(absolute_position_beats)
+        self_time_ms: float = og.settings.beats_to_time_ms(absolute_position_beats)
 
-        if self_position_min < 0:
+        if absolute_position_beats < 0:
             return []
         return [
                 {
-                    "time_ms": o.minutes_to_time_ms(self_position_min)
+                    "time_ms": self_time_ms
                 }
             ]
 
@@ -1792,7 +1887,7 @@ class DeviceElement(Element):
         self_denominator: int = self._get_time_signature()._bottom
         self_position: float = float(position_beats + self._position_beats)
         self_duration: float = float(self._duration_beats)
-        self_tempo: float = float(og.settings._tempo)
+        self_tempo: float = og.settings.tempo_at(position_beats + self._position_beats)
 
         track_number: int = 1
         track_name: str = "Track 1"
@@ -1800,7 +1895,7 @@ class DeviceElement(Element):
             track_number = self._owner_clip._track_number
             track_name = self._owner_clip._name
 
-        # Validation is done by midiutil Midi Range Validation
+        # Validation is done by saveMidiFile Midi Range Validation
         return [
                 {
                     "event":        "Element",
@@ -1871,7 +1966,11 @@ class Clock(DeviceElement):
                 return super().__eq__(other)
     
     def getPlaylist(self, position_beats: Fraction | None = None, devices_header = True,
-                                                                    time_signature: og.TimeSignature = None) -> list[dict]:
+                    time_signature: og.TimeSignature = None, periodic: bool = False) -> list[dict]:
+        """
+        Returns the clock playlist, where, if `periodic` is `True`, the Timing Clock pulses of a single \
+            tempo are given as one compact periodic entry, expanded by the player and export functions.
+        """
         if not self._enabled or self._duration_beats < 1:
             return []
 
@@ -1891,6 +1990,9 @@ class Clock(DeviceElement):
             total_clock_pulses: int = int(self._duration_beats * pulses_per_beat)
             # Global duration of the entire clocking period
             self_duration_min: Fraction = og.settings.beats_to_minutes(self._duration_beats)
+            if og.settings._tempo_map is not None:
+                # The player pulses at a fixed rate, so, it gets the average pulse of the tempo map instead
+                self_duration_min = o.time_ms_to_minutes(og.settings._tempo_map.beats_to_time_ms(self._duration_beats))
             
             if self_duration_min > 0:
 
@@ -1935,33 +2037,54 @@ class Clock(DeviceElement):
                         {"devices": devices}
                     )
 
+                single_pulse_duration_min: Fraction = self_duration_min / total_clock_pulses
+                single_pulse_duration_ms: Fraction = single_pulse_duration_min * 60_000
+                tempo_map: og.TempoMap | None = og.settings._tempo_map
+
+                # Either way the pulses start at the position of the Clock
+                def pulse_time_ms(clock_pulse: int) -> float:
+                    if tempo_map is None:
+                        return o.minutes_to_time_ms(self_position_min + single_pulse_duration_min * clock_pulse)
+                    # With tempo changes the pulses follow the tempo map beat by beat
+                    return tempo_map.beats_to_time_ms(
+                        position_beats + self._position_beats + self._duration_beats * clock_pulse / total_clock_pulses
+                    )
+
                 # First quarter note pulse (total 1 in 24 pulses per quarter note)
                 self_playlist.append(
                     {
-                        "time_ms": o.minutes_to_time_ms(self_position_min),
+                        "time_ms": pulse_time_ms(0),
                         "midi_message": {
                             "status_byte": 0xFA     # Start Track
                         }
                     }
                 )
-            
-                single_pulse_duration_min: Fraction = self_duration_min / total_clock_pulses
 
                 # Middle quarter note pulses (total 23 in 24 pulses per quarter note)
-                for clock_pulse in range(1, total_clock_pulses):
-                    self_playlist.append(
-                        {
-                            "time_ms": o.minutes_to_time_ms(single_pulse_duration_min * clock_pulse),
-                            "midi_message": {
-                                "status_byte": 0xF8     # Timing Clock
+                if tempo_map is not None:
+                    for clock_pulse in range(1, total_clock_pulses):
+                        self_playlist.append(
+                            {
+                                "time_ms": pulse_time_ms(clock_pulse),
+                                "midi_message": {
+                                    "status_byte": 0xF8     # Timing Clock
+                                }
                             }
-                        }
+                        )
+                else:
+                    pulses_event: dict = c.periodic_event(
+                        single_pulse_duration_ms, 1, total_clock_pulses - 1, {"status_byte": 0xF8},  # Timing Clock
+                        self_position_min * 60_000
                     )
+                    if periodic:
+                        self_playlist.append(pulses_event)
+                    else:   # Same times of the Fraction math but accumulated as integers
+                        self_playlist.extend(c.expand_periodic_events([pulses_event]))
 
                 # Last quarter note pulse (45 pulses where this last one sets the stop)
                 self_playlist.append(
                     {
-                        "time_ms": o.minutes_to_time_ms(single_pulse_duration_min * total_clock_pulses),
+                        "time_ms": pulse_time_ms(total_clock_pulses),
                         "midi_message": {
                             "status_byte": 0xFC         # Stop Track
                         }
@@ -1971,7 +2094,7 @@ class Clock(DeviceElement):
                 # Resets the position back to 0
                 self_playlist.append(
                     {
-                        "time_ms": o.minutes_to_time_ms(single_pulse_duration_min * total_clock_pulses),
+                        "time_ms": pulse_time_ms(total_clock_pulses),
                         "midi_message": {
                             "status_byte": 0xF2,    # Send a Part Position Pointer (SPP)
                             "data_byte_1": 0,       # Reset
@@ -2050,9 +2173,8 @@ class ChannelElement(DeviceElement):
 
     def _set_element_from_token(self, token: str, previous_element: Union['Element', None] = None) -> Self:
         super()._set_element_from_token(token, previous_element)
-        token = od._normalize_dsl(token)
-        token_operand = od.Token(token)
-        field_0: str = token_operand.get_field(0)
+        token_fields: tuple[str, ...] = od._dsl_token_fields(token)
+        field_0: str = od._dsl_field(token_fields, 0)
         if field_0 is not None and field_0 != "":
             field_parameters: list[str] = field_0.split("_")
             if len(field_parameters) > 1:
@@ -2133,10 +2255,12 @@ class ChannelElement(DeviceElement):
         elif position_beats < 0:
             return []
         self_midilist: list = super().getMidilist(position_beats)
-        # Validation is done by midiutil Midi Range Validation
+        # Validation is done by saveMidiFile Midi Range Validation
         self_midilist[0]["channel"] = self._channel_0
         return self_midilist
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("channel_0", "_channel_0"),)
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["channel_0"]    = self.serialize(self._channel_0)
@@ -2204,6 +2328,8 @@ class Note(ChannelElement):
     Channel(1) : The Midi channel where the midi message will be sent to.
     Enable(True) : Sets if the Element is enabled or not, resulting in messages or not.
     """
+    _render_cacheable: bool = True
+
     def __init__(self, *parameters):
         self._velocity: int         = 100
         self._gate: Fraction        = Fraction(1)
@@ -2212,6 +2338,16 @@ class Note(ChannelElement):
         self._note_effect: og.NoteEffect | None = None
         super().__init__(*parameters)
 
+    def copy(self, *parameters) -> Self:
+        if type(self) is not Note:  # Subclasses may have further attributes to copy
+            return super().copy(*parameters)
+        self_copy: Note = self._clone()   # The time signature is shared
+        self_copy._pitch            = self._pitch.copy()
+        self_copy._note_effect      = self.deep_copy(self._note_effect)
+        for single_parameter in parameters:
+            self_copy << single_parameter
+        return self_copy
+
     def velocity(self, velocity: int = 100) -> Self:
         self._velocity = velocity
         return self
@@ -2303,13 +2439,11 @@ class Note(ChannelElement):
 
     def _set_element_from_token(self, token: str, previous_element: Union['Element', None] = None) -> Self:
         super()._set_element_from_token(token, previous_element)
-        token = od._normalize_dsl(token)
-        token_operand = od.Token(token)
+        token_fields: tuple[str, ...] = od._dsl_token_fields(token)
         # Set Pitch
-        field_2: str = token_operand.get_field(2)
+        field_2: str = od._dsl_field(token_fields, 2)
         if field_2 is not None:
-            field = od.Field(field_2)
-            field_parameters = field.get_parameters()
+            field_parameters: list[str] = field_2.split("_")  # Already normalized
             for parameter in field_parameters:
                 # Extract letter (A-G)
                 letter = next((c for c in parameter if c in 'ABCDEFG'), '')
@@ -2335,7 +2469,7 @@ class Note(ChannelElement):
                 elif minor:
                     self._pitch << ou.Minor()
         # Set Velocity
-        field_3: str = token_operand.get_field(3)
+        field_3: str = od._dsl_field(token_fields, 3)
         if field_3 is not None:
             number = o.string_to_number(field_3)
             if isinstance(number, int):
@@ -2347,6 +2481,15 @@ class Note(ChannelElement):
         if isinstance(self._note_effect, og.NoteEffect):
             return self._note_effect.apply([self])
         return [self]
+
+    def _render_phase(self) -> Fraction:
+        """An `Arpeggio` ends at an absolute position, so, its components can't be reused when shifted"""
+        note_effect: og.NoteEffect | None = self._note_effect
+        while isinstance(note_effect, og.NoteEffect):
+            if isinstance(note_effect, og.Arpeggio):
+                return self._position_beats
+            note_effect = note_effect._next_operand
+        return Fraction(0)
     
 
     def __mod__(self, operand: o.T) -> o.T:
@@ -2404,7 +2547,7 @@ class Note(ChannelElement):
             channels: dict[str, set[int]] = None, derived_note: 'Note' = None) -> list[dict]:
         
         self_plotlist: list[dict] = []
-        component_notes: list[Note] = self.get_component_elements()
+        component_notes: list[Note] = self._render_components()
 
         for single_note in component_notes:
 
@@ -2448,16 +2591,17 @@ class Note(ChannelElement):
         return self_plotlist
 
 
-    def getPlaylist(self, position_beats: Fraction | None = None, devices_header = True) -> list[dict]:
-
-        self_playlist: list[dict] = []
-        component_notes: list[Note] = self.get_component_elements()
-
-        for single_note in component_notes:
+    @staticmethod
+    def _note_times_ms(single_note: 'Note', position_beats: Fraction | None, offset_ticks: int | None,
+                       tempo: Fraction) -> tuple[float | None, float | None]:
+        """Returns the note on and off times for a single tempo, or `None` if the note isn't played."""
+        position_ticks: int | None = 0
+        if position_beats is not None:
+            position_ticks = o.beats_to_ticks(single_note._position_beats)
+        duration_ticks: int | None = o.beats_to_ticks(single_note._duration_beats)
 
-            if not single_note._enabled:
-                continue    # Next note
-            
+        if offset_ticks is None or position_ticks is None or duration_ticks is None:
+            # Off the tick grid, falls back to the exact Fraction math
             absolute_position_beats: Fraction = Fraction(0)
             if position_beats is not None:
                 absolute_position_beats = position_beats + single_note._position_beats
@@ -2466,8 +2610,52 @@ class Note(ChannelElement):
             self_duration_min: Fraction = og.settings.beats_to_minutes(single_note._duration_beats)
 
             if self_position_min < 0 or self_duration_min <= 0:
+                return None, None
+
+            return o.minutes_to_time_ms(self_position_min), \
+                o.minutes_to_time_ms(self_position_min + self_duration_min * single_note._gate)
+
+        position_ticks += offset_ticks
+        if position_ticks < 0 or duration_ticks <= 0:
+            return None, None
+
+        gate: Fraction = single_note._gate
+        return o.ticks_to_time_ms(position_ticks, tempo), o.ticks_to_time_ms(
+            position_ticks * gate.denominator + duration_ticks * gate.numerator, tempo, gate.denominator
+        )
+
+    def getPlaylist(self, position_beats: Fraction | None = None, devices_header = True) -> list[dict]:
+
+        self_playlist: list[dict] = []
+        component_notes: list[Note] = self._render_components()
+
+        # Integer ticks are computed once and then all timing is done in pure integer math
+        tempo: Fraction = og.settings._tempo
+        tempo_map: og.TempoMap | None = og.settings._tempo_map
+        offset_ticks: int | None = 0
+        if position_beats is not None:
+            offset_ticks = o.beats_to_ticks(position_beats)
+
+        for single_note in component_notes:
+
+            if not single_note._enabled:
                 continue    # Next note
 
+            if tempo_map is not None:
+                absolute_position_beats: Fraction = Fraction(0)
+                if position_beats is not None:
+                    absolute_position_beats = position_beats + single_note._position_beats
+                if absolute_position_beats < 0 or single_note._duration_beats <= 0:
+                    continue    # Next note
+                note_on_ms: float = tempo_map.beats_to_time_ms(absolute_position_beats)
+                note_off_ms: float = tempo_map.beats_to_time_ms(
+                    absolute_position_beats + single_note._duration_beats * single_note._gate
+                )
+            else:
+                note_on_ms, note_off_ms = self._note_times_ms(single_note, position_beats, offset_ticks, tempo)
+                if note_on_ms is None:
+                    continue    # Next note
+
             pitch_int: int = single_note._pitch.get_absolute_pitch()
             if single_note.is_clipped(pitch_int):
                 continue    # Next note
@@ -2483,7 +2671,7 @@ class Note(ChannelElement):
             # Midi validation is done in the JsonMidiPlayer program
             self_playlist.append(
                 {
-                    "time_ms": o.minutes_to_time_ms(self_position_min),
+                    "time_ms": note_on_ms,
                     "midi_message": {
                         "status_byte": 0x90 | single_note._channel_0,
                         "data_byte_1": pitch_int,
@@ -2493,7 +2681,7 @@ class Note(ChannelElement):
             )
             self_playlist.append(
                 {
-                    "time_ms": o.minutes_to_time_ms(self_position_min + self_duration_min * single_note._gate),
+                    "time_ms": note_off_ms,
                     "midi_message": {
                         "status_byte": 0x80 | single_note._channel_0,
                         "data_byte_1": pitch_int,
@@ -2510,7 +2698,7 @@ class Note(ChannelElement):
     def getMidilist(self, position_beats: Fraction | None = None) -> list[dict]:
         
         self_midilist: list[dict] = []
-        component_notes: list[Note] = self.get_component_elements()
+        component_notes: list[Note] = self._render_components()
 
         for single_note in component_notes:
 
@@ -2521,8 +2709,13 @@ class Note(ChannelElement):
             if position_beats is not None:
                 absolute_position_beats = position_beats + single_note._position_beats
 
-            self_duration_beats: Fraction = single_note._duration_beats * single_note._gate
-            self_duration: float = float(self_duration_beats)
+            duration_ticks: int | None = o.beats_to_ticks(single_note._duration_beats)
+            if duration_ticks is None:  # Off the tick grid, falls back to the exact Fraction math
+                self_duration: float = float(single_note._duration_beats * single_note._gate)
+            else:
+                self_duration: float = o.ticks_to_beats(
+                    duration_ticks * single_note._gate.numerator, single_note._gate.denominator
+                )
             if self_duration == 0:
                 continue    # Next note
 
@@ -2530,7 +2723,7 @@ class Note(ChannelElement):
             if single_note.is_clipped(pitch_int):
                 continue    # Next note
 
-            # Validation is done by midiutil Midi Range Validation
+            # Validation is done by saveMidiFile Midi Range Validation
             note_dict: dict = super().getMidilist(position_beats)[0]
             note_dict["event"]          = "Note"
             note_dict["duration"]       = self_duration
@@ -2543,6 +2736,11 @@ class Note(ChannelElement):
         return self_midilist
 
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (
+        ("velocity", "_velocity"), ("gate", "_gate"), ("tied", "_tied"), ("pitch", "_pitch"),
+        ("note_effect", "_note_effect")
+    )
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["velocity"] = self.serialize( self._velocity )
@@ -2656,7 +2854,7 @@ class Rhythm(Note):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_note in self.get_component_elements():
+        for single_note in self._render_components():
             self_plotlist.extend(single_note.getPlotlist(position_beats, channels, self))
         for plot_dict in self_plotlist:
             plot_dict["self"] = self # Makes sure it's identified as `Rhythm`
@@ -2668,7 +2866,7 @@ class Rhythm(Note):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_note in self.get_component_elements():
+        for single_note in self._render_components():
             self_playlist.extend(single_note.getPlaylist(position_beats, devices_header))
         return self_playlist
     
@@ -2678,7 +2876,7 @@ class Rhythm(Note):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_note in self.get_component_elements():
+        for single_note in self._render_components():
             self_midilist.extend(single_note.getMidilist(position_beats))
         return self_midilist
     
@@ -3029,7 +3227,7 @@ class KeyScale(Note):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_note in self.get_component_elements():
+        for single_note in self._render_components():
             self_plotlist.extend(single_note.getPlotlist(position_beats, channels, self))
         # Makes sure the self middle pitch os passed once and only once to the last dict to be added on top of it
         if self_plotlist:
@@ -3042,7 +3240,7 @@ class KeyScale(Note):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_note in self.get_component_elements():
+        for single_note in self._render_components():
             self_playlist.extend(single_note.getPlaylist(position_beats, devices_header))
         return self_playlist
     
@@ -3052,10 +3250,12 @@ class KeyScale(Note):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_note in self.get_component_elements():
+        for single_note in self._render_components():
             self_midilist.extend(single_note.getMidilist(position_beats))
         return self_midilist
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("inversion", "_inversion"),)
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["inversion"]    = self.serialize( self._inversion )
@@ -3132,9 +3332,8 @@ class Cluster(KeyScale):
 
     def _set_element_from_token(self, token: str, previous_element: Union['Element', None] = None) -> Self:
         super()._set_element_from_token(token, previous_element)
-        token = od._normalize_dsl(token)
-        token_operand = od.Token(token)
-        field_0: str = token_operand.get_field(0)
+        token_fields: tuple[str, ...] = od._dsl_token_fields(token)
+        field_0: str = od._dsl_field(token_fields, 0)
         if field_0 is not None and field_0 != "":
             field_parameters: list[str] = field_0.split("_")
             if len(field_parameters) > 2:
@@ -3143,9 +3342,8 @@ class Cluster(KeyScale):
                 if isinstance(inversion, int):
                     self << ou.Inversion(inversion)
         # Get individual Tokens for each cluster Note as future Pitch setters
-        fields = token_operand.get_fields()
         self._pitches = []  # Makes sure it resets existing pitches
-        for index, single_field in enumerate(fields):
+        for index, single_field in enumerate(token_fields):
             if index > 3:   # Above 3, the one concerning velocity
                 pitch_token = od.Token("::" + single_field) # Pitch field set ONLY
                 self._pitches.append(pitch_token)
@@ -3187,6 +3385,8 @@ class Cluster(KeyScale):
             case _:
                 return super().__eq__(other)
     
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("pitches", "_pitches"),)
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["pitches"] = self.serialize( self._pitches )
@@ -3318,9 +3518,8 @@ class Chord(KeyScale):
 
     def _set_element_from_token(self, token: str, previous_element: Union['Element', None] = None) -> Self:
         super()._set_element_from_token(token, previous_element)
-        token = od._normalize_dsl(token)
-        token_operand = od.Token(token)
-        field_0: str = token_operand.get_field(0)
+        token_fields: tuple[str, ...] = od._dsl_token_fields(token)
+        field_0: str = od._dsl_field(token_fields, 0)
         if field_0 is not None and field_0 != "":
             field_parameters: list[str] = field_0.split("_")
             if len(field_parameters) > 2:
@@ -3411,6 +3610,11 @@ class Chord(KeyScale):
         return chord_notes
     
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (
+        ("size", "_size"), ("dominant", "_dominant"), ("diminished", "_diminished"), ("augmented", "_augmented"),
+        ("sus2", "_sus2"), ("sus4", "_sus4")
+    )
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["size"]         = self.serialize( self._size )
@@ -3539,9 +3743,8 @@ class Tuplet(Note):
 
     def _set_element_from_token(self, token: str, previous_element: Union['Element', None] = None) -> Self:
         super()._set_element_from_token(token, previous_element)
-        token = od._normalize_dsl(token)
-        token_operand = od.Token(token)
-        field_0: str = token_operand.get_field(0)
+        token_fields: tuple[str, ...] = od._dsl_token_fields(token)
+        field_0: str = od._dsl_field(token_fields, 0)
         if field_0 is not None and field_0 != "":
             field_parameters: list[str] = field_0.split("_")
             if len(field_parameters) > 1:
@@ -3599,7 +3802,7 @@ class Tuplet(Note):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_note in self.get_component_elements():
+        for single_note in self._render_components():
             self_plotlist.extend(single_note.getPlotlist(position_beats, channels, self))
         return self_plotlist
     
@@ -3609,7 +3812,7 @@ class Tuplet(Note):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_note in self.get_component_elements():
+        for single_note in self._render_components():
             self_playlist.extend(single_note.getPlaylist(position_beats, devices_header))
         return self_playlist
     
@@ -3619,10 +3822,12 @@ class Tuplet(Note):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_note in self.get_component_elements():
+        for single_note in self._render_components():
             self_midilist.extend(single_note.getMidilist(position_beats))    # extends the list with other list
         return self_midilist
     
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("count", "_count"), ("swing", "_swing"))
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["count"]    = self.serialize( self._count )
@@ -3745,10 +3950,9 @@ class ControlChange(Automatable):
 
     def _set_element_from_token(self, token: str, previous_element: Union['Element', None] = None) -> Self:
         super()._set_element_from_token(token, previous_element)
-        token = od._normalize_dsl(token)
-        token_operand = od.Token(token)
+        token_fields: tuple[str, ...] = od._dsl_token_fields(token)
         # Set Value and Number for the controller
-        field_2: str = token_operand.get_field(2)
+        field_2: str = od._dsl_field(token_fields, 2)
         if field_2 is not None and field_2 != "":
             field_parameters: list[str] = field_2.split("_")
             if len(field_parameters) > 0:
@@ -3888,11 +4092,9 @@ class ControlChange(Automatable):
         if position_beats is not None:
             absolute_position_beats = position_beats + self._position_beats
 
-        self_position_min: Fraction = og.settings.beats_to_minutes(absolute_position_beats)
-
-        if self_position_min >= 0:
+        if absolute_position_beats >= 0:
 
-            time_ms: float = o.minutes_to_time_ms(self_position_min)
+            time_ms: float = og.settings.beats_to_time_ms(absolute_position_beats)
 
             # Midi validation is done in the JsonMidiPlayer program
             self_playlist: list[dict] = []
@@ -3979,7 +4181,7 @@ class ControlChange(Automatable):
         self_midilist: list[dict] = super().getMidilist(position_beats)
         self_midilist[0]["event"] = "ControllerEvent"
 
-        # Validation is done by midiutil Midi Range Validation
+        # Validation is done by saveMidiFile Midi Range Validation
 
         if self._controller._nrpn:
             cc_99_msb, cc_98_lsb, cc_6_msb, cc_38_lsb = self._controller._midi_nrpn_values(self._value)
@@ -4006,6 +4208,8 @@ class ControlChange(Automatable):
         return self_midilist
 
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("value", "_value"), ("controller", "_controller"))
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["value"]            = self.serialize( self._value )
@@ -4468,10 +4672,9 @@ class Aftertouch(Automatable):
 
     def _set_element_from_token(self, token: str, previous_element: Union['Element', None] = None) -> Self:
         super()._set_element_from_token(token, previous_element)
-        token = od._normalize_dsl(token)
-        token_operand = od.Token(token)
+        token_fields: tuple[str, ...] = od._dsl_token_fields(token)
         # Set Pressure
-        field_2: str = token_operand.get_field(2)
+        field_2: str = od._dsl_field(token_fields, 2)
         if field_2 is not None:
             number = o.string_to_number(field_2)
             if isinstance(number, (int, float, Fraction)):
@@ -4551,9 +4754,9 @@ class Aftertouch(Automatable):
         if position_beats is not None:
             absolute_position_beats = position_beats + self._position_beats
 
-        self_position_min: Fraction = og.settings.beats_to_minutes(absolute_position_beats)
+        self_time_ms: float = og.settings.beats_to_time_ms(absolute_position_beats)
 
-        if self_position_min >= 0:
+        if absolute_position_beats >= 0:
 
             # Midi validation is done in the JsonMidiPlayer program
             self_playlist: list[dict] = []
@@ -4568,7 +4771,7 @@ class Aftertouch(Automatable):
             # Midi validation is done in the JsonMidiPlayer program
             self_playlist.append(
                 {
-                    "time_ms": o.minutes_to_time_ms(self_position_min),
+                    "time_ms": self_time_ms,
                     "midi_message": {
                         "status_byte": 0xD0 | self._channel_0,
                         "data_byte": clamp_value_128(self._pressure)
@@ -4586,12 +4789,14 @@ class Aftertouch(Automatable):
         elif position_beats < 0:
             return []
         self_midilist: list = super().getMidilist(position_beats)
-        # Validation is done by midiutil Midi Range Validation
+        # Validation is done by saveMidiFile Midi Range Validation
         self_midilist[0]["event"]       = "ChannelPressure"
         self_midilist[0]["pressure"]    = clamp_value_128(self._pressure)
         return self_midilist
 
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("pressure", "_pressure"),)
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["pressure"] = self.serialize( self._pressure )
@@ -4720,9 +4925,9 @@ class PolyAftertouch(Aftertouch):
         if position_beats is not None:
             absolute_position_beats = position_beats + self._position_beats
 
-        self_position_min: Fraction = og.settings.beats_to_minutes(absolute_position_beats)
+        self_time_ms: float = og.settings.beats_to_time_ms(absolute_position_beats)
 
-        if self_position_min >= 0:
+        if absolute_position_beats >= 0:
 
             pitch_int: int = self._pitch.get_absolute_pitch()
 
@@ -4740,7 +4945,7 @@ class PolyAftertouch(Aftertouch):
             # Midi validation is done in the JsonMidiPlayer program
             self_playlist.append(
                 {
-                    "time_ms": o.minutes_to_time_ms(self_position_min),
+                    "time_ms": self_time_ms,
                     "midi_message": {
                         "status_byte": 0xA0 | self._channel_0,
                         "data_byte_1": pitch_int,
@@ -4750,6 +4955,8 @@ class PolyAftertouch(Aftertouch):
             )
         return self_playlist
     
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("pitch", "_pitch"),)
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["pitch"] = self.serialize( self._pitch )
@@ -4851,10 +5058,9 @@ class PitchBend(Automatable):
 
     def _set_element_from_token(self, token: str, previous_element: Union['Element', None] = None) -> Self:
         super()._set_element_from_token(token, previous_element)
-        token = od._normalize_dsl(token)
-        token_operand = od.Token(token)
+        token_fields: tuple[str, ...] = od._dsl_token_fields(token)
         # Set Pressure
-        field_2: str = token_operand.get_field(2)
+        field_2: str = od._dsl_field(token_fields, 2)
         if field_2 is not None:
             number = o.string_to_number(field_2)
             if isinstance(number, (int, float, Fraction)):
@@ -4937,9 +5143,9 @@ class PitchBend(Automatable):
         if position_beats is not None:
             absolute_position_beats = position_beats + self._position_beats
 
-        self_position_min: Fraction = og.settings.beats_to_minutes(absolute_position_beats)
+        self_time_ms: float = og.settings.beats_to_time_ms(absolute_position_beats)
         
-        if self_position_min >= 0:
+        if absolute_position_beats >= 0:
 
             # Midi validation is done in the JsonMidiPlayer program
             self_playlist: list[dict] = []
@@ -4954,7 +5160,7 @@ class PitchBend(Automatable):
 
             self_playlist.append(
                 {
-                    "time_ms": o.minutes_to_time_ms(self_position_min),
+                    "time_ms": self_time_ms,
                     "midi_message": {
                         "status_byte": 0xE0 | self._channel_0,
                         "data_byte_1": clamp_value_128(self._lsb),
@@ -4972,11 +5178,13 @@ class PitchBend(Automatable):
         elif position_beats < 0:
             return []
         self_midilist: list = super().getMidilist(position_beats)
-        # Validation is done by midiutil Midi Range Validation
+        # Validation is done by saveMidiFile Midi Range Validation
         self_midilist[0]["event"]       = "PitchWheelEvent"
         self_midilist[0]["value"]       = self._get_bend(clamp_value_128(self._msb), clamp_value_128(self._lsb))
         return self_midilist
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("msb", "_msb"), ("lsb", "_lsb"))
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["msb"] = self.serialize(self._msb)
@@ -5084,6 +5292,8 @@ class Automation(Element):
     Channel(1) : The Midi channel where the midi message will be sent to.
     Enable(True) : Sets if the Element is enabled or not, resulting in messages or not.
     """
+    _render_cacheable: bool = True
+
     def __init__(self, *parameters):
         self._parameter: Automatable = ControlChange()
         self._dots: list[og.Dot] = []
@@ -5106,16 +5316,15 @@ class Automation(Element):
 
     def _set_element_from_token(self, token: str, previous_element: Union['Element', None] = None) -> Self:
         super()._set_element_from_token(token)    # Sets the Duration and Position ONLY (not stackable)
-        token = od._normalize_dsl(token)
-        token_operand = od.Token(token)
+        token_fields: tuple[str, ...] = od._dsl_token_fields(token)
         # Sets the parameter element
-        field_0: str = token_operand.get_field(0)
+        field_0: str = od._dsl_field(token_fields, 0)
         if field_0 is not None and field_0 != "":
             field_parameters: list[str] = field_0.split("_")
             if len(field_parameters) > 1:
                 field_parameters.pop(0)
                 parameter_field_0 = "_".join(field_parameters)
-                parameter_field_2 = token_operand.get_field(2)
+                parameter_field_2 = od._dsl_field(token_fields, 2)
                 parameter_token: str = parameter_field_0 + "::" + parameter_field_2
                 if field_parameters[0] in Automation._automatable_types:
                     self._parameter = _get_element_from_token(parameter_token)
@@ -5126,7 +5335,7 @@ class Automation(Element):
         # Used for conversion only, keeps self Time Signature and the last position setting
         position: ra.Position = self % ra.Position()
         value: int = 0
-        for i, field_i in enumerate(token_operand.get_fields()):
+        for i, field_i in enumerate(token_fields):
             if i > 3 and field_i is not None and field_i != "":
                 if i > 4:
                     if field_i[0] == "_":
@@ -5242,6 +5451,12 @@ class Automation(Element):
                                 interpolation_points += 1    # Next point
                         component_elements.append(right_dot_element)
         return component_elements
+
+    def _render_phase(self) -> Fraction:
+        """The interpolation points are aligned to multiples of the duration, so, only shifts by it keep them"""
+        if self._duration_beats > 0:
+            return self._position_beats % self._duration_beats
+        return Fraction(0)
     
 
     def __mod__(self, operand: o.T) -> o.T:
@@ -5271,7 +5486,7 @@ class Automation(Element):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_element in self.get_component_elements():
+        for single_element in self._render_components():
             self_playlist.extend(single_element.getPlotlist(position_beats, channels))
         return self_playlist
     
@@ -5281,7 +5496,7 @@ class Automation(Element):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_element in self.get_component_elements():
+        for single_element in self._render_components():
             self_playlist.extend(single_element.getPlaylist(position_beats, devices_header))
         return self_playlist
     
@@ -5291,11 +5506,15 @@ class Automation(Element):
             position_beats = Fraction(0)
         elif position_beats < 0:
             return []
-        for single_element in self.get_component_elements():
+        for single_element in self._render_components():
             self_midilist.extend(single_element.getMidilist(position_beats))    # extends the list with other list
         return self_midilist
     
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (
+        ("parameter", "_parameter"), ("dots", "_dots"), ("linear", "_linear")
+    )
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["parameter"]    = self.serialize( self._parameter )
@@ -5455,9 +5674,9 @@ class ProgramChange(ChannelElement):
         if position_beats is not None:
             absolute_position_beats = position_beats + self._position_beats
 
-        self_position_min: Fraction = og.settings.beats_to_minutes(absolute_position_beats)
+        self_time_ms: float = og.settings.beats_to_time_ms(absolute_position_beats)
 
-        if self_position_min >= 0:
+        if absolute_position_beats >= 0:
 
             # Midi validation is done in the JsonMidiPlayer program
             self_playlist: list[dict] = []
@@ -5479,7 +5698,7 @@ class ProgramChange(ChannelElement):
 
             self_playlist.append(
                 {
-                    "time_ms": o.minutes_to_time_ms(self_position_min),
+                    "time_ms": self_time_ms,
                     "midi_message": {
                         "status_byte": 0xC0 | self._channel_0,
                         "data_byte": self._program_0
@@ -5496,11 +5715,15 @@ class ProgramChange(ChannelElement):
         elif position_beats < 0:
             return []
         self_midilist: list = super().getMidilist(position_beats)
-        # Validation is done by midiutil Midi Range Validation
+        # Validation is done by saveMidiFile Midi Range Validation
         self_midilist[0]["event"]       = "ProgramChange"
         self_midilist[0]["program"]     = self._program_0
         return self_midilist
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (
+        ("program_0", "_program_0"), ("bank", "_bank"), ("high", "_high")
+    )
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["program_0"]    = self.serialize( self._program_0 )
@@ -5651,16 +5874,15 @@ _element_type: dict[str, type] = {
 }
 
 
-def _get_element_from_token(token: str, previous_element: Union['Element', None] = None) -> Element | ol.Null:
+def _get_element_from_token(token: str, previous_element: Union['Element', None] = None, token_index: int | None = None) -> Element | ol.Null:
     element: Element | ol.Null = ol.Null()
-    token = od._normalize_dsl(token)
-    if token != "":
+    token_fields: tuple[str, ...] = od._dsl_token_fields(token)
+    if token_fields[0] != "" or len(token_fields) > 1:
         element_class: type = Note
         if isinstance(previous_element, Element):
             element_class = type(previous_element)
-        token_operand = od.Token(token)
         # Get Element
-        field_0: str = token_operand.get_field(0).lower()
+        field_0: str = token_fields[0].lower()
         element_parameters: list[str] = []
         if field_0:
             if field_0[0] == "_":
@@ -5669,6 +5891,9 @@ def _get_element_from_token(token: str, previous_element: Union['Element', None]
             element_parameters = field_0.split("_")
             if element_parameters[0] in _element_type:
                 element_class = _element_type[ element_parameters[0] ]  # instantiates the Element class
+            elif token_index is not None:
+                print(f"Warning: Unknown element tag '{element_parameters[0]}' in token {token_index} "
+                      f"'{':'.join(token_fields)}', so, it's ignored!")
         element: Element = element_class()  # instantiates the Element class
         # Sets the previous element parameters as the default for the present element
         if isinstance(previous_element, Element):
@@ -5679,10 +5904,11 @@ def _get_element_from_token(token: str, previous_element: Union['Element', None]
 
 def get_elements_from_line(line: od.Line) -> list[Element]:
     line_elements: list[Element] = []
+    # The line is normalized once and each distinct token is parsed once into its fields
     line_tokens: list[str] = line.get_tokens()
     previous_element: Element | None = None
-    for token in line_tokens:
-        element = _get_element_from_token(token, previous_element)
+    for token_index, token in enumerate(line_tokens):
+        element = _get_element_from_token(token, previous_element, token_index)
         previous_element = element
         if isinstance(element, Element):
             line_elements.append(element)
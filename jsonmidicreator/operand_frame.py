@@ -34,6 +34,16 @@ if TYPE_CHECKING:
     from operand_container import Container
 
 # Works as a traditional C list (chained)
+def _unmasked_indexes(container: 'Container', columns: dict) -> dict[int, int]:
+    """Same as `container._item_index(item)` for all the items, as a dictionary by the item id."""
+    if "unmasked_index" not in columns:
+        unmasked_indexes: dict[int, int] = {}
+        for index, single_item in enumerate(container.unmasked_items()):
+            unmasked_indexes.setdefault(id(single_item), index)
+        columns["unmasked_index"] = unmasked_indexes
+    return columns["unmasked_index"]
+
+
 class Frame(o.Operand):
     """`Frame`
 
@@ -163,6 +173,79 @@ class Frame(o.Operand):
     def frame(self, input: Any) -> Any:
         return self._next_operand
     
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        """
+        Returns the indexes of the given items that pass this `Frame`, evaluated for all of them at once, \
+            or None if this `Frame` can only be framed one item at a time.
+        """
+        return None
+
+    def _selects_indexes(self) -> bool:
+        """A custom `frame` method falls back to the item by item framing, unless it also has its `_select_indexes`."""
+        for frame_class in type(self).__mro__:
+            if "frame" in frame_class.__dict__:
+                return "_select_indexes" in frame_class.__dict__
+        return False
+
+    @staticmethod
+    def _column(items: list, columns: dict, column: str) -> list:
+        """
+        Returns the given column of all the items, computed once for all the Frames in the chain with \
+            integer math on the `Element` positions in beats, with the same results of the `%` conversions.
+            - "step": The `ra.Step` of each `Element` in its `Measure`, the same as `element % Step() % int()`.
+            - "measure": The beats where the `Measure` of each item starts, the ones compared by `Measure` `<`.
+        """
+        from . import operand_container as oc
+        if column not in columns:
+            column_values: list = [None] * len(items)
+            quantization: Fraction = og.settings._quantization  # Beats per step
+            steps_per_measure: dict[int, int] = {}
+            for index, single_item in enumerate(items):
+                if isinstance(single_item, oe.Element):
+                    position_beats: Fraction = single_item._position_beats
+                    beats_per_measure: int = single_item._get_time_signature()._top
+                    match column:
+                        case "step":
+                            if beats_per_measure not in steps_per_measure:
+                                steps_per_measure[beats_per_measure] = int(beats_per_measure / quantization)
+                            column_values[index] = position_beats.numerator * quantization.denominator \
+                                // (position_beats.denominator * quantization.numerator) % steps_per_measure[beats_per_measure]
+                        case "measure":
+                            column_values[index] = position_beats.numerator \
+                                // (position_beats.denominator * beats_per_measure) * beats_per_measure
+                elif column == "measure" and isinstance(single_item, oc.Composition):
+                    column_values[index] = (single_item % ra.Measure())._get_beats()
+            columns[column] = column_values
+        return columns[column]
+
+    def frame_mask(self, items: list) -> list[bool] | None:
+        """
+        Evaluates the whole `**` chain of Frames over all the items in a single pass, with the same result \
+            of framing each item one at a time, as in `item == frame.frame(item)`.
+
+        Args:
+            items (list): The items in the same order as they would be framed.
+
+        Returns:
+            list[bool]: If each item passes the chain, or None if the chain can only be framed item by item.
+        """
+        indexes: list[int] = list(range(len(items)))
+        columns: dict = {}
+        single_frame: Any = self
+        while isinstance(single_frame, Frame):
+            if not single_frame._selects_indexes():
+                return None
+            indexes = single_frame._select_indexes(items, indexes, columns)
+            if indexes is None:
+                return None
+            single_frame = single_frame._next_operand
+        if not isinstance(single_frame, ol.Full):   # The chain has to end as a pass through
+            return None
+        items_mask: list[bool] = [False] * len(items)
+        for index in indexes:
+            items_mask[index] = True
+        return items_mask
+
 
     def pop(self, frame: 'Frame') -> 'Frame':
         previous_frame: 'Frame' = self
@@ -705,6 +788,14 @@ class Either(Selector):
                     return self._next_operand.frame(input)
                 return self._next_operand
         return ol.Null()
+
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        if any(isinstance(condition, Frame) for condition in self._parameters):
+            return None
+        return [
+            index for index in indexes
+            if any(items[index] == condition for condition in self._parameters)
+        ]
     
 class Neither(Selector):
     """`Frame -> Left -> InputFilter -> Selector -> Neither`
@@ -722,6 +813,14 @@ class Neither(Selector):
         if isinstance(self._next_operand, Frame):
             return self._next_operand.frame(input)
         return self._next_operand
+
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        if any(isinstance(condition, Frame) for condition in self._parameters):
+            return None
+        return [
+            index for index in indexes
+            if not any(items[index] == condition for condition in self._parameters)
+        ]
     
 
 class First(Selector):
@@ -746,6 +845,16 @@ class First(Selector):
                 return self._next_operand
         return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        from . import operand_container as oc
+        if not isinstance(self._inside_container, oc.Container):
+            return []
+        unmasked_indexes: dict[int, int] = _unmasked_indexes(self._inside_container, columns)
+        return [
+            index for index in indexes
+            if unmasked_indexes.get(id(items[index]), self._named_parameters['amount']) < self._named_parameters['amount']
+        ]
+
 class Last(Selector):
     """`Frame -> Left -> InputFilter -> Selector -> Last`
 
@@ -771,6 +880,19 @@ class Last(Selector):
                     return self._next_operand
         return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        from . import operand_container as oc
+        if not isinstance(self._inside_container, oc.Container):
+            return []
+        unmasked_indexes: dict[int, int] = _unmasked_indexes(self._inside_container, columns)
+        if not unmasked_indexes:
+            return []
+        amount_index: int = -1 * self._named_parameters['amount'] % self._inside_container.len()
+        return [
+            index for index in indexes
+            if unmasked_indexes.get(id(items[index]), -1) >= amount_index
+        ]
+
 
 class Crossing(Selector):
     """`Frame -> Left -> InputFilter -> Selector -> Crossing`
@@ -807,6 +929,10 @@ class InputType(Selector):
                 return super().frame(input)
         return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        operand_classes: tuple = tuple(self._parameters)
+        return [index for index in indexes if isinstance(items[index], operand_classes)]
+
 
 class OnBeat(Selector):
     """`Frame -> Left -> InputFilter -> Selector -> OnBeat`
@@ -825,6 +951,14 @@ class OnBeat(Selector):
                 return super().frame(input)
         return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        steps_per_beat: int = int(1 / og.settings._quantization)
+        position_steps: list = self._column(items, columns, "step")
+        return [
+            index for index in indexes
+            if position_steps[index] is not None and position_steps[index] % steps_per_beat == 0
+        ]
+
 class OffBeat(Selector):
     """`Frame -> Left -> InputFilter -> Selector -> OffBeat`
 
@@ -842,6 +976,15 @@ class OffBeat(Selector):
                 return super().frame(input)
         return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        steps_per_beat: int = int(1 / og.settings._quantization)
+        half_beat_steps: int = round(steps_per_beat / 2)
+        position_steps: list = self._column(items, columns, "step")
+        return [
+            index for index in indexes
+            if position_steps[index] is not None and position_steps[index] % steps_per_beat == half_beat_steps
+        ]
+
 class DownBeat(Selector):
     """`Frame -> Left -> InputFilter -> Selector -> DownBeat`
 
@@ -858,6 +1001,10 @@ class DownBeat(Selector):
                 return super().frame(input)
         return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        position_steps: list = self._column(items, columns, "step")
+        return [ index for index in indexes if position_steps[index] == 0 ]
+
 class UpBeat(Selector):
     """`Frame -> Left -> InputFilter -> Selector -> UpBeat`
 
@@ -877,6 +1024,16 @@ class UpBeat(Selector):
                 return super().frame(input)
         return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        steps_per_beat: int = int(1 / og.settings._quantization)
+        half_beat_steps: int = round(steps_per_beat / 2)
+        position_steps: list = self._column(items, columns, "step")
+        return [
+            index for index in indexes
+            if position_steps[index] is not None and (position_steps[index] + half_beat_steps) \
+                    % (items[index]._get_time_signature()._top * steps_per_beat) == 0
+        ]
+
 
 class PreviousComparison(Selector):
     """`Frame -> Left -> InputFilter -> Selector -> PreviousComparison`
@@ -954,6 +1111,14 @@ class BasicComparison(Selector):
             self_operand = self_operand.frame(input)
         return self_operand
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        if any(isinstance(condition, Frame) for condition in self._parameters):
+            return None     # Conditions that are Frames need to be framed too
+        return [
+            index for index in indexes
+            if all(self._compare(items[index], condition) for condition in self._parameters)
+        ]
+
     @staticmethod
     def _compare(input: Any, condition: Any) -> bool:
         return True
@@ -1065,6 +1230,9 @@ class All(Alternator):
     def frame(self, input: o.T) -> o.T:
         return super().frame(input)
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        return indexes
+
 class Odd(Alternator):
     """`Frame -> Left -> InputFilter -> Alternator -> Odd`
 
@@ -1084,6 +1252,14 @@ class Odd(Alternator):
         else:
             return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        # Same index counting as `frame`, for each input that reaches self
+        selected_indexes: list[int] = [
+            index for nth_index, index in enumerate(indexes, self._index + 1) if nth_index % 2 == 0
+        ]
+        self._index += len(indexes)
+        return selected_indexes
+
 class Even(Alternator):
     """`Frame -> Left -> InputFilter -> Alternator -> Even`
 
@@ -1103,6 +1279,14 @@ class Even(Alternator):
         else:
             return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        # Same index counting as `frame`, for each input that reaches self
+        selected_indexes: list[int] = [
+            index for nth_index, index in enumerate(indexes, self._index + 1) if nth_index % 2 == 1
+        ]
+        self._index += len(indexes)
+        return selected_indexes
+
 class Every(Alternator):
     """`Frame -> Left -> InputFilter -> Alternator -> Every`
 
@@ -1139,6 +1323,27 @@ class Every(Alternator):
                 return self._next_operand
         return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        selected_indexes: list[int] = []
+        if self._named_parameters['nths'] > 0:
+            measures_beats: list = self._column(items, columns, "measure")
+            previous_measure_beats: Fraction | None = None
+            if isinstance(self._previous_measure, ra.Measure):
+                previous_measure_beats = self._previous_measure._get_beats()
+            last_index: int | None = None
+            for index in indexes:
+                if measures_beats[index] is not None:
+                    if previous_measure_beats is not None and previous_measure_beats < measures_beats[index]:
+                        self._measure_at = 0   # Resets the measure counter
+                    self._measure_at += 1
+                    previous_measure_beats = measures_beats[index]
+                    last_index = index
+                    if self._measure_at % self._named_parameters['nths'] == 0:
+                        selected_indexes.append(index)
+            if last_index is not None:  # Keeps track of the previous Measure like `frame` does
+                self._previous_measure = items[last_index] % ra.Measure()
+        return selected_indexes
+
 
 class Each(Every):
     """`Frame -> Left -> InputFilter -> Alternator -> Every -> Each`
@@ -1178,6 +1383,14 @@ class Nth(Alternator):
         else:
             return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        selected_indexes: list[int] = [
+            index for nth_index, index in enumerate(indexes, self._index + 1)
+            if nth_index + 1 in self._named_parameters['parameters']
+        ]
+        self._index += len(indexes)
+        return selected_indexes
+
 class At(Alternator):
     """`Frame -> Left -> InputFilter -> Alternator -> At`
 
@@ -1202,6 +1415,14 @@ class At(Alternator):
         else:
             return ol.Null()
 
+    def _select_indexes(self, items: list, indexes: list[int], columns: dict) -> list[int] | None:
+        selected_indexes: list[int] = [
+            index for nth_index, index in enumerate(indexes, self._index + 1)
+            if nth_index in self._named_parameters['parameters']
+        ]
+        self._index += len(indexes)
+        return selected_indexes
+
 
 class Get(LeftToRight):
     """`Frame -> Left -> Get`
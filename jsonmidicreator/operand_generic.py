@@ -15,11 +15,12 @@ https://github.com/ruiseixasm/JsonMidiPlayer
 '''
 # Example using typing.Union (compatible with Python < 3.10)
 from typing import Union, TypeVar, TYPE_CHECKING, Type, Callable, List, Tuple, Optional, Any, Generic
-from typing import Self
+from typing import Self, Iterable
 
 from fractions import Fraction
 import enum
 import math
+import bisect
 # Json Midi Creator Libraries
 from . import creator as c
 from . import operand as o
@@ -33,20 +34,41 @@ from . import operand_rational as ra
 RED = "\033[91m"
 RESET = "\033[0m"
 
-try:
-    # pip install matplotlib
-    import matplotlib.pyplot as plt
-    from matplotlib.backend_bases import MouseEvent
-    from matplotlib.widgets import Button
-except ImportError:
-    print(f"{RED}Error: The 'matplotlib.pyplot' library is not installed.{RESET}")
-    print("Please install it by running 'pip install matplotlib'.")
-try:
-    # pip install numpy
-    import numpy as np
-except ImportError:
-    print(f"{RED}Error: The 'numpy' library is not installed.{RESET}")
-    print("Please install it by running 'pip install numpy'.")
+# The plotting libraries are slow to import, so, they are only imported by `_import_plotting` when used
+mpl = None
+plt = None
+MouseEvent = None
+Button = None
+patheffects = None
+np = None
+
+def _import_plotting() -> bool:
+    """
+    Imports on demand the `matplotlib` and `numpy` libraries used exclusively for plotting.
+    Returns False if any of them isn't installed.
+    """
+    global mpl, plt, MouseEvent, Button, patheffects, np
+    if plt is None:
+        try:
+            # pip install matplotlib
+            import matplotlib as mpl
+            import matplotlib.pyplot as plt
+            from matplotlib.backend_bases import MouseEvent
+            from matplotlib.widgets import Button
+            import matplotlib.patheffects as patheffects
+        except ImportError:
+            print(f"{RED}Error: The 'matplotlib.pyplot' library is not installed.{RESET}")
+            print("Please install it by running 'pip install matplotlib'.")
+            return False
+    if np is None:
+        try:
+            # pip install numpy
+            import numpy as np
+        except ImportError:
+            print(f"{RED}Error: The 'numpy' library is not installed.{RESET}")
+            print("Please install it by running 'pip install numpy'.")
+            return False
+    return True
 
 
 class Generic(o.Operand):
@@ -346,6 +368,14 @@ class TimeSignature(Generic):
             not (isinstance(bottom, int) and bottom > 0) else int(math.pow(2, int(max(0, math.log2(  bottom  )))))
         super().__init__()
 
+    def copy(self, *parameters) -> Self:
+        if type(self) is not TimeSignature:
+            return super().copy(*parameters)
+        self_copy: TimeSignature = self._clone()  # Only immutable attributes
+        for single_parameter in parameters:
+            self_copy << single_parameter
+        return self_copy
+
     def __mod__(self, operand: o.T) -> o.T:
         match operand:
             case od.Pipe():
@@ -372,6 +402,8 @@ class TimeSignature(Generic):
         return  self._top           == other_signature._top \
             and self._bottom        == other_signature._bottom
     
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("top", "_top"), ("bottom", "_bottom"))
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["top"]    = self.serialize( self._top )
@@ -415,6 +447,27 @@ class TimeSignature(Generic):
         return self
 
 
+# Interned time signatures shared by reference among the elements, so, they shall never be changed in place
+_shared_time_signatures: dict[tuple[int, int], TimeSignature] = {}
+
+def shared_time_signature(time_signature: TimeSignature) -> TimeSignature:
+    """
+    Returns the interned `TimeSignature` equal to the given one, shared by all elements with the same meter. \
+        Changing the meter of an element replaces its `TimeSignature` instead of changing the shared one.
+
+    Args:
+        time_signature (TimeSignature): The time signature to be matched.
+
+    Returns:
+        TimeSignature: The shared time signature with the same top and bottom.
+    """
+    signature_key: tuple[int, int] = (time_signature._top, time_signature._bottom)
+    shared_signature: TimeSignature | None = _shared_time_signatures.get(signature_key)
+    if shared_signature is None:
+        shared_signature = _shared_time_signatures[signature_key] = TimeSignature(*signature_key)
+    return shared_signature
+
+
 class Dot(Generic):
     """`Generic -> Dot`
 
@@ -676,7 +729,7 @@ class Pitch(Generic):
     """
     def __init__(self, *parameters):
         self._key_signature: ou.KeySignature \
-                                        = settings % ou.KeySignature()
+                                        = ou.shared_key_signature(settings._key_signature)
         self._tonic_key: int            = self._key_signature.get_tonic_key()
         self._octave_0: int             = 5     # By default it's the 4th Octave, that's 5 in 0 based!
         self._degree_0: int             = 0     # By default it's Degree 1, that's 0 in 0 based
@@ -685,6 +738,15 @@ class Pitch(Generic):
         self._scale: list[int]          = []
         super().__init__(*parameters)
 
+    def copy(self, *parameters) -> Self:
+        if type(self) is not Pitch:
+            return super().copy(*parameters)
+        self_copy: Pitch = self._clone()   # The key signature is shared
+        self_copy._scale            = self._scale.copy()
+        for single_parameter in parameters:
+            self_copy << single_parameter
+        return self_copy
+
 
     """
     PITCH CLASS PRINCIPLES FOR SETTING ITS KEYS
@@ -852,13 +914,26 @@ class Pitch(Generic):
         return self
 
 
+    # (pitch state, absolute pitch) of the last absolute pitch computed from the key signature
+    _absolute_pitch_cache: tuple | None = None
+
     def get_absolute_pitch(self) -> int:
         """
         Returns the final chromatic pitch with a midi value from 0 to 127.
         """
         octave_key: int = self._octave_0 * 12
-        target_key: int = self._get_target_key()
-        return octave_key + target_key
+        if self._transposition and self._scale or not (self._degree_0 or self._transposition):
+            # Either the scale list may change in place or no key signature degrees are stepped
+            return octave_key + self._get_target_key()
+        # Keyed by all the state it depends on, so, any mutation of self invalidates it
+        pitch_state: tuple = (self._tonic_key, self._octave_0, self._degree_0, self._accidental,
+                              self._transposition, self._key_signature._mode_0)
+        absolute_pitch_cache: tuple | None = self._absolute_pitch_cache
+        if absolute_pitch_cache is not None and absolute_pitch_cache[0] == pitch_state:
+            return absolute_pitch_cache[1]
+        absolute_pitch: int = octave_key + self._get_target_key()
+        self._absolute_pitch_cache = (pitch_state, absolute_pitch)
+        return absolute_pitch
 
     def set_absolute_pitch(self, chromatic_pitch: int) -> Self:
         """
@@ -923,7 +998,7 @@ class Pitch(Generic):
         match operand:
             case od.Pipe():
                 match operand._data:
-                    case ou.KeySignature(): return self._key_signature
+                    case ou.KeySignature(): return self._key_signature.copy()  # The key signature is shared
                     case ou.Octave():
                         return operand._data << od.Pipe(self._octave_0)
                     case ou.TonicKey():
@@ -1006,6 +1081,12 @@ class Pitch(Generic):
             case _:
                 return super().__mod__(operand)
 
+    _serialization_attributes: tuple[tuple[str, str], ...] = (
+        ("key_signature", "_key_signature"), ("tonic_key", "_tonic_key"), ("octave_0", "_octave_0"),
+        ("degree_0", "_degree_0"), ("accidental", "_accidental"), ("transposition", "_transposition"),
+        ("scale", "_scale")
+    )
+
     def getSerialization(self) -> dict:
 
         serialization = super().getSerialization()
@@ -1027,7 +1108,7 @@ class Pitch(Generic):
             "transposition" in serialization["parameters"] and "scale" in serialization["parameters"]):
 
             super().loadSerialization(serialization)
-            self._key_signature = self.deserialize( serialization["parameters"]["key_signature"] )
+            self._key_signature = ou.shared_key_signature( self.deserialize( serialization["parameters"]["key_signature"] ) )
             self._tonic_key     = self.deserialize( serialization["parameters"]["tonic_key"] )
             self._octave_0      = self.deserialize( serialization["parameters"]["octave_0"] )
             self._degree_0      = self.deserialize( serialization["parameters"]["degree_0"] )
@@ -1036,12 +1117,16 @@ class Pitch(Generic):
             self._scale         = self.deserialize( serialization["parameters"]["scale"] )
         return self
 
+    def _loaded_serialization(self) -> Self:
+        self._key_signature = ou.shared_key_signature(self._key_signature)
+        return super()._loaded_serialization()
+
     def __lshift__(self, operand: any) -> Self:
         operand = self._tail_wrap(operand)    # Processes the tailed self operands if existent
         match operand:
             case Pitch():
                 super().__lshift__(operand)
-                self._key_signature         << operand._key_signature
+                self._key_signature         = ou.shared_key_signature(operand._key_signature)
                 self._tonic_key             = operand._tonic_key
                 self._octave_0              = operand._octave_0
                 self._degree_0              = operand._degree_0
@@ -1051,7 +1136,7 @@ class Pitch(Generic):
             case od.Pipe():
                 match operand._data:
                     case ou.KeySignature(): # Preserves the chromatic_pitch
-                        self._key_signature = operand._data
+                        self._key_signature = ou.shared_key_signature(operand._data)
 
                     case ou.TonicKey():    # Must come before than Key()
                         self._octave_0 = operand._data._unit // 12
@@ -1090,11 +1175,11 @@ class Pitch(Generic):
             # Setting of the KeySignature and respective parameters
             case ou.KeySignature(): # Preserves the Semitone
                 original_semitone = self % ou.Semitone()
-                self._key_signature << operand
+                self._key_signature = ou.shared_key_signature(self._key_signature.copy() << operand)
                 self._tonic_key = self._key_signature.get_tonic_key()   # Setting a Key Signature adjusts the Tonic Key accordingly
                 self << original_semitone
             case ou.Quality() | ou.Mode() | ou.Accidentals():
-                self._key_signature << operand
+                self._key_signature = ou.shared_key_signature(self._key_signature.copy() << operand)
                 self._tonic_key = self._key_signature.get_tonic_key()   # Setting a Key Signature adjusts the Tonic Key accordingly
 
             case ou.AbsolutePitch():
@@ -1417,6 +1502,10 @@ class Controller(Generic):
             return other == self
         return self % other == other
     
+    _serialization_attributes: tuple[tuple[str, str], ...] = (
+        ("number_msb", "_number_msb"), ("lsb", "_lsb"), ("nrpn", "_nrpn"), ("high", "_high")
+    )
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["number_msb"]   = self.serialize( self._number_msb )
@@ -1534,8 +1623,55 @@ class Scale(Generic):
             degree._unit = steps
         return degree
 
+    # Keys of the scale degrees above the tonic, in (0, 12], and below it, in [-12, 0), for each distinct scale
+    _transpose_tables: dict[tuple[int], tuple[tuple[int], tuple[int]] | None] = {}
+    # The `_scales` entries, by their id, with their tables for each tonic offset, these are the same tuples
+    # returned by `KeySignature.get_scale`, so, they are found without hashing or copying the scale
+    _scales_tables: dict[int, tuple[tuple[int], tuple[tuple[tuple[int], tuple[int]] | None, ...]]] = {}
+
+    @staticmethod
+    def transpose_table(scale: list[int] | tuple[int]) -> tuple[tuple[int], tuple[int]] | None:
+        """
+        Returns the lookup table of the keys of each degree of the given scale, computed once for each distinct scale.
+
+        Args:
+            scale (list | tuple): A scale of 12 keys, with 1 for the keys in the scale and 0 for the others.
+
+        Returns:
+            tuple: The keys of the degrees going up and going down, or None if the scale isn't a valid one.
+        """
+        scale = tuple(scale)
+        if scale in Scale._transpose_tables:
+            return Scale._transpose_tables[scale]
+        transpose_table = None
+        if len(scale) == 12 and sum(scale) > 0 and all(key in (0, 1) for key in scale):
+            transpose_table = (
+                tuple(key for key in range(1, 13) if scale[key % 12]),
+                tuple(key for key in range(-1, -13, -1) if scale[key % 12])
+            )
+        Scale._transpose_tables[scale] = transpose_table
+        return transpose_table
+
+    @staticmethod
+    def _table_transpose_key(steps: int, transpose_table: tuple[tuple[int], tuple[int]]) -> int:
+        if steps > 0:
+            if steps <= len(transpose_table[0]):    # Within the octave
+                return transpose_table[0][steps - 1]
+            octaves, degree_0 = divmod(steps - 1, len(transpose_table[0]))
+            return octaves * 12 + transpose_table[0][degree_0]
+        if steps < 0:
+            if -steps <= len(transpose_table[1]):
+                return transpose_table[1][-steps - 1]
+            octaves, degree_0 = divmod(-steps - 1, len(transpose_table[1]))
+            return transpose_table[1][degree_0] - octaves * 12
+        return 0
+
     @staticmethod
     def transpose_key(steps: int = 4, scale: list[int] | tuple[int] = (1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1)) -> int:
+        # Only the known scales are looked up, any other is stepped through as it may change in place
+        scale_tables = Scale._scales_tables.get(id(scale))
+        if scale_tables is not None and scale_tables[0] is scale and type(steps) is int and scale_tables[1][0]:
+            return Scale._table_transpose_key(steps, scale_tables[1][0])
         # The given scale shall always have a size of 12
         scale_transposition: int = 0
         if len(scale) == 12 and sum(scale) > 0:
@@ -1549,6 +1685,11 @@ class Scale(Generic):
 
     @staticmethod
     def modulate_key(tonic_offset: int = 0, degrees_0: int = 4, scale: list[int] = [1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1]) -> int:
+        scale_tables = Scale._scales_tables.get(id(scale))
+        if scale_tables is not None and scale_tables[0] is scale and type(degrees_0) is int \
+                and type(tonic_offset) is int and scale_tables[1][tonic_offset % 12]:
+            # Same as transposing the scale rotated to the tonic offset
+            return Scale._table_transpose_key(degrees_0, scale_tables[1][tonic_offset % 12])
         # The given scale shall always have a size of 12
         tonic_modulation: int = 0
         if len(scale) == 12 and sum(scale) > 0:
@@ -1594,6 +1735,8 @@ class Scale(Generic):
     @staticmethod
     def plot(block: bool = True, scale: list[int] = [1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1], tonic_key: ou.Key = ou.Key(), key_signature: str = None):
 
+        if not _import_plotting():
+            return
         tonic_int: int = tonic_key % int()
         # Enable interactive mode (doesn't block the execution)
         plt.ion()
@@ -1953,6 +2096,12 @@ class Scale(Generic):
                 return Scale._scales[scale_number]
         return tuple([])    # Has no scale at all
 
+# All the known scales have their lookup tables upfront, for each rotation of the scale
+for known_scale in Scale._scales:
+    Scale._scales_tables[id(known_scale)] = (known_scale, tuple(
+        Scale.transpose_table(known_scale[tonic_offset:] + known_scale[:tonic_offset]) for tonic_offset in range(12)
+    ))
+
 
 class PitchTransitions(Generic):
     """`Generic -> PitchTransitions`
@@ -2896,7 +3045,7 @@ class Process(Generic):
 
 
     @staticmethod
-    def _clocked_playlist(operand: o.T) -> list[dict]:
+    def _clocked_playlist(operand: o.T) -> Iterable[dict]:
         from . import operand_element as oe
         from . import operand_container as oc
 
@@ -2910,8 +3059,18 @@ class Process(Generic):
                 clock_length: ra.Length = (operand.net_finish() % ra.Length()).roundMeasures()
                 default_clock: oe.Clock = settings % oe.Clock()
                 default_clock._duration_beats = ra.Duration(clock_length)._rational # The same staff will be given next
+                if isinstance(operand, (oc.Section, oc.Part)):
+                    # Streams the Clock and the Operand playlists merged by time, consumed as they are generated
+                    return c.merge_playlists([
+                        default_clock.getPlaylist( time_signature = operand._get_time_signature() ),
+                        operand.iterPlaylist()
+                    ])
                 playlist.extend( default_clock.getPlaylist( time_signature = operand._get_time_signature() ) )  # Clock Playlist
-                playlist.extend( operand.getPlaylist() )    # Operand Playlist
+                if isinstance(operand, oe.Clock):
+                    # Pulses kept as a periodic entry, expanded only when exported or played
+                    playlist.extend( operand.getPlaylist( periodic = True ) )
+                else:
+                    playlist.extend( operand.getPlaylist() )    # Operand Playlist
             case od.Playlist():
 
                 operand_playlist = operand.getPlaylist()
@@ -3109,7 +3268,7 @@ class Save(ReadOnly):
 
     Parameters
     ----------
-    None, str() : The filename of the Operand's serialization data.
+    None, str() : The filename of the Operand's serialization data, a ".jmcb" extension saves it in the binary format.
     """
     def __init__(self, filename: str | None = None):
         super().__init__(filename)
@@ -3126,7 +3285,10 @@ class Save(ReadOnly):
                     file_path = folder + "json/_Save_jsonMidiCreator.json"
             else: # Folder is just a prefix
                 file_path = folder + file_path
-            c.saveJsonMidiCreator(operand.getSerialization(), file_path)
+            if file_path.endswith(".jmcb"):
+                c.saveBinaryMidiCreator(operand.getBinarySerialization(), file_path)
+            else:
+                c.saveJsonMidiCreator(operand.getSerialization(), file_path)
             return operand
         return super().__rrshift__(operand)
 
@@ -3155,7 +3317,7 @@ class Export(ReadOnly):
                         file_path = folder + "json/_Export_jsonMidiPlayer.json"
                 else: # Folder is just a prefix
                     file_path = folder + file_path
-                playlist: list[dict] = self._clocked_playlist(operand)
+                playlist: Iterable[dict] = self._clocked_playlist(operand)
                 c.saveJsonMidiPlay(playlist, file_path)
                 return operand
             case _:
@@ -3189,7 +3351,10 @@ class Render(ReadOnly):
         # Rendering of the midi file
         match operand:
             case oc.Composition() | oe.Element():
-                c.saveMidiFile(operand.getMidilist(), file_path)
+                tempo_changes: list[tuple[float, float]] | None = None
+                if settings._tempo_map is not None:
+                    tempo_changes = settings._tempo_map.tempo_events(settings._quantization)
+                c.saveMidiFile(operand.getMidilist(), file_path, tempo_changes=tempo_changes)
                 return operand
             case od.Line():
                 line_clip = oc.Clip(operand)
@@ -3201,28 +3366,6 @@ class Render(ReadOnly):
 
 
 
-# Define ANSI escape codes for colors
-RED = "\033[91m"
-RESET = "\033[0m"
-        
-try:
-    # pip install matplotlib
-    import matplotlib as mpl
-    import matplotlib.pyplot as plt
-    from matplotlib.backend_bases import MouseEvent
-    from matplotlib.widgets import Button
-    import matplotlib.patheffects as patheffects
-except ImportError:
-    print(f"{RED}Error: The 'matplotlib.pyplot' library is not installed.{RESET}")
-    print("Please install it by running 'pip install matplotlib'.")
-try:
-    # pip install numpy
-    import numpy as np
-except ImportError:
-    print(f"{RED}Error: The 'numpy' library is not installed.{RESET}")
-    print("Please install it by running 'pip install numpy'.")
-
-
 
 class Plot(ReadOnly):
     """`Generic -> Process -> ReadOnly -> Plot`
@@ -4006,7 +4149,7 @@ class Plot(ReadOnly):
         return self
 
     @staticmethod
-    def _disable_button(button: Button) -> Button:
+    def _disable_button(button: 'Button') -> 'Button':
         # Set disabled style
         button.label.set_color('lightgray')         # Light text
         button.ax.set_facecolor('none')             # No fill color
@@ -4016,7 +4159,7 @@ class Plot(ReadOnly):
         return button
 
     @staticmethod
-    def _enable_button(button: Button) -> Button:
+    def _enable_button(button: 'Button') -> 'Button':
         # Set enabled style
         button.ax.set_facecolor('white')
         button.hovercolor = 'gray'
@@ -4025,12 +4168,12 @@ class Plot(ReadOnly):
             spine.set_color('black')
         return button
 
-    def _on_move(self, event: MouseEvent) -> Self:
+    def _on_move(self, event: 'MouseEvent') -> Self:
         if event.inaxes == self._ax:
             print(f"x = {event.xdata}, y = {event.ydata}")
         return self
 
-    def _on_key(self, event: MouseEvent) -> Self:
+    def _on_key(self, event: 'MouseEvent') -> Self:
         match event.key:
             case 'ctrl+p' | 'ctrl+enter':
                 self._run_play(event, 4)
@@ -4058,7 +4201,7 @@ class Plot(ReadOnly):
                 self._run_last(event)
         return self
     
-    def _onclick(self, event: MouseEvent) -> Self:
+    def _onclick(self, event: 'MouseEvent') -> Self:
         import threading
         from . import operand_element as oe
         from . import operand_container as oc
@@ -4111,6 +4254,8 @@ class Plot(ReadOnly):
         Returns:
             Composition: Returns the presently plotted composition.
         """
+        if not _import_plotting():
+            return composition
         from . import operand_element as oe
         from . import operand_container as oc
         # First composition and its plotting (i = 0) it's always the self copy
@@ -4269,6 +4414,8 @@ class Plot(ReadOnly):
         Returns:
             Composition: Returns the presently plotted composition.
         """
+        if not _import_plotting():
+            return None
         from . import operand_element as oe
         from . import operand_container as oc
         # First composition and its plotting (i = 0) it's always the self copy
@@ -4458,7 +4605,7 @@ class Play(ReadOnly):
         match operand:
             case oc.Composition():
                 if operand._items:
-                    playlist: list[dict] = self._clocked_playlist(operand)  # Where the heavy lifting method is called
+                    playlist: Iterable[dict] = self._clocked_playlist(operand)  # Where the heavy lifting method is called
                     if self._parameters[1] and self._parameters[2]:
                         # Start the function in a new process
                         process = threading.Thread(target=c.jsonMidiPlay, args=(playlist, self._parameters[0], self._parameters[3]))
@@ -4472,7 +4619,7 @@ class Play(ReadOnly):
                     print(f"Warning: Trying to play an **empty** list!")
                 return operand
             case oe.Element():
-                playlist: list[dict] = self._clocked_playlist(operand)  # Where the heavy lifting method is called
+                playlist: Iterable[dict] = self._clocked_playlist(operand)  # Where the heavy lifting method is called
                 if self._parameters[1] and self._parameters[2]:
                     # Start the function in a new process
                     process = threading.Thread(target=c.jsonMidiPlay, args=(playlist, self._parameters[0], self._parameters[3]))
@@ -4490,7 +4637,7 @@ class Play(ReadOnly):
                 line = od.Line(operand)
                 self.__rrshift__(line)
             case od.Playlist():
-                playlist: list[dict] = self._clocked_playlist(operand)  # Where the heavy lifting method is called
+                playlist: Iterable[dict] = self._clocked_playlist(operand)  # Where the heavy lifting method is called
                 c.jsonMidiPlay(playlist, self._parameters[0], self._parameters[3])
                 return operand
             case _:
@@ -5385,6 +5532,201 @@ class PartProcess(CompositionProcess):
         return super().__rrshift__(operand)    
 
 
+class TempoMap(Generic):
+    """`Generic -> TempoMap`
+
+    A `TempoMap` sets the tempo changes along the composition, where each change is either instantaneous \
+        or a linear tempo ramp that ends on it. Once set in the `defaults`, all the beats positions are \
+        converted to milliseconds accordingly to it, with a prefix sums table of the changes.
+
+    Parameters
+    ----------
+    Tempo(120), int, float : The starting tempo measured in BPM, Beats Per Minute.
+    """
+    def __init__(self, *parameters):
+        self._tempo: Fraction = settings._tempo
+        self._changes: list[list[Fraction | bool]] = []  # [position beats, tempo, ramp] sorted by position
+        self._compiled: tuple[list, ...] | None = None
+        super().__init__(*parameters)
+
+    def change(self, position: Union['ra.Position', 'ra.TimeValue', int, float, Fraction],
+               tempo: Union['ra.Tempo', int, float, Fraction], ramp: bool = False) -> Self:
+        """
+        Adds a tempo change, replacing any previous one at the same position.
+
+        Args:
+            position (Position): The position of the change, with numbers as `Beats`.
+            tempo (Tempo): The tempo in BPM reached at the position.
+            ramp (bool): If `True` the tempo changes linearly from the previous change until this one.
+
+        Returns:
+            TempoMap: The same self object.
+        """
+        position_beats: Fraction = ra.Beats(position) % Fraction()
+        tempo_bpm: Fraction = ra.Tempo(tempo)._rational
+        if position_beats >= 0 and tempo_bpm > 0:
+            self._changes = [
+                single_change for single_change in self._changes if single_change[0] != position_beats
+            ]
+            self._changes.append([position_beats, tempo_bpm, bool(ramp)])
+            self._changes.sort(key=lambda single_change: single_change[0])
+            self._compiled = None
+        return self
+
+    def _compile(self) -> tuple[list, ...]:
+        """
+        Compiles the changes into contiguous segments, each one with its start in beats and in milliseconds \
+            (the prefix sums), its milliseconds per beat at the start and its relative tempo rate per beat.
+        Everything is kept as `Fraction` except the milliseconds of the ramps, given that their logarithm \
+            isn't rational, so, the start in milliseconds of the segments after a ramp is a `float`.
+        """
+        if self._compiled is None:
+            start_beats: list[Fraction] = [Fraction(0)]
+            start_ms: list[Fraction | float] = [Fraction(0)]
+            ms_per_beat: list[Fraction] = [60_000 / self._tempo]
+            tempo_rates: list[Fraction] = [Fraction(0)]
+            segment_tempo: Fraction = self._tempo
+            for position_beats, tempo_bpm, ramp in self._changes:
+                segment_beats: Fraction = position_beats - start_beats[-1]
+                if ramp and segment_beats > 0:
+                    # Tempo grows linearly as `tempo(x) = start_tempo * (1 + rate * x)` along the segment
+                    tempo_rates[-1] = (tempo_bpm / segment_tempo - 1) / segment_beats
+                if segment_beats > 0:
+                    start_ms.append(start_ms[-1] + self._segment_ms(ms_per_beat[-1], tempo_rates[-1], segment_beats))
+                    start_beats.append(position_beats)
+                    ms_per_beat.append(60_000 / tempo_bpm)
+                    tempo_rates.append(Fraction(0))
+                else:   # A change at the start of the segment just replaces its tempo
+                    ms_per_beat[-1] = 60_000 / tempo_bpm
+                segment_tempo = tempo_bpm
+            self._compiled = (start_beats, start_ms, ms_per_beat, tempo_rates)
+        return self._compiled
+
+    @staticmethod
+    def _segment_ms(ms_per_beat: Fraction, tempo_rate: Fraction, beats: Fraction | float) -> Fraction | float:
+        # The exact integral of `ms_per_beat / (1 + rate * x)` for the ramps
+        if tempo_rate == 0 or beats <= 0:
+            return ms_per_beat * beats
+        return float(ms_per_beat) * math.log1p(float(tempo_rate * beats)) / float(tempo_rate)
+
+    def beats_to_time_ms(self, beats: Fraction | float) -> float:
+        """
+        Converts a position in beats to milliseconds with one bisect of the compiled segments.
+
+        Args:
+            beats (Fraction): The position in beats.
+
+        Returns:
+            float: The respective time in milliseconds.
+        """
+        start_beats, start_ms, ms_per_beat, tempo_rates = self._compile()
+        segment: int = max(0, bisect.bisect_right(start_beats, beats) - 1)
+        return round(float(
+            start_ms[segment] + self._segment_ms(ms_per_beat[segment], tempo_rates[segment], beats - start_beats[segment])
+        ), 3)
+
+    def ticks_to_time_ms(self, ticks: int, denominator: int = 1) -> float:
+        """Same as `beats_to_time_ms` for `beats = ticks / denominator / TICKS_PER_BEAT`."""
+        return self.beats_to_time_ms(Fraction(ticks, denominator * o.TICKS_PER_BEAT))
+
+    def tempo_at(self, beats: Fraction | float) -> float:
+        """Returns the tempo in BPM at the given position in beats."""
+        start_beats, start_ms, ms_per_beat, tempo_rates = self._compile()
+        segment: int = max(0, bisect.bisect_right(start_beats, beats) - 1)
+        return float(60_000 / ms_per_beat[segment] * (1 + tempo_rates[segment] * max(0, beats - start_beats[segment])))
+
+    def tempo_events(self, resolution_beats: Fraction | float) -> list[tuple[float, float]]:
+        """
+        Returns the `(beats, tempo)` events of a midi file, where each ramp is split in steps of the given \
+            resolution, with the average tempo of each step, so that the steps end at the exact same times.
+
+        Args:
+            resolution_beats (Fraction): The length in beats of each ramp step.
+
+        Returns:
+            list[tuple[float, float]]: The tempo events sorted by position.
+        """
+        start_beats, start_ms, ms_per_beat, tempo_rates = self._compile()
+        tempo_events: list[tuple[float, float]] = []
+        for segment, segment_beats in enumerate(start_beats):
+            if tempo_rates[segment] == 0 or resolution_beats <= 0:
+                tempo_events.append((float(segment_beats), float(60_000 / ms_per_beat[segment])))
+                continue
+            end_beats: Fraction = start_beats[segment + 1]
+            step_beats: Fraction = segment_beats
+            while step_beats < end_beats:
+                next_beats: Fraction = min(end_beats, step_beats + resolution_beats)
+                step_ms: float = self._segment_ms(ms_per_beat[segment], tempo_rates[segment], next_beats - segment_beats) \
+                    - self._segment_ms(ms_per_beat[segment], tempo_rates[segment], step_beats - segment_beats)
+                tempo_events.append((float(step_beats), float(60_000 * (next_beats - step_beats)) / step_ms))
+                step_beats = next_beats
+        return tempo_events
+
+
+    def __mod__(self, operand: o.T) -> o.T:
+        match operand:
+            case od.Pipe():
+                match operand._data:
+                    case ra.Tempo():            return ra.Tempo(self._tempo)
+                    case list():                return self._changes
+                    case _:                     return super().__mod__(operand)
+            case ra.Tempo():            return ra.Tempo(self._tempo)
+            case list():                return self.deep_copy(self._changes)
+            case _:                     return super().__mod__(operand)
+
+    def __eq__(self, other: 'TempoMap') -> bool:
+        if type(self) != type(other):
+            return False
+        if isinstance(other, od.Conditional):
+            return other == self
+        return  self._tempo     == other._tempo \
+            and self._changes   == other._changes
+
+    def getSerialization(self) -> dict:
+        serialization = super().getSerialization()
+        serialization["parameters"]["tempo"]    = self.serialize( self._tempo )
+        serialization["parameters"]["changes"]  = self.serialize( self._changes )
+        return serialization
+
+    # CHAINABLE OPERATIONS
+
+    def loadSerialization(self, serialization: dict) -> Self:
+        if isinstance(serialization, dict) and ("class" in serialization and serialization["class"] == self.__class__.__name__ and "parameters" in serialization and
+            "tempo" in serialization["parameters"] and "changes" in serialization["parameters"]):
+
+            super().loadSerialization(serialization)
+            self._tempo     = self.deserialize( serialization["parameters"]["tempo"] )
+            self._changes   = self.deserialize( serialization["parameters"]["changes"] )
+            self._compiled  = None
+        return self
+
+    def __lshift__(self, operand: any) -> Self:
+        operand = self._tail_wrap(operand)    # Processes the tailed self operands if existent
+        match operand:
+            case TempoMap():
+                super().__lshift__(operand)
+                self._tempo     = operand._tempo
+                self._changes   = self.deep_copy(operand._changes)
+            case od.Pipe():
+                match operand._data:
+                    case ra.Tempo():        self._tempo = operand._data._rational
+                    case list():            self._changes = operand._data
+            case od.Serialization():
+                self.loadSerialization( operand.getSerialization() )
+            case ra.Tempo():
+                if operand > 0:
+                    self._tempo = operand._rational
+            case int() | float() | Fraction():
+                self << ra.Tempo(operand)
+            case tuple():
+                for single_operand in operand:
+                    self << single_operand
+            case _:
+                super().__lshift__(operand)
+        self._compiled = None
+        return self
+
+
 class Settings(Generic):
     """`Generic -> Settings`
 
@@ -5396,6 +5738,7 @@ class Settings(Generic):
     Parameters
     ----------
     Tempo(120), int, float : The typical tempo measured in BPM, Beats Per Minute.
+    TempoMap() : Optional tempo changes along the composition, starting at the `Tempo`, by default there are none.
     Quantization(1/16) : This sets the Duration of a single `Step`, so, it works like a finer resolution than the `Beat`.
     TimeSignature(4, 4) : Represents the typical Time Signature of a staff.
     KeySignature() : Follows the Circle of Fifths with the setting of the amount of `Sharps` or `Flats`.
@@ -5413,6 +5756,7 @@ class Settings(Generic):
     def __init__(self, *parameters):
         super().__init__()
         self._tempo: Fraction                       = Fraction(120)
+        self._tempo_map: TempoMap | None            = None
         self._quantization: Fraction                = Fraction(1/4) # Quantization is in Beats ratio
         self._time_signature: TimeSignature         = TimeSignature(4, 4)
         self._key_signature: ou.KeySignature        = ou.KeySignature()
@@ -5441,6 +5785,20 @@ class Settings(Generic):
     def minutes_to_beats(self, minutes: Fraction) -> Fraction:
         return minutes * self._tempo
 
+    def beats_to_time_ms(self, beats: Fraction) -> float:
+        if self._tempo_map is not None:
+            return self._tempo_map.beats_to_time_ms(beats)
+        beats_ticks: int | None = o.beats_to_ticks(beats)
+        if beats_ticks is None: # Off the tick grid, uses the exact Fraction math instead
+            return o.minutes_to_time_ms(self.beats_to_minutes(beats))
+        return o.ticks_to_time_ms(beats_ticks, self._tempo)
+
+    def tempo_at(self, beats: Fraction) -> float:
+        """Returns the tempo in BPM at the given position in beats, accordingly to the `TempoMap` if any."""
+        if self._tempo_map is not None:
+            return self._tempo_map.tempo_at(beats)
+        return float(self._tempo)
+
 
     def __mod__(self, operand: o.T) -> o.T:
         from . import operand_element as oe
@@ -5449,6 +5807,7 @@ class Settings(Generic):
             case od.Pipe():
                 match operand._data:
                     case ra.Tempo():            return ra.Tempo(self._tempo)
+                    case TempoMap():            return self._tempo_map
                     case ra.Quantization():     return operand._data << self._quantization
                     case ra.StepsPerNote():
                         return ra.StepsPerNote() << od.Pipe( 1 / self._quantization )
@@ -5465,6 +5824,10 @@ class Settings(Generic):
                     case od.Folder():           return od.Folder(self._folder)
                     case _:                     return super().__mod__(operand)
             case ra.Tempo():            return ra.Tempo(self._tempo)
+            case TempoMap():
+                if self._tempo_map is None:
+                    return TempoMap(ra.Tempo(self._tempo))
+                return self._tempo_map.copy()
             case ra.Quantization():     return operand.copy(self._quantization)
             case ra.StepsPerNote():
                 return ra.StepsPerNote() << 1 / self._quantization
@@ -5502,6 +5865,7 @@ class Settings(Generic):
         if isinstance(other, od.Conditional):
             return other == self
         return  self._tempo                 == other._tempo \
+            and self._tempo_map             == other._tempo_map \
             and self._quantization          == other._quantization \
             and self._time_signature        == other._time_signature \
             and self._key_signature         == other._key_signature \
@@ -5515,12 +5879,15 @@ class Settings(Generic):
 
     def getPlaylist(self, position_beats: Fraction | None = None) -> list[dict]:
         if isinstance(position_beats, Fraction):
+            if self._tempo_map is not None:
+                return [{ "time_ms": self._tempo_map.beats_to_time_ms(position_beats) }]
             return [{ "time_ms": o.minutes_to_time_ms( self.beats_to_minutes(position_beats) ) }]
         return [{ "time_ms": 0.0 }]
 
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["tempo"]                = self.serialize( self._tempo )
+        serialization["parameters"]["tempo_map"]            = self.serialize( self._tempo_map )
         serialization["parameters"]["quantization"]         = self.serialize( self._quantization )
         serialization["parameters"]["time_signature"]       = self.serialize( self._time_signature )
         serialization["parameters"]["key_signature"]        = self.serialize( self._key_signature )
@@ -5543,6 +5910,8 @@ class Settings(Generic):
 
             super().loadSerialization(serialization)
             self._tempo                 = self.deserialize( serialization["parameters"]["tempo"] )
+            if "tempo_map" in serialization["parameters"]:  # Optional to keep older serializations loadable
+                self._tempo_map         = self.deserialize( serialization["parameters"]["tempo_map"] )
             self._quantization          = self.deserialize( serialization["parameters"]["quantization"] )
             self._time_signature        = self.deserialize( serialization["parameters"]["time_signature"] )
             self._key_signature         = self.deserialize( serialization["parameters"]["key_signature"] )
@@ -5562,6 +5931,7 @@ class Settings(Generic):
             case Settings():
                 super().__lshift__(operand)
                 self._tempo                 = operand._tempo
+                self._tempo_map             = self.deep_copy(operand._tempo_map)
                 self._quantization          = operand._quantization
                 self._time_signature        << operand._time_signature
                 self._key_signature         << operand._key_signature
@@ -5574,9 +5944,10 @@ class Settings(Generic):
             case od.Pipe():
                 match operand._data:
                     case ra.Tempo():                self._tempo = operand._data._rational
+                    case TempoMap():                self._tempo_map = operand._data
                     case ra.Quantization():         self._quantization = operand._data._rational
-                    case TimeSignature():           self._time_signature = operand._data
-                    case ou.KeySignature():         self._key_signature = operand._data
+                    case TimeSignature():           self._time_signature = operand._data.copy()
+                    case ou.KeySignature():         self._key_signature = operand._data.copy()
                     case Controller():              self._controller = operand._data
                     case oc.ClockedDevices():       self._clocked_devices = operand._data % od.Pipe( list() )
                     case oc.ControlledDevices():    self._controlled_devices = operand._data % od.Pipe( list() )
@@ -5585,7 +5956,14 @@ class Settings(Generic):
                     case od.Folder():               self._folder = operand._data._data
             case od.Serialization():
                 self.loadSerialization( operand.getSerialization() )
-            case ra.Tempo():            self._tempo = operand._rational
+            case ra.Tempo():
+                self._tempo = operand._rational
+                if self._tempo_map is not None:
+                    self._tempo_map << operand
+            case TempoMap():
+                # Without changes it's just a constant tempo
+                self._tempo = operand._tempo
+                self._tempo_map = operand.copy() if operand._changes else None
             case ra.Quantization():     self._quantization = operand._rational
             case ra.StepsPerNote():
                 self._quantization = 1 / (operand % Fraction())
@@ -5625,6 +6003,8 @@ class Settings(Generic):
                 return self
             case ra.Tempo():
                 self._tempo += operand._rational
+                if self._tempo_map is not None:
+                    self._tempo_map << ra.Tempo(self._tempo)
                 return self
         return super().__iadd__(operand)
 
@@ -5638,6 +6018,8 @@ class Settings(Generic):
                 return self
             case ra.Tempo():
                 self._tempo -= operand._rational
+                if self._tempo_map is not None:
+                    self._tempo_map << ra.Tempo(self._tempo)
                 return self
         return super().__isub__(operand)
 
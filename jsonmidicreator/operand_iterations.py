@@ -19,6 +19,10 @@ from typing import Self
 
 from fractions import Fraction
 import json
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Json Midi Creator Libraries
 from . import creator as c
@@ -77,18 +81,79 @@ class Iterations(o.Operand):
     def iterate(self) -> Self:
         self._index += 1    # Each new_composition is added to the list, so, the index has to increase
         for _ in range(self._max_tries):    # Gets a non-empty iteration
-            candidate: oc.Clip = self._single_iteration()
-            if isinstance(self._next_operand, Iterations):
-                self._next_operand._seed = candidate
-                candidate = self._next_operand._single_iteration()
-            if candidate.len() > 0: # Only non empty candidates can be considered as solutions
-                if not callable(self._pre_filter) or self._pre_filter(candidate, self._seed):
-                    if callable(self._post_process):
-                        candidate = self._post_process(candidate)
+            candidate: oc.Clip | None = self._candidate()
+            if candidate is not None:
+                if not self._no_repetitions or not candidate in self._iterations:
+                    candidate._index = self._index
+                    self._iterations.append(candidate)
+                    return self
+        return self._append_empty_iteration()
+    
+    def iterate_parallel(self, iterations: int, workers: int | None = None) -> Self:
+        """
+        Does the given amount of iterations with a pool of worker processes.
+
+        Each iteration gets its own `Chaos` stream spawned from the main `Chaos` and
+        its iteration index, so the results are the same for any amount of workers.
+        Results are merged in the iterations order, where a repeated candidate keeps
+        trying its own stream while respecting both `no_repetitions` and `freeze_at`.
+        Note that these results differ from the ones given by the serial `iterate`.
+
+        Args:
+            iterations (int): The amount of new iterations.
+            workers (int): The amount of worker processes, `None` for the CPU count.
+
+        Returns:
+            Iterations: self with the new iterations added.
+        """
+        if self._freeze_at >= 0:
+            iterations = min(iterations, self._freeze_at - self._index)
+        if iterations <= 0:
+            return self
+        first_index: int = self._index + 1
+        indexes: range = range(first_index, first_index + iterations)
+        worker_iterations: Iterations = self.copy()
+        worker_iterations._iterations = []  # Keeps the workers payload small
+        try:
+            with ProcessPoolExecutor(workers) as executor:
+                results: list[tuple] = list(executor.map(
+                    parallel_candidate, [worker_iterations] * iterations, indexes, [self._max_tries] * iterations
+                ))
+        # Not picklable filter or process functions (like lambdas) or workers that died
+        except (pickle.PicklingError, AttributeError, BrokenProcessPool) as e:
+            logging.warning(f"Parallel iterations unavailable, processing them serially ({e})")
+            results = [
+                parallel_candidate(worker_iterations.copy(), index, self._max_tries) for index in indexes
+            ]
+        for candidate, tries_left, spawned_iterations in results:
+            self._index += 1
+            while True:
+                if candidate is not None:
                     if not self._no_repetitions or not candidate in self._iterations:
                         candidate._index = self._index
                         self._iterations.append(candidate)
-                        return self
+                        break
+                if tries_left == 0:
+                    self._append_empty_iteration()
+                    break
+                # Repeated candidate, carries on with the same spawned Chaos stream
+                candidate, tries_left, spawned_iterations = parallel_candidate(spawned_iterations, None, tries_left)
+        return self
+
+    def _candidate(self) -> 'oc.Clip | None':
+        """Does a single try and returns the post processed candidate or None if not valid"""
+        candidate: oc.Clip = self._single_iteration()
+        if isinstance(self._next_operand, Iterations):
+            self._next_operand._seed = candidate
+            candidate = self._next_operand._single_iteration()
+        if candidate.len() > 0: # Only non empty candidates can be considered as solutions
+            if not callable(self._pre_filter) or self._pre_filter(candidate, self._seed):
+                if callable(self._post_process):
+                    candidate = self._post_process(candidate)
+                return candidate
+        return None
+
+    def _append_empty_iteration(self) -> Self:
         empty_iteration: oc.Clip = self._seed.empty_copy()
         if callable(self._post_process):
             empty_iteration = self._post_process(empty_iteration)
@@ -222,6 +287,30 @@ class Iterations(o.Operand):
         return None
     
 
+def parallel_candidate(iterations: Iterations, index: int | None, tries: int) -> tuple['oc.Clip | None', int, Iterations]:
+    """
+    Worker of `Iterations.iterate_parallel`, gets the first valid candidate for an iteration.
+
+    Args:
+        iterations (Iterations): A private copy of the `Iterations` to try with.
+        index (int): The iteration index that spawns the `Chaos` streams, `None` to carry on.
+        tries (int): The maximum amount of tries left.
+
+    Returns:
+        tuple: The candidate or None, the tries left and the `Iterations` to carry on with.
+    """
+    if index is not None:
+        iterations._chaos = iterations._chaos.spawn(index)
+        if isinstance(iterations._next_operand, Iterations):
+            iterations._next_operand._chaos = iterations._next_operand._chaos.spawn(index)
+    while tries > 0:
+        tries -= 1
+        candidate: oc.Clip | None = iterations._candidate()
+        if candidate is not None:
+            return candidate, tries, iterations
+    return None, 0, iterations
+
+
 class I_ApplyFunction(Iterations):
     def __init__(self, function: Optional[Callable[['oc.Clip'], 'oc.Clip']] = None,
                  chaos: ch.Chaos = ch.SinX(340),
@@ -511,6 +600,7 @@ class I_RemoveElements(Iterations):
     
     def _single_iteration(self) -> 'oc.Clip':
         seed_copy: oc.Clip = self._seed.empty_copy()
+        kept_elements: list[oe.Element] = []
         for single_element in self._seed._items:
             if not single_element._masked:
                 chaotic_rational: Fraction = self._trigger_steps % Fraction() % 1
@@ -518,7 +608,8 @@ class I_RemoveElements(Iterations):
                 result = 1 if 1 - chaotic_rational < self._parameter else 0
                 if result == 1:
                     continue    # Drops it, not added
-            seed_copy += single_element
+            kept_elements.append(single_element)
+        seed_copy += kept_elements  # Added all at once
         return seed_copy    # If removed no change in sorting, thus, no need to sort
 
 
@@ -122,6 +122,8 @@ class Unit(o.Operand):
     def __str__(self):
         return f'{self._unit}'
     
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("unit", "_unit"),)
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["unit"] = self._unit
@@ -410,6 +412,14 @@ class KeySignature(PitchParameter):       # Sharps (+) and Flats (-)
     def __init__(self, *parameters):
         self._mode_0: int = 0
         super().__init__(*parameters)
+
+    def copy(self, *parameters) -> Self:
+        if type(self) is not KeySignature:
+            return super().copy(*parameters)
+        self_copy: KeySignature = self._clone()   # Only immutable attributes
+        for single_parameter in parameters:
+            self_copy << single_parameter
+        return self_copy
     
     _major_scale = (1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1)    # Major scale for the default staff
 
@@ -486,6 +496,8 @@ class KeySignature(PitchParameter):       # Sharps (+) and Flats (-)
                 return super().__eq__(other)
         return self % other == other
     
+    _serialization_attributes: tuple[tuple[str, str], ...] = (("mode_0", "_mode_0"),)
+
     def getSerialization(self) -> dict:
         serialization = super().getSerialization()
         serialization["parameters"]["mode_0"] = self.serialize( self._mode_0 )
@@ -570,6 +582,28 @@ class KeySignature(PitchParameter):       # Sharps (+) and Flats (-)
     ]
 
 
+# Interned key signatures shared by reference among the pitches, so, they shall never be changed in place
+_shared_key_signatures: dict[tuple[int, int], KeySignature] = {}
+
+def shared_key_signature(key_signature: KeySignature) -> KeySignature:
+    """
+    Returns the interned `KeySignature` equal to the given one, shared by all pitches with the same key. \
+        Changing the key of a pitch replaces its `KeySignature` instead of changing the shared one.
+
+    Args:
+        key_signature (KeySignature): The key signature to be matched.
+
+    Returns:
+        KeySignature: The shared key signature with the same accidentals and mode.
+    """
+    signature_key: tuple[int, int] = (key_signature._unit, key_signature._mode_0)
+    shared_signature: KeySignature | None = _shared_key_signatures.get(signature_key)
+    if shared_signature is None:
+        shared_signature = _shared_key_signatures[signature_key] = KeySignature()
+        shared_signature._unit, shared_signature._mode_0 = signature_key
+    return shared_signature
+
+
 
 class Tone(PitchParameter):
     """`Unit -> PitchParameter -> Tone`
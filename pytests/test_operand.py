@@ -24,6 +24,7 @@ from io import StringIO
 import pytest     # pip install pytest
 import sys
 from typing import Type
+import json
 
 
 def test_tail_recur():
@@ -332,6 +333,81 @@ def test_operand_serialization():
 # test_operand_serialization()
 
 
+def test_operand_binary_serialization():
+
+    basic_parameters: tuple = (None, 6, "minor", "##", [1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1], True, 6.3)
+    list_all_classes: list[Type[Operand]] = list_all_operand_classes(Operand)
+
+    for single_class in list_all_classes:
+        class_object = single_class()
+        if isinstance(class_object, Clip):
+            class_object << Note() << Rest()
+        if isinstance(class_object, Part):
+            class_object << Section(Clip(Note(),Rest()), Clip(Note(),Rest()))
+        if class_object and not isinstance(class_object, (int)):
+            class_object << basic_parameters
+            for single_unit_class in list_all_operand_classes(Unit):
+                class_object << (single_unit_class() << basic_parameters)
+            json_instantiation: Operand = single_class()
+            json_instantiation.loadSerialization(json.loads(json.dumps(class_object.getSerialization())))
+            binary: bytes = class_object.getBinarySerialization()
+            # Written straight from the attributes, it's the same of the serialization dictionaries
+            assert binary == serialization_to_binary(class_object.getSerialization())
+            attributes: tuple | None = serialization_attributes(single_class)
+            if attributes is not None:
+                assert tuple(key for key, _ in attributes) == tuple(class_object.getSerialization()["parameters"])
+            loaded_instantiation: Operand = single_class()
+            loaded_instantiation.loadBinarySerialization(binary)
+            if loaded_instantiation != class_object:
+                print(f"Culprit Binary Serialization equal: {single_class.__name__}")
+                assert loaded_instantiation == class_object
+            # Same result as the JSON path (JSON turns tuples into lists)
+            assert json.loads(json.dumps(loaded_instantiation.getSerialization())) \
+                == json.loads(json.dumps(json_instantiation.getSerialization()))
+            if isinstance(loaded_instantiation, Clip):
+                assert loaded_instantiation._test_owner_clip()
+            if isinstance(loaded_instantiation, Part):
+                assert loaded_instantiation._test_owner_part()
+
+    # Native rationals and the class names are stored once
+    clip: Clip = Note() * 64 << Foreach(1, 2, 3, 4)**Degree() << Foreach(1/3, 1/8)**Duration()
+    binary: bytes = clip.getBinarySerialization()
+    assert binary.startswith(BINARY_MAGIC)
+    assert binary.count(b"Note") == 1
+    assert len(binary) * 5 < len(json.dumps(clip.getSerialization()))
+    assert binary_to_serialization(binary) == clip
+    assert binary_to_serialization(b"not binary") is None
+
+    part: Part = Part(clip, clip.copy(Name("Copy")))
+    part >> Save("json/_part_binary_save.jmcb")
+    loaded_part: Part = Load("json/_part_binary_save.jmcb")
+    assert isinstance(loaded_part, Part)
+    assert loaded_part == part
+    assert loaded_part._test_owner_part()
+
+    # Directly loaded elements still share the interned signatures
+    loaded_clip: Clip = binary_to_serialization(clip.getBinarySerialization())
+    assert loaded_clip._test_owner_clip()
+    assert all(note._time_signature is loaded_clip[0]._time_signature for note in loaded_clip)
+    assert all(note._pitch._key_signature is loaded_clip[0]._pitch._key_signature for note in loaded_clip)
+    assert loaded_clip[0]._pitch is not loaded_clip[1]._pitch
+    assert loaded_clip[0]._pitch._scale is not loaded_clip[1]._pitch._scale
+
+    # Mixed elements are written and read straight from their attributes as well
+    mixed_clip: Clip = Note() / 4 + Chord(Size(4)) / 2 + ControlChange(Value(64)) / 2
+    binary = mixed_clip.getBinarySerialization()
+    assert binary == serialization_to_binary(mixed_clip.getSerialization())
+    loaded_clip = binary_to_serialization(binary)
+    assert loaded_clip == mixed_clip
+    assert loaded_clip._test_owner_clip()
+    loaded_controls: list[ControlChange] = [
+        single_element for single_element in loaded_clip if isinstance(single_element, ControlChange)
+    ]
+    assert loaded_controls[0]._controller is not loaded_controls[1]._controller
+
+# test_operand_binary_serialization()
+
+
 def test_dictionary_getter():
 
     clip_name: Name = Name("Drums")
@@ -447,3 +523,64 @@ def test_tail_copy():
 
 # test_tail_copy()
 
+
+
+def test_import_time():
+    import os
+    import subprocess
+
+    # Cold start in a fresh interpreter, as a CLI batch job that only renders MIDI
+    package_path = os.path.join(os.path.dirname(__file__), '..')
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import jsonmidicreator"],
+        capture_output=True, text=True, cwd=package_path,
+        env={**os.environ, "PYTHONPATH": package_path}
+    )
+    assert result.returncode == 0
+    # import time: self [us] | cumulative | imported package
+    import_times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            if cumulative_us.strip().isdigit():
+                import_times[name.strip()] = int(cumulative_us)
+    # Plotting and playing libraries are only imported on demand
+    for lazy_module in ("matplotlib", "numpy", "ctypes"):
+        assert lazy_module not in import_times
+    # Generous budget, the eager matplotlib import alone used to take about half a second
+    assert import_times["jsonmidicreator"] < 1_000_000
+
+# test_import_time()
+
+
+
+def test_class_registry():
+
+    # Every Operand class registers itself when defined
+    assert operand_classes_registry["Operand"] is Operand
+    assert operand_classes_registry["Note"] is Note
+    assert find_class_by_name(Operand, "Clip") is Clip
+    assert find_class_by_name(Element, "Clip") is None  # Clip isn't an Element
+    assert find_class_by_name(Operand, "NoSuchClass") is None
+    for operand_class in list_all_operand_classes(Operand):
+        assert operand_class.__name__ in operand_classes_registry
+
+    class RegisteredNote(Note):
+        pass
+
+    assert find_class_by_name(Operand, "RegisteredNote") is RegisteredNote
+    assert Operand.deserialize(RegisteredNote().getSerialization()).__class__ is RegisteredNote
+
+    # Same name from another module is a collision, the first class is kept
+    CollidingNote = type("RegisteredNote", (Note,), {"__module__": "another_module"})
+    assert operand_classes_registry["RegisteredNote"] is RegisteredNote
+    assert register_operand_class(CollidingNote, replace=True) is CollidingNote
+    assert operand_classes_registry["RegisteredNote"] is CollidingNote
+    del operand_classes_registry["RegisteredNote"]
+
+    resolved_classes = resolve_serialization_classes((Note() + Chord()).getSerialization())
+    assert resolved_classes["Clip"] is Clip
+    assert resolved_classes["Note"] is Note
+    assert resolved_classes["Chord"] is Chord
+
+# test_class_registry()
@@ -163,3 +163,19 @@ def test_reset():
 # test_reset()
 
 
+
+
+def test_chaos_batch():
+    for chaos in (SinX(), SinX(Lambda(3.14)), Sequence(Steps(1/3)), Counter(), Cycle(Steps(5)), Cycle(Modulus(7/2), Steps(1/4)),
+                  Ripple(Steps(3)), Spiral(Steps(1/2)), Bouncer(), Bouncer(dX(0.3), dY(1.25)), Cycle(Modulus(120))**SinX(24)):
+        scalar_chaos = chaos.copy()
+        batch_chaos = chaos.copy()
+        for iterations in (1, 0, 17, 100):
+            scalar_results = [scalar_chaos % float() for _ in range(iterations)]
+            batch_results = batch_chaos.batch(iterations)
+            assert list(batch_results) == scalar_results
+            assert batch_chaos == scalar_chaos
+            assert batch_chaos._index == scalar_chaos._index
+        assert scalar_chaos % float() == batch_chaos % float()
+
+# test_chaos_batch()
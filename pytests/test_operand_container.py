@@ -20,6 +20,7 @@ if src_path not in sys.path:
     sys.path.append(src_path)
 
 from jsonmidicreator import *
+from jsonmidicreator.creator import playlist_to_binary, binary_to_playlist
 
 
 # Run the tests with 'pytest tests\python_functions.py' on windows
@@ -1548,3 +1549,358 @@ def test_clip_multi():
 
 # test_clip_multi()
 
+
+
+def test_integer_tick_playlist():
+
+    def fraction_time_ms(clip: Clip, position_beats: Fraction) -> list[float]:
+        time_ms: list[float] = []
+        for single_note in clip.get_component_elements():
+            position_min = settings.beats_to_minutes(position_beats + single_note._position_beats)
+            duration_min = settings.beats_to_minutes(single_note._duration_beats)
+            time_ms.append( minutes_to_time_ms(position_min) )
+            time_ms.append( minutes_to_time_ms(position_min + duration_min * single_note._gate) )
+        return time_ms
+
+    settings << Tempo(97)
+    notes: Clip = Note(1/12) / 7 + Note(1/10) / 5 + Note(Beats(1/17)) / 3    # Last ones are off the tick grid
+    notes << Gate(0.9)
+    clip_time_ms = [ event["time_ms"] for event in notes.getPlaylist() if "time_ms" in event ]
+    assert clip_time_ms == fraction_time_ms(notes, Fraction(0))
+
+    section: Section = Section(notes) << Measures(3)
+    section_time_ms = [ event["time_ms"] for event in section.getPlaylist(True) if "time_ms" in event ]
+    assert section_time_ms == sorted(fraction_time_ms(notes, section._position_beats))  # Sections stream by time
+    part_time_ms = [ event["time_ms"] for event in Part(section).getPlaylist() if "time_ms" in event ]
+    assert part_time_ms == section_time_ms
+
+    for single_beats in (Fraction(1, 3), Fraction(7, 1024), Fraction(-5, 49), Fraction(123457, 11)):
+        assert settings.beats_to_time_ms(single_beats) == minutes_to_time_ms(settings.beats_to_minutes(single_beats))
+
+    settings << None    # Reset Settings
+
+# test_integer_tick_playlist()
+
+
+def test_clip_columnar():
+
+    notes: Clip = Note(1/8) / 9 + Note(1/12) / 6 << Gate(0.9)
+    notes << Nth(2, 5)**Velocity(70)
+    columnar_notes: Clip = notes.copy().columnar()
+    assert columnar_notes.is_columnar()
+    assert columnar_notes.len() == notes.len()
+
+    # Column passes keep the columnar storage
+    assert columnar_notes.getPlaylist() == notes.getPlaylist()
+    assert columnar_notes.getMidilist(Fraction(1, 3)) == notes.getMidilist(Fraction(1, 3))
+    columnar_notes.stack().quantize(1.0, True)
+    notes.stack().quantize(1.0, True)
+    assert columnar_notes.getPlaylist(Fraction(5)) == notes.getPlaylist(Fraction(5))
+    assert columnar_notes.is_columnar()
+
+    # Indexing materializes the Note elements
+    assert columnar_notes[1] % Velocity() == 70
+    assert not columnar_notes.is_columnar()
+    assert columnar_notes == notes
+    assert columnar_notes._test_owner_clip()
+
+    # Not applicable to non Note elements or off grid positions
+    assert not (Note() / 2 + ControlChange()).columnar().is_columnar()
+    assert not Clip([Note(Beats(1/17))]).columnar().is_columnar()
+
+    # The Note elements come back as they were, regardless of the later settings
+    d_major_note: Note = Note(KeySignature(2), Degree(3), TimeSignature(3, 4))
+    minor_note: Note = Note(Scale("minor"), TonicKey("A"), Degree(2), Sharp(), Octave(3), Position(Beats(1)))
+    notes = Clip([ d_major_note, minor_note ])
+    columnar_notes = notes.copy().columnar()
+    assert columnar_notes.is_columnar()
+    settings << KeySignature(-3) << TimeSignature(6, 8)
+    assert columnar_notes[0].getSerialization() == d_major_note.getSerialization()
+    assert columnar_notes[1].getSerialization() == minor_note.getSerialization()
+    assert columnar_notes[0] % KeySignature() == KeySignature(2)
+    assert columnar_notes[0] % TimeSignature() == TimeSignature(3, 4)
+    assert (columnar_notes[0] << Degree(5)) % Pitch() % Key() == "A"   # And not "G"
+    settings << KeySignature(0) << TimeSignature(4, 4)
+
+
+def test_clip_deferred_sorting():
+
+    steps: list[int] = [7, 3, 11, 0, 3, 5]
+    single_notes: Clip = Clip()
+    for single_step in steps:
+        single_notes += Note(Position(Steps(single_step)))
+    assert single_notes._is_sorted()
+    assert [ note % Position() % Steps() % int() for note in single_notes ] == sorted(steps)
+
+    batch_notes: Clip = Clip()
+    with batch_notes.batch() as batch_clip:
+        assert batch_clip is batch_notes
+        for single_step in steps:
+            batch_notes += Note(Position(Steps(single_step)))
+        assert batch_notes.len() == len(steps)
+        assert not batch_notes._is_sorted()   # No sorting while in batch
+    assert batch_notes._is_sorted()
+    assert batch_notes._test_owner_clip()
+    assert batch_notes == single_notes
+
+    # Sorting is only done when the items are needed again
+    single_notes << Nth(1)**Position(Steps(13))
+    assert single_notes._dirty
+    assert "_items" in single_notes.__dict__    # Still seen by anything reading the attributes directly
+    assert single_notes[-1] is not None
+    assert not single_notes._dirty
+    assert single_notes._is_sorted()
+
+    # Copies made while the sorting is pending keep all the items
+    single_notes << Nth(1)**Position(Steps(17))
+    assert len(vars(single_notes)["_items"]) == len(steps)
+    assert single_notes.copy() == single_notes
+    assert single_notes._clone()._items == single_notes._items
+
+# test_clip_deferred_sorting()
+
+
+def test_binary_playlist():
+    clip = Note() + Note(Position(Beats(1))) + ControlChange() + PitchBend(Bend(1000)) + ProgramChange() + Aftertouch() >> Stack()
+    clip += Clock()
+    playlist: list[dict] = clip.getPlaylist()
+    binary_playlist: bytes = clip.getBinaryPlaylist()
+    assert binary_playlist[:4] == b"JMPB"
+    assert binary_to_playlist(binary_playlist) == playlist
+    part = Part(clip, clip.copy(Name("Copy")))
+    assert binary_to_playlist(part.getBinaryPlaylist()) == part.getPlaylist()
+    assert binary_to_playlist(playlist_to_binary([])) == []
+    clocked_playlist: list[dict] = [{"clock": {"total_clock_pulses": 96}, "tempo": {"bpm_10": 1200}}] + playlist
+    assert binary_to_playlist(playlist_to_binary(clocked_playlist)) == clocked_playlist
+
+# test_binary_playlist()
+
+
+def test_streamed_playlist():
+    bass = Note(1/2) * 4 << Channel(2) >> Stack()
+    melody = Note(1/8) * 8 << Channel(3) << Devices(["FLUID"]) >> Stack()
+    section: Section = Section(bass, melody)
+    part = Part(section, Section(melody) << Measures(2))
+    for composition in (bass, section, part):
+        timed_entries: list[dict] = [ entry for entry in composition.iterPlaylist() if "time_ms" in entry ]
+        assert [ entry["time_ms"] for entry in timed_entries ] == sorted(entry["time_ms"] for entry in timed_entries)
+        assert len(timed_entries) == len([ entry for entry in composition.getPlaylist() if "time_ms" in entry ])
+    # Same events, but now time ordered and with the devices entry only when they change
+    section_playlist: list[dict] = section.getPlaylist()
+    concatenated_playlist: list[dict] = bass.getPlaylist() + melody.getPlaylist()
+    assert sorted(map(str, [ entry for entry in section_playlist if "time_ms" in entry ])) \
+        == sorted(map(str, [ entry for entry in concatenated_playlist if "time_ms" in entry ]))
+    current_devices: list[str] | None = None
+    for entry in section_playlist:
+        if "devices" in entry:
+            assert entry["devices"] != current_devices
+            current_devices = entry["devices"]
+        else:
+            channel: int = (entry["midi_message"]["status_byte"] & 0x0F) + 1
+            assert current_devices == (melody._devices if channel == 3 else bass._devices)
+
+    # The elements are rendered lazily in the same order, tied notes included
+    mixed_clip: Clip = Note() / 6 << Tied(True)
+    mixed_clip[3] << "E"
+    mixed_clip += Note(Duration(4), Channel(2)) + Chord(Position(Beats(1))) + ControlChange(Position(Beats(2)))
+    mixed_clip += Note(Position(Beats(5)), Duration(1/2)) + Note(Position(Beats(5)), Duration(1/2), Tied(True))
+    for clip in (bass, melody, mixed_clip, Clip()):
+        assert [ element.getSerialization() for element in clip.iter_component_elements() ] \
+            == [ element.getSerialization() for element in clip.get_component_elements() ]
+        assert list(clip.iterPlaylist())[1:] == sorted(clip.getPlaylist()[1:], key=lambda entry: entry["time_ms"])
+
+# test_streamed_playlist()
+
+
+def test_mask_bits():
+    four_notes = Note() / 4
+    assert four_notes.mask_bits() == 0
+    four_notes.mask(Odd())
+    odd_bits: int = four_notes.mask_bits()
+    assert odd_bits == 0b0101
+    assert four_notes.len() == 2
+    assert four_notes.first() is four_notes._items[1]
+    assert four_notes.last() is four_notes._items[3]
+    assert list(four_notes.iter_unmasked_items()) == four_notes.unmasked_items()
+
+    four_notes.select(First(3))
+    assert four_notes.mask_bits() == 0b1000
+    first_bits: int = ~four_notes.mask_bits()
+
+    # Mask algebra
+    four_notes.set_mask_bits(odd_bits | first_bits)
+    assert four_notes.mask_bits() == 0b0111
+    assert four_notes.len() == 1
+    four_notes.set_mask_bits(odd_bits & ~first_bits)
+    assert four_notes.mask_bits() == 0
+    four_notes.set_mask_bits(~odd_bits)
+    assert four_notes.mask_bits() == 0b1010
+    assert four_notes.first() is four_notes._items[0]
+    assert four_notes._item_index(four_notes._items[2]) == 1
+
+    four_notes.unmask()
+    assert four_notes.mask_bits() == 0
+    assert Clip().set_mask_bits(~0).mask_bits() == 0
+
+# test_mask_bits()
+
+
+def test_identity_lookup():
+    notes = Note() / 6
+    items: list = notes._items.copy()
+    assert notes._previous_item(items[3]) is items[2]
+    assert notes._next_item(items[3]) is items[4]
+    assert notes._next_item(items[5]) is None
+    assert notes._previous_item(Note()) is None
+
+    # The identity index follows the changes of the items
+    notes._swap(items[1], items[4])
+    assert notes._items[1] is items[4] and notes._items[4] is items[1]
+    new_note = Note()
+    notes._replace(items[2], new_note)
+    assert notes._items[2] is new_note
+    assert notes._next_item(new_note) is items[3]
+    notes._delete([ items[0] ], True)
+    assert notes._previous_item(new_note) is items[4]
+
+    # Deleting by equality removes the equal items too
+    equal_notes = Note() / 3 + Note() / 3 + Rest() / 3
+    equal_notes -= Note() / 2
+    assert equal_notes.len() == 5
+    assert isinstance(equal_notes[4], Rest)
+    equal_notes._delete([ Rest(Position(0)) ])
+    assert equal_notes.len() == 4
+
+# test_identity_lookup()
+
+
+def test_interval_index():
+    notes = Note() / 8  # One note per beat, two measures
+    notes += Note(Position(Beats(2)), Beats(3)) # Long note sounding on two more notes
+    notes_index = notes.interval_index()
+    assert len(notes_index) == 9
+    for beats in (0, 1, Fraction(5, 2), 3, 7, 8):
+        position = Position(Beats(beats))
+        assert notes_index.at(position) == [
+            single_note for single_note in notes._items
+            if single_note._position_beats <= beats < single_note._position_beats + single_note._duration_beats
+        ]
+    assert len(notes_index.at(Position(Beats(3)))) == 2
+    assert len(notes_index.overlapping(Position(Beats(1)), Position(Beats(3)))) == 3
+    assert notes_index.overlapping(Position(Beats(3)), Position(Beats(3))) == []
+    assert len(notes_index.starting(Position(Measures(1)), Position(Measures(2)))) == 4
+    assert notes_index.finish() == 8
+
+    # Dropped measures have the elements starting in them removed
+    notes.drop([0])
+    assert notes.len() == 4
+    assert notes[0] % Position() == 0
+
+# test_interval_index()
+
+
+def test_clip_tiling():
+    three_notes: Clip = Note() / 3 + Chord(Position(Beats(5)))  # Two Measures long
+    repeated_notes: Clip = three_notes.copy()
+    single_copy: Clip = repeated_notes.shallow_copy()
+    for _ in range(3):
+        repeated_notes *= single_copy   # One repetition at a time
+    assert (three_notes * 4).getSerialization() == repeated_notes.getSerialization()
+    assert (three_notes * 4).len() == 16
+    assert (three_notes * 4)[-1] % Position() == Beats(3 * 8 + 5)
+
+    stacked_notes: Clip = three_notes.copy()
+    single_copy = stacked_notes.shallow_copy()
+    for _ in range(2):
+        stacked_notes /= single_copy
+    assert (three_notes / 3).getSerialization() == stacked_notes.getSerialization()
+    assert (Note() / 5)[4] % Position() == Beats(4)
+    # A finish before 0 is clamped to 0, so, only the next offsets are the net length
+    early_control: Clip = ControlChange(Beats(3/4)) / 1 << Position(Beats(-4))
+    assert [ element % Position() for element in early_control / 4 ] \
+        == [ Beats(-4), Beats(0), Beats(3/4), Beats(3/2) ]
+
+    # The repeated playlist doesn't copy any element
+    assert three_notes.getRepeatedPlaylist(4) == (three_notes * 4).getPlaylist()
+    columnar_notes: Clip = (Note() / 3).columnar()
+    assert columnar_notes.getRepeatedPlaylist(3) == (Note() / 3 * 3).getPlaylist()
+    assert columnar_notes.is_columnar()
+
+# test_clip_tiling()
+
+
+def test_tied_notes_sweep():
+    tied_notes: Clip = Note() / 8 << Tied(True)
+    component_elements: list = tied_notes.get_component_elements()
+    assert len(component_elements) == 1
+    assert component_elements[0] % Duration() == Beats(8)
+    assert tied_notes[0] % Duration() == Beats(1)   # Merged into a copy
+
+    # Ties only continue the same channel and pitch
+    mixed_notes: Clip = Note() / 4 << Tied(True)
+    mixed_notes[2] << "E"
+    mixed_notes[3] << Channel(2)
+    assert [ element % Duration() for element in mixed_notes.get_component_elements() ] \
+        == [ Beats(2), Beats(1), Beats(1) ]
+
+    overlapping_notes: Clip = Note() / 3 << Duration(1/2)
+    overlapping_notes.monofy()
+    assert [ note % Duration() for note in overlapping_notes ] == [ Beats(1), Beats(1), Beats(2) ]
+
+# test_tied_notes_sweep()
+
+
+def test_clip_drop_crop():
+    twelve_notes = Note() / 12  # Three measures
+    twelve_notes.drop(1)    # Plain ints are accepted too
+    assert twelve_notes.len() == 8
+    assert [single_note % Position() % Beats() % int() for single_note in twelve_notes] == list(range(8))
+    twelve_notes = Note() / 12
+    twelve_notes.drop(0, 2)
+    assert [single_note % Position() % Beats() % int() for single_note in twelve_notes] == list(range(4))
+    twelve_notes = Note() / 12
+    twelve_notes.crop(1)    # Measure 1 takes the place of measure 0
+    assert twelve_notes.len() == 4
+    assert twelve_notes[0] % Position() == 0
+    assert twelve_notes[3] % Position() == Beats(3)
+
+    # Masked elements are shifted too, and the ones in a dropped measure are kept
+    twelve_notes = Note() / 12
+    twelve_notes.mask(Odd())
+    twelve_notes.drop(1)
+    assert twelve_notes.len() == 4
+    twelve_notes.unmask()
+    assert twelve_notes.len() == 10
+    assert [single_note % Position() % Beats() % int() for single_note in twelve_notes] \
+        == [0, 1, 2, 3, 4, 4, 5, 6, 6, 7]
+
+# test_clip_drop_crop()
+
+
+def test_untied_rendering_pitches():
+    untied_clip = Note() / 16 << Foreach(1, 2, 3, 4, 5)**Degree()
+    tied_clip = untied_clip.copy()
+    tied_clip[9] << Tied()  # Only continues the previous note if it has the same pitch
+    tied_clip[8] << tied_clip[9] % Degree()
+    original_absolute_pitch = Pitch.get_absolute_pitch
+    absolute_pitch_calls: list[int] = [0]
+    def counted_absolute_pitch(self):
+        absolute_pitch_calls[0] += 1
+        return original_absolute_pitch(self)
+    Pitch.get_absolute_pitch = counted_absolute_pitch
+    try:
+        # Without tied notes, the notes pitch isn't needed to get the components
+        untied_components = untied_clip.get_component_elements()
+        assert absolute_pitch_calls[0] == 0
+        assert len(untied_components) == 16
+        assert list(Clip._tied_durations(untied_components)) == [Fraction(1)] * 16
+        assert absolute_pitch_calls[0] == 0
+        # With tied notes, only the notes that can take part in a tie are looked up
+        tied_components = tied_clip.get_component_elements()
+        assert absolute_pitch_calls[0] == 2
+        assert len(tied_components) == 15
+        assert tied_components[8] % Beats() == 2
+    finally:
+        Pitch.get_absolute_pitch = original_absolute_pitch
+
+# test_untied_rendering_pitches()
@@ -121,3 +121,33 @@ def test_inline_operations():
     assert many_notes is four_notes
     assert many_notes.len() == 7
 
+
+
+def test_line_tokens():
+    from jsonmidicreator.operand_data import _normalize_dsl
+
+    assert _normalize_dsl(" n : 1/8 :C5# ,,\n c_- : 3b  F ") == "n:1/8:C5#,c_-:3b,F"
+    assert Line(" n : 1/8 :C5# , c_- : 3b ").get_tokens() == ["n:1/8:C5#", "c_-:3b"]
+    assert Line("n:1/8:C5#, c:3b").get_token(1) == "c:3b"
+    assert Line("n:1/8:C5#").get_token(1) is None
+    assert Token(" n :1/8: C5# ").get_fields() == ["n", "1/8", "C5#"]
+    assert Token("n:1/8:C5#").get_field(3) is None
+    assert Field("1 _ 2").get_parameters() == ["1", "2"]
+
+    # A long line is normalized once and each of its repeated tokens parsed once
+    long_clip = Clip(Line(", ".join(["n:1/8:C", "n::E", "n::G:90"] * 1000)))
+    assert long_clip.len() == 3000
+    assert long_clip[0] == Note(1/8, "C")
+    assert long_clip[2999]._pitch == Pitch("G")
+    assert long_clip[2999] % Velocity() == 90
+    assert long_clip[2999] % Position() == Position(2999 / 8)
+
+    # Bad tags are reported with their token position
+    captured_output = StringIO()
+    sys.stdout = captured_output
+    bad_clip = Clip(Line("n:1/8:C, x:1/4:D"))
+    sys.stdout = sys.__stdout__
+    assert "token 1 'x:1/4:D'" in captured_output.getvalue()
+    assert bad_clip.len() == 2
+
+# test_line_tokens()
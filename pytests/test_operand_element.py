@@ -858,3 +858,178 @@ def test_element_multi():
 
 # test_element_multi()
 
+
+
+def test_note_fast_copy():
+    original_note = Note(Degree(3), Position(1/3), KeySignature(-2), Channel(3), Gate(0.5), Velocity(30))
+    original_note << Scale("minor")
+    original_degree = original_note % Degree()
+    copied_note = original_note.copy()
+    assert copied_note == original_note
+    assert copied_note.getSerialization() == (Note() << original_note).getSerialization()
+    # Mutable attributes aren't shared, while the meter and key context are
+    assert copied_note._pitch is not original_note._pitch
+    assert copied_note._pitch._key_signature is original_note._pitch._key_signature
+    assert copied_note._pitch._scale is not original_note._pitch._scale
+    assert copied_note._time_signature is original_note._time_signature
+    copied_note << Degree(5) << TimeSignature(3, 4) << KeySignature(1)
+    assert original_note % Degree() == original_degree
+    assert original_note % TimeSignature() == TimeSignature(4, 4)
+    assert original_note % KeySignature() == KeySignature(-2)
+
+    # Parameters are still applied on the copy
+    assert original_note.copy(Velocity(90)) % Velocity() == 90
+    assert original_note % Velocity() == 30
+
+    # Processing pipelines give the same results
+    clip = Note() * 8 << Foreach(1, 3, 5, 7, 2, 4, 6, 8)**Degree()
+    assert clip >> Fit() >> Quantize() == clip.copy() >> Fit() >> Quantize()
+    assert clip.copy() == clip
+
+# test_note_fast_copy()
+
+
+def test_render_cache():
+    cached_chord = Chord(Repeat(), Length(2)).cache_render()
+    plain_chord = Chord(Repeat(), Length(2))
+    assert cached_chord.getPlaylist() == plain_chord.getPlaylist()
+    cached_notes = cached_chord._render_components()
+    assert cached_chord._render_components() == cached_notes    # Reused while unchanged
+    assert cached_chord._render_components()[0] is not cached_notes[0]  # But handed out as copies
+
+    # Changing the handed out components doesn't change the cached ones
+    cached_notes[0] << Velocity(10)
+    cached_notes[0]._position_beats += 1
+    assert cached_chord.getPlaylist() == plain_chord.getPlaylist()
+
+    # A pure shift reuses the cached components
+    cached_chord << Position(Beats(3))
+    plain_chord << Position(Beats(3))
+    assert cached_chord._render_components() == plain_chord.get_component_elements()
+    assert cached_chord.getPlaylist() == plain_chord.getPlaylist()
+    assert cached_chord.getMidilist() == plain_chord.getMidilist()
+
+    # Any other change renders it again, including the ones made in place or directly
+    cached_chord << Degree(3) << Velocity(50)
+    plain_chord << Degree(3) << Velocity(50)
+    assert cached_chord.getPlaylist() == plain_chord.getPlaylist()
+    cached_chord._pitch << Octave(5)
+    plain_chord._pitch << Octave(5)
+    assert cached_chord.getPlaylist() == plain_chord.getPlaylist()
+    cached_chord._duration_beats = Fraction(3)
+    plain_chord._duration_beats = Fraction(3)
+    assert cached_chord.getPlaylist() == plain_chord.getPlaylist()
+
+    # The Arpeggio ends at an absolute position, so it isn't reused when shifted
+    arpeggio_clip = Clip()
+    arpeggio_clip += [Chord(Position(Beats(beat)), Arpeggio("Up")) for beat in range(4)]
+    plain_clip = arpeggio_clip.copy()
+    arpeggio_clip.cache_render()
+    assert arpeggio_clip.getPlaylist() == plain_clip.getPlaylist()
+    arpeggio_clip.shift(1)
+    plain_clip.shift(1)
+    assert arpeggio_clip.getPlaylist() == plain_clip.getPlaylist()
+
+    # Clip renders reuse the cached components, so, they are built only once
+    chords_clip = Chord() / 10
+    chords_clip.cache_render()
+    original_components = Chord.get_component_elements
+    component_builds: list[int] = [0]
+    def counted_components(self):
+        component_builds[0] += 1
+        return original_components(self)
+    Chord.get_component_elements = counted_components
+    try:
+        first_playlist = chords_clip.getPlaylist()
+        assert component_builds[0] == 10
+        assert chords_clip.getPlaylist() == first_playlist
+        chords_clip.getMidilist()
+        assert component_builds[0] == 10
+    finally:
+        Chord.get_component_elements = original_components
+
+    # Copies don't share the cache
+    assert cached_chord.copy()._render_cache is None
+    assert cached_chord.cache_render(False)._render_cache is None
+
+# test_render_cache()
+
+
+def test_clock_periodic_pulses():
+
+    settings << Tempo(90)
+    clock = Clock(Measures(3), Position(Beats(2)))
+    clock_playlist: list[dict] = clock.getPlaylist()
+    pulse_duration_min: Fraction = Fraction(3 * 4, 90) / (3 * 4 * 24)
+    pulses_ms: list[float] = [
+        play_dict["time_ms"] for play_dict in clock_playlist if play_dict.get("midi_message", {}).get("status_byte") == 0xF8
+    ]
+    # Same times of the Fraction math, starting at the Clock position
+    position_min: Fraction = Fraction(2, 90)
+    assert clock_playlist[1]["time_ms"] == round(float(position_min * 60_000), 3)
+    assert pulses_ms == [
+        round(float((position_min + pulse_duration_min * pulse) * 60_000), 3) for pulse in range(1, 3 * 4 * 24)
+    ]
+
+    periodic_playlist: list[dict] = clock.getPlaylist(periodic=True)
+    assert len(periodic_playlist) == 5    # Devices, Start, Periodic pulses, Stop and Position
+    assert periodic_playlist[2]["periodic"]["total_events"] == 3 * 4 * 24 - 1
+    assert list(c.expand_periodic_events(periodic_playlist)) == clock_playlist
+    assert c.binary_to_playlist(c.playlist_to_binary(periodic_playlist)) == clock_playlist
+    assert "".join(c.json_midi_play_chunks(periodic_playlist)) == "".join(c.json_midi_play_chunks(clock_playlist))
+    settings << Tempo(120)
+
+# test_clock_periodic_pulses()
+
+
+def test_shared_context():
+    notes = Note() / 4
+    first_note, second_note = notes[0], notes[1]
+    # Same meter and key are shared by reference
+    assert first_note._time_signature is second_note._time_signature
+    assert first_note._pitch._key_signature is second_note._pitch._key_signature
+    assert Note()._pitch._key_signature is first_note._pitch._key_signature
+
+    # Changing the context of one note replaces it, copy on write
+    first_note << TimeSignature(3, 4) << KeySignature(2)
+    assert first_note % TimeSignature() == TimeSignature(3, 4)
+    assert second_note % TimeSignature() == TimeSignature(4, 4)
+    assert first_note % KeySignature() == KeySignature(2)
+    assert second_note % KeySignature() == KeySignature()
+    assert Note(TimeSignature(3, 4))._time_signature is first_note._time_signature
+    first_note << Minor()
+    assert second_note % KeySignature() == KeySignature()
+
+    # Loaded notes share it too
+    loaded_note = Note().loadSerialization(second_note.getSerialization())
+    assert loaded_note._time_signature is second_note._time_signature
+    assert loaded_note._pitch._key_signature is second_note._pitch._key_signature
+
+    # Piped signatures are never the shared ones, so, changing them leaves the interned ones untouched
+    from jsonmidicreator import operand_unit as ou, operand_generic as og
+    shared_key_signatures: dict = {
+        key: (shared._unit, shared._mode_0) for key, shared in ou._shared_key_signatures.items()
+    }
+    shared_time_signatures: dict = {
+        key: (shared._top, shared._bottom) for key, shared in og._shared_time_signatures.items()
+    }
+    d_major_notes = Note(KeySignature(2)) / 2
+    (d_major_notes[0]._pitch % Pipe(KeySignature())) << KeySignature(-3)
+    assert d_major_notes[1] % KeySignature() == KeySignature(2)
+    assert Note(KeySignature(2)) % KeySignature() == KeySignature(2)
+    piped_clip = Clip() << Pipe(second_note._time_signature)
+    piped_clip << TimeSignature(7, 8)
+    piped_clip += TimeSignature(1, 1)
+    assert second_note % TimeSignature() == TimeSignature(4, 4)
+    piped_settings = Settings() << Pipe(second_note._time_signature) << Pipe(second_note._pitch._key_signature)
+    piped_settings << TimeSignature(5, 4) << KeySignature(-1)
+    assert {
+        key: (shared._unit, shared._mode_0) for key, shared in ou._shared_key_signatures.items() if key in shared_key_signatures
+    } == shared_key_signatures
+    assert {
+        key: (shared._top, shared._bottom) for key, shared in og._shared_time_signatures.items() if key in shared_time_signatures
+    } == shared_time_signatures
+    assert all(key == (shared._unit, shared._mode_0) for key, shared in ou._shared_key_signatures.items())
+    assert all(key == (shared._top, shared._bottom) for key, shared in og._shared_time_signatures.items())
+
+# test_shared_context()
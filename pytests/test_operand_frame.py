@@ -256,3 +256,41 @@ def test_chained_operands():
 
 # test_chained_operands()
 
+
+
+def test_frame_mask():
+    
+    # Resets the defaults
+    settings << None
+
+    clip = Note(1/8) / 3 + Note(1/16, "E") / 3 << Nth(2, 5, 7)**Velocity(90)
+    clip += ControlChange()
+    clip.mask(Nth(3))   # Masked items are excluded by First and Last
+    items: list = clip._items
+
+    frames: list[Frame] = [
+        OnBeat(), OffBeat(), DownBeat(), UpBeat(), Odd(), Even(), Nth(1, 4, 9), At(0, 3),
+        First(2), Last(3), Every(2), Each(0), All(), InputType(Note),
+        Match(Velocity(90)), IsNot(Velocity(90)), InputType(Note)**Above(Pitch("D")), Either(Velocity(90), Pitch("E")),
+        Neither(Pitch("E")), Odd()**OnBeat(), OnBeat()**Odd(), InputType(Note)**Every(2)**Even(),
+    ]
+    for single_frame in frames:
+        single_frame._set_inside_container(clip)
+        frame_mask: list[bool] = single_frame.frame_mask(items)
+        assert frame_mask is not None
+        single_frame._set_inside_container(clip)
+        assert frame_mask == [single_item == single_frame.frame(single_item) for single_item in items]
+
+    # Not compiled frames fall back to framing item by item
+    assert (Odd()**Duration(1/2)).frame_mask(items) is None
+    assert Match(Odd()).frame_mask(items) is None
+
+    class OddNote(Odd):
+        def frame(self, input):
+            return super().frame(input) if isinstance(input, Note) else Null()
+
+    assert OddNote().frame_mask(items) is None
+    assert (Note() * 4)[OddNote()].len() == 2
+    assert (Note() * 4)[Odd()].len() == 2
+
+# test_frame_mask()
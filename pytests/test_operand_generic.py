@@ -1678,3 +1678,215 @@ def test_pitch_multi():
 # test_pitch_multi()
 
 
+
+
+def parse_midi_file(midi_data: bytes) -> tuple[int, int, list[list[tuple]]]:
+    """Minimal Standard MIDI File parser returning the format, the division and the tracks events."""
+
+    def read_variable_length(position: int) -> tuple[int, int]:
+        value: int = 0
+        while True:
+            byte: int = midi_data[position]
+            position += 1
+            value = value << 7 | byte & 0x7F
+            if byte < 0x80:
+                return value, position
+
+    assert midi_data[:4] == b"MThd"
+    midi_format: int = int.from_bytes(midi_data[8:10], "big")
+    tracks_count: int = int.from_bytes(midi_data[10:12], "big")
+    division: int = int.from_bytes(midi_data[12:14], "big")
+    position: int = 8 + int.from_bytes(midi_data[4:8], "big")
+    tracks: list[list[tuple]] = []
+    for _ in range(tracks_count):
+        assert midi_data[position:position + 4] == b"MTrk"
+        track_end: int = position + 8 + int.from_bytes(midi_data[position + 4:position + 8], "big")
+        position += 8
+        tick: int = 0
+        running_status: int = 0
+        track: list[tuple] = []
+        while position < track_end:
+            delta, position = read_variable_length(position)
+            tick += delta
+            if midi_data[position] == 0xFF:
+                meta_type: int = midi_data[position + 1]
+                meta_length, position = read_variable_length(position + 2)
+                track.append((tick, 0xFF, meta_type, midi_data[position:position + meta_length]))
+                position += meta_length
+                running_status = 0
+            else:
+                if midi_data[position] & 0x80:
+                    running_status = midi_data[position]
+                    position += 1
+                data_length: int = 1 if running_status & 0xF0 in (0xC0, 0xD0) else 2
+                track.append((tick, running_status, *midi_data[position:position + data_length]))
+                position += data_length
+        assert position == track_end
+        assert track[-1] == (tick, 0xFF, 0x2F, b"")    # End of Track
+        tracks.append(track)
+    return midi_format, division, tracks
+
+
+def test_render_midi_file(tmp_path):
+
+    # The parser agrees with the files rendered before by midiutil
+    for midi_file in ("Midi/example.mid", "Midi/others/clip_0_10_0004_render.mid"):
+        with open(midi_file, "rb") as midi_input:
+            midi_format, division, tracks = parse_midi_file(midi_input.read())
+        assert midi_format == 1 and division == 960
+
+    clip: Clip = Note() * 4 << Foreach(1, 3, 5, 8)**Degree() >> Stack()
+    clip += ControlChange(Position(1/4), Value(100))
+    clip += PitchBend(Position(1/2), Bend(1000))
+    clip >> Render(str(tmp_path / "clip.mid"))
+    with open(tmp_path / "clip.mid", "rb") as midi_input:
+        midi_format, division, tracks = parse_midi_file(midi_input.read())
+    assert midi_format == 1 and division == 960
+    assert len(tracks) == 2
+    tempo_track, clip_track = tracks
+    assert (0, 0xFF, 0x51, (500_000).to_bytes(3, "big")) in tempo_track   # 120 bpm
+    assert (0, 0xFF, 0x58, bytes([4, 2, 24, 8])) in tempo_track
+    assert clip_track[0][:3] == (0, 0xFF, 0x03)   # Track name
+    note_ons: list[tuple] = [event for event in clip_track if event[1] == 0x90]
+    note_offs: list[tuple] = [event for event in clip_track if event[1] == 0x80]
+    assert [(event[0], event[2]) for event in note_ons] == [(0, 60), (960, 64), (1920, 67), (2880, 72)]
+    assert [(event[0], event[2]) for event in note_offs] == [(960, 60), (1920, 64), (2880, 67), (3840, 72)]
+    assert (960, 0xB0, 10, 100) in clip_track
+    assert (1920, 0xE0, (1000 + 8192) & 0x7F, (1000 + 8192) >> 7) in clip_track
+    # Note offs come before the Note ons at the same tick
+    assert clip_track.index((960, 0x80, 60, 100)) < clip_track.index((960, 0x90, 64, 100))
+
+    # Overlapping notes with the same pitch are cut at the start of the next one
+    note_event: dict = Note().getMidilist()[0]
+    overlapping_midilist: list[dict] = [note_event | {"time": 0.0, "duration": 2.0}, note_event | {"time": 0.5, "duration": 1.0}]
+    c.saveMidiFile(overlapping_midilist, str(tmp_path / "overlapping.mid"), 0)
+    with open(tmp_path / "overlapping.mid", "rb") as midi_input:
+        midi_format, division, tracks = parse_midi_file(midi_input.read())
+    assert midi_format == 0 and len(tracks) == 1
+    note_events: list[tuple] = [(event[0], event[1]) for event in tracks[0] if event[1] in (0x80, 0x90)]
+    assert note_events == [(0, 0x90), (480, 0x80), (480, 0x90), (1440, 0x80)]
+
+    # Written byte for byte, with multi byte delta times and running status
+    note_event = {"event": "Note", "track": 0, "track_name": "T", "tempo": 120.0, "time": 0.0,
+                  "channel": 0, "pitch": 60, "velocity": 100, "duration": 1.0}
+    round_trip_midilist: list[dict] = [
+        note_event, note_event | {"time": 20.0, "pitch": 62}, note_event | {"time": 20.0, "pitch": 64}
+    ]
+    c.saveMidiFile(iter(round_trip_midilist), str(tmp_path / "round_trip.mid"))   # As a stream
+    tempo_chunk: bytes = bytes.fromhex("00FF510307A120" "00FF2F00")
+    track_chunk: bytes = bytes.fromhex(
+        "00FF030154"        # Track name "T"
+        "00903C64"          # Note On 60
+        "8740803C64"        # Note Off 60 after 960 ticks
+        "818E40903E64"      # Note On 62 after 18240 ticks, a three bytes delta time
+        "004064"            # Note On 64, running status
+        "8740803E64"        # Note Off 62
+        "004064"            # Note Off 64, running status
+        "00FF2F00"          # End of Track
+    )
+    with open(tmp_path / "round_trip.mid", "rb") as midi_input:
+        midi_data: bytes = midi_input.read()
+    assert midi_data == b"MThd" + bytes.fromhex("00000006" "0001" "0002" "03C0") \
+        + b"MTrk" + len(tempo_chunk).to_bytes(4, "big") + tempo_chunk \
+        + b"MTrk" + len(track_chunk).to_bytes(4, "big") + track_chunk
+    midi_format, division, tracks = parse_midi_file(midi_data)
+    assert [ (event[0], event[2]) for event in tracks[1] if event[1] == 0x90 ] \
+        == [ (int(event["time"] * division), event["pitch"]) for event in round_trip_midilist ]
+    assert [ (event[0], event[2]) for event in tracks[1] if event[1] == 0x80 ] \
+        == [ (int((event["time"] + event["duration"]) * division), event["pitch"]) for event in round_trip_midilist ]
+
+# test_render_midi_file()
+
+
+def test_tempo_map():
+
+    tempo_map = TempoMap(120).change(Beats(8), 60).change(Beats(16), 120, ramp=True)
+    assert tempo_map.beats_to_time_ms(Fraction(4)) == 2000.0
+    assert tempo_map.beats_to_time_ms(Fraction(8)) == 4000.0
+    # The 60 to 120 bpm ramp takes exactly 8 * ln(2) seconds
+    assert tempo_map.beats_to_time_ms(Fraction(16)) == round(4000 + 8000 * math.log(2), 3)
+    assert tempo_map.beats_to_time_ms(Fraction(18)) == round(4000 + 8000 * math.log(2) + 1000, 3)
+    assert tempo_map.tempo_at(Fraction(12)) == 90.0
+    # The average tempo steps keep the exact same ramp duration
+    ramp_steps: list[tuple[float, float]] = [event for event in tempo_map.tempo_events(1) if 8 <= event[0] < 16]
+    assert len(ramp_steps) == 8
+    assert sum(60_000 / tempo for _, tempo in ramp_steps) == pytest.approx(8000 * math.log(2))
+    # Only the ramps aren't rational
+    assert tempo_map._compile()[1][:2] == [0, 4000] and isinstance(tempo_map._compile()[1][1], Fraction)
+    assert isinstance(tempo_map._compile()[1][2], float)
+
+    # Without ramps it's the exact same math of a single tempo, the Clock pulses included
+    clock = Clock(Measures(2), Position(Beats(Fraction(1, 3))))
+    constant_clock: list[dict] = clock.getPlaylist()
+    settings << TempoMap(120).change(Beats(100), 120)
+    assert settings._tempo_map is not None
+    assert clock.getPlaylist() == constant_clock
+    assert settings.beats_to_time_ms(Fraction(7, 3)) == round(float(Fraction(7, 3) * 500), 3)
+    settings << TempoMap()
+
+    clip = Clip()
+    clip += [Note(Position(Beats(beat))) for beat in range(20)]
+    constant_playlist: list[dict] = clip.getPlaylist()
+    settings << tempo_map
+    assert settings % TempoMap() == tempo_map
+    mapped_playlist: list[dict] = clip.getPlaylist()
+    note_ons: list[float] = [entry["time_ms"] for entry in mapped_playlist if entry.get("midi_message", {}).get("status_byte") == 0x90]
+    assert note_ons[:9] == [beat * 500.0 for beat in range(9)]
+    assert note_ons[9] == tempo_map.beats_to_time_ms(Fraction(9))
+    assert clip.getMidilist()[12]["tempo"] == 90.0
+    # The columnar storage gives the same playlist
+    assert clip.copy().columnar().getPlaylist() == mapped_playlist
+    assert Settings(Serialization(settings)) == settings
+
+    # Without changes it's the same as a single tempo
+    settings << TempoMap()
+    assert settings._tempo_map is None
+    assert clip.getPlaylist() == constant_playlist
+    settings << None
+
+# test_tempo_map()
+
+
+def test_pitch_lookup_tables():
+
+    # Tables give the same keys as stepping through the scale
+    major_scale: tuple = Scale._scales[1]
+    assert Scale.transpose_table(major_scale) == ((2, 4, 5, 7, 9, 11, 12), (-1, -3, -5, -7, -8, -10, -12))
+    assert Scale.transpose_key(0, major_scale) == 0
+    assert Scale.transpose_key(4, major_scale) == 7
+    assert Scale.transpose_key(9, major_scale) == 16
+    assert Scale.transpose_key(-1, major_scale) == -1
+    assert Scale.transpose_key(-8, major_scale) == -13
+    assert Scale.transpose_key(2, [1, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0]) == 5
+    assert Scale.modulate_key(2, 2, major_scale) == 3   # D to F
+    assert Scale.transpose_table([0] * 12) is None
+    # Only the known scales are looked up, the same scales as lists are stepped through
+    for known_scale in Scale._scales:
+        for steps in range(-16, 17):
+            assert Scale.transpose_key(steps, known_scale) == Scale.transpose_key(steps, list(known_scale))
+            for tonic_offset in range(-1, 13):
+                assert Scale.modulate_key(tonic_offset, steps, known_scale) \
+                    == Scale.modulate_key(tonic_offset, steps, list(known_scale))
+
+    # The absolute pitch is cached and follows any mutation
+    pitch = Pitch()
+    assert pitch.get_absolute_pitch() == 60
+    assert pitch._absolute_pitch_cache is None  # Nothing to step through
+    pitch << Degree(5)
+    assert pitch.get_absolute_pitch() == 67
+    assert pitch._absolute_pitch_cache is not None
+    pitch << Pipe(pitch % KeySignature() << Minor())  # Replaces the shared key signature
+    assert pitch.get_absolute_pitch() == 67
+    pitch << Scale("minor") << Transposition(2)
+    assert pitch.get_absolute_pitch() == 70
+    pitch._scale[3] = 0     # In place mutation of the scale, now with a major third
+    pitch._scale[4] = 1
+    assert pitch.get_absolute_pitch() == 71
+
+    # The cache isn't part of the state
+    note = Note(Degree(3))
+    note_state = Operand.state_key(note)
+    note._pitch.get_absolute_pitch()
+    assert Operand.state_key(note) == note_state
+
+# test_pitch_lookup_tables()
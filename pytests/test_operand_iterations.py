@@ -45,3 +45,40 @@ def test_cycle_setter():
 
 # test_cycle_setter()
 
+
+
+def test_parallel_iterations():
+    eight_notes = Note(1/8) * 8 >> Stack()
+    serial_shuffle = eight_notes >> I_ShuffleLocus(no_repetitions=True)
+    serial_shuffle.iterate_parallel(6, workers=1)
+    parallel_shuffle = eight_notes >> I_ShuffleLocus(no_repetitions=True)
+    parallel_shuffle.iterate_parallel(6, workers=2)
+    assert serial_shuffle.len() == parallel_shuffle.len() == 6
+    for iteration in range(6):
+        assert serial_shuffle._iterations[iteration] == parallel_shuffle._iterations[iteration]
+        assert serial_shuffle._iterations[iteration]._index == iteration
+    # Spawned Chaos streams are repeatable but distinct
+    assert SinX().spawn(3) == SinX().spawn(3)
+    assert SinX().spawn(3) != SinX().spawn(4)
+
+    frozen_shuffle = eight_notes >> I_ShuffleLocus(freeze_at=3)
+    frozen_shuffle.iterate_parallel(6, workers=2)
+    assert frozen_shuffle.len() == 4
+
+# test_parallel_iterations()
+
+
+def test_parallel_iterations_fallback(caplog):
+    eight_notes = Note(1/8) * 8 >> Stack()
+    parallel_shuffle = eight_notes >> I_ShuffleLocus(no_repetitions=True)
+    parallel_shuffle.iterate_parallel(6, workers=2)
+    # Lambdas can't be pickled, so, the same iterations are processed serially with a warning
+    lambda_shuffle = eight_notes >> I_ShuffleLocus(no_repetitions=True, post_process=lambda clip: clip)
+    with caplog.at_level("WARNING"):
+        lambda_shuffle.iterate_parallel(6, workers=2)
+    assert "processing them serially" in caplog.text
+    assert lambda_shuffle.len() == 6
+    for iteration in range(6):
+        assert lambda_shuffle._iterations[iteration] == parallel_shuffle._iterations[iteration]
+
+# test_parallel_iterations_fallback()